@@ -1,5 +1,5 @@
 from openai import OpenAI
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 import logging
 
 # A default logger if no specific logger is provided
@@ -58,6 +58,43 @@ class LLMClient:
             self.logger.error(f"LLM call failed: {e}")
             return f"Error: {str(e)}"
     
+    def stream_text_llm(
+        self, 
+        prompt: str, 
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Make a text-only LLM call, yielding the response text as it is generated.
+        
+        A failed call is logged and re-raised rather than yielded as text, since
+        part of the response may already have been passed on.
+        """
+        if model is None:
+            model = self.text_model
+            
+        messages = [{"role": "user", "content": prompt}]
+        
+        completion_params = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "stream": True
+        }
+        
+        if max_tokens is not None:
+            completion_params["max_tokens"] = max_tokens
+        
+        try:
+            self.logger.debug(f"Streaming LLM Call Request:\nModel: {model}\nPrompt: {prompt[:500]}...")
+            for chunk in self.client.chat.completions.create(**completion_params):
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            self.logger.error(f"Streaming LLM call failed: {e}")
+            raise
+    
     def call_vision_llm(
         self, 
         text_prompt: str, 
@@ -25,7 +25,7 @@ import os
 import sys
 import json
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import re
@@ -49,6 +49,10 @@ load_dotenv()
 # Configure logging
 logger = setup_logging('OrchestratorAgent')
 
+# End of a sentence in streamed LLM output: punctuation followed by whitespace
+# (a bare "." may still be part of a number or abbreviation)
+_SENTENCE_END_RE = re.compile(r'[.!?;:]\s+')
+
 class OrchestratorAgent:
     """
     Master Orchestrator Agent - The boss of all agents
@@ -77,7 +81,8 @@ class OrchestratorAgent:
         
         logger.info("✅ All agents and processors initialized successfully")
     
-    def process_farmer_request(self, raw_farmer_input: str, farmer_phone: str = None) -> str:
+    def process_farmer_request(self, raw_farmer_input: str, farmer_phone: str = None,
+                               on_sentence: Optional[Callable[[str], None]] = None) -> str:
         """
         Main entry point for processing farmer requests from IVR system.
         
@@ -91,6 +96,8 @@ class OrchestratorAgent:
         Args:
             raw_farmer_input (str): Raw farmer input from IVR
             farmer_phone (str): Farmer's phone number for profile lookup
+            on_sentence (Callable[[str], None], optional): Called with each complete
+                sentence of the plain English response while it is being generated
             
         Returns:
             str: Comprehensive orchestrated response in plain English.
@@ -127,7 +134,7 @@ class OrchestratorAgent:
             logger.info(f"✅ Successfully processed farmer request via {pipeline_decision['pipeline_type']} pipeline")
             
             # Step 6: Convert final JSON response to plain English
-            english_response = self._convert_json_to_english(response, farmer_query, farmer_profile)
+            english_response = self._convert_json_to_english(response, farmer_query, farmer_profile, on_sentence)
             logger.info("✅ Converted final response to plain English for the farmer.")
             return english_response
             
@@ -136,7 +143,8 @@ class OrchestratorAgent:
             error_message = f"Sorry, we encountered an error while processing your request. Please try again later. Error: {str(e)}"
             return error_message
     
-    def _convert_json_to_english(self, response_data: Dict[str, Any], farmer_query: str, farmer_profile: Dict[str, Any]) -> str:
+    def _convert_json_to_english(self, response_data: Dict[str, Any], farmer_query: str, farmer_profile: Dict[str, Any],
+                                 on_sentence: Optional[Callable[[str], None]] = None) -> str:
         """
         Converts the final JSON response to a farmer-friendly plain English response.
         
@@ -144,6 +152,9 @@ class OrchestratorAgent:
             response_data (Dict[str, Any]): The final response data from the orchestrator.
             farmer_query (str): The original farmer query.
             farmer_profile (Dict[str, Any]): The farmer's profile.
+            on_sentence (Callable[[str], None], optional): If given, the response is
+                streamed from the LLM and each complete sentence is passed here as soon
+                as it arrives.
             
         Returns:
             str: A plain English response for the farmer.
@@ -179,7 +190,10 @@ class OrchestratorAgent:
             Start the response with a greeting to the farmer.
             """
             
-            english_response = self.llm_client.call_text_llm(prompt, temperature=0.5, max_tokens=2000)
+            if on_sentence is None:
+                english_response = self.llm_client.call_text_llm(prompt, temperature=0.5, max_tokens=2000)
+            else:
+                english_response = self._stream_sentences(prompt, on_sentence)
             
             logger.info("✅ Successfully converted JSON to English response.")
             return english_response.strip()
@@ -193,6 +207,35 @@ class OrchestratorAgent:
                 return f"We have prepared a detailed strategy for you. Please contact our support for more details. Strategy includes: {list(response_data['comprehensive_strategy'].keys())}"
             return "We have processed your request and have some recommendations. Please contact our support for detailed advice."
 
+    def _stream_sentences(self, prompt: str, on_sentence: Callable[[str], None]) -> str:
+        """
+        Stream an LLM response, passing each complete sentence on as it arrives.
+        
+        Sentences are passed with their trailing whitespace, so together they are
+        exactly the returned text.
+        
+        Args:
+            prompt (str): Prompt for the LLM
+            on_sentence (Callable[[str], None]): Receives each sentence in order
+            
+        Returns:
+            str: The full response text.
+        """
+        parts = []
+        pending = ""
+        for delta in self.llm_client.stream_text_llm(prompt, temperature=0.5, max_tokens=2000):
+            parts.append(delta)
+            pending += delta
+            end = 0
+            for match in _SENTENCE_END_RE.finditer(pending):
+                end = match.end()
+            if end:
+                on_sentence(pending[:end])
+                pending = pending[end:]
+        if pending:
+            on_sentence(pending)
+        return "".join(parts)
+    
     def _process_farmer_input(self, raw_input: str, phone: str = None) -> Dict[str, Any]:
         """
         Process farmer input and ensure it's stored in database.
@@ -19,22 +19,105 @@ import os
 import json
 import logging
 import re
+from dataclasses import dataclass
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 import requests_cache
 from retry_requests import retry
 import openmeteo_requests
-import pandas as pd
 import numpy as np
 from geopy.geocoders import Nominatim
 
 # Import LLM client
 from llm_client import LLMClient
 from logging_config import setup_logging
+from weather_aggregation import stack_hourly_variables, day_boundaries, daily_reduce
 
 # Configure logging
 logger = setup_logging('WeatherAgent')
 
+# Coordinates are quantized to ~100m so nearby farmers share API calls and cache entries
+_COORDINATE_DECIMALS = 3
+
+# Hourly Open-Meteo variables requested by the agent (order defines response indices)
+_HOURLY_VARIABLES: Tuple[str, ...] = (
+    "temperature_2m", "relative_humidity_2m", "apparent_temperature",
+    "rain", "showers", "surface_pressure", "cloud_cover",
+    "vapour_pressure_deficit", "wind_direction_80m",
+    "wind_gusts_10m", "wind_speed_120m", "soil_moisture_3_to_9cm"
+)
+
+# Seasonal recommendation emitted when its keyword appears in the LLM analysis:
+# keyword -> (category, recommendation, priority)
+_SEASONAL_KEYWORDS: Mapping[str, Tuple[str, str, str]] = MappingProxyType({
+    "irrigation": ("irrigation", "Monitor soil moisture and adjust irrigation based on weather forecast", "high"),
+    "sowing": ("sowing", "Plan sowing activities based on weather windows", "high")
+})
+_SEASONAL_KEYWORD_PATTERN = re.compile("|".join(map(re.escape, _SEASONAL_KEYWORDS)), re.IGNORECASE)
+
+# Key activities per farming stage (generic pipeline stage guidance)
+_STAGE_ACTIVITIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "sowing": (
+        "Prepare seedbed",
+        "Check seed quality",
+        "Plan irrigation schedule",
+        "Apply basal fertilizers",
+        "Monitor weather for optimal sowing window"
+    ),
+    "growing": (
+        "Monitor crop growth",
+        "Manage irrigation",
+        "Apply fertilizers as needed",
+        "Scout for pests and diseases",
+        "Weed management"
+    ),
+    "harvest": (
+        "Monitor crop maturity",
+        "Plan harvest timing",
+        "Arrange transportation",
+        "Check market prices",
+        "Prepare storage facilities"
+    )
+})
+
+# Weather considerations per farming stage
+_WEATHER_CONSIDERATIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "sowing": (
+        "Avoid sowing before heavy rains",
+        "Ensure adequate soil moisture",
+        "Check for favorable temperature conditions"
+    ),
+    "growing": (
+        "Monitor rainfall for irrigation planning",
+        "Watch for pest-favorable weather conditions",
+        "Protect crops from extreme weather"
+    ),
+    "harvest": (
+        "Ensure dry weather for harvest",
+        "Avoid harvest during rains",
+        "Plan around storm predictions"
+    )
+})
+
+@dataclass(slots=True, frozen=True)
+class WeatherSummary:
+    """Typed view of the forecast summary used by the alert/risk helpers."""
+    period_days: int = 0
+    temp_avg: float = 0.0
+    temp_max: float = 0.0
+    temp_min: float = 0.0
+    total_rainfall: float = 0.0
+    rainy_days: int = 0
+    avg_wind_speed: float = 0.0
+    max_wind_gust: float = 0.0
+    
+    @classmethod
+    def from_dict(cls, summary: Dict[str, Any]) -> "WeatherSummary":
+        """Build from the dict produced by _generate_weather_summary."""
+        return cls(**{k: v for k, v in summary.items() if k in cls.__slots__})
+
+
 class WeatherAgent:
     """
     Comprehensive Weather Agent for agricultural decision-making.
@@ -48,8 +131,18 @@ class WeatherAgent:
         self.llm_client = LLMClient(logger=logger)
         self.agent_type = "weather"
         
-        # Setup weather API client with caching and retry
-        cache_session = requests_cache.CachedSession('.weather_cache', expire_after=3600)
+        # Setup weather API client with caching and retry. The SQLite cache lives in the
+        # user cache dir so it is shared across processes, and stale entries are served
+        # if Open-Meteo is briefly unavailable.
+        cache_session = requests_cache.CachedSession(
+            'capone_weather',
+            backend='sqlite',
+            use_cache_dir=True,
+            expire_after=3600,
+            stale_if_error=True,
+            allowable_methods=('GET', 'POST'),
+            match_headers=False
+        )
         retry_session = retry(cache_session, retries=5, backoff_factor=0.2)
         self.openmeteo = openmeteo_requests.Client(session=retry_session)
         
@@ -95,21 +188,107 @@ class WeatherAgent:
             Dict[str, Any]: Comprehensive weather guidance response
         """
         logger.info(f"Processing {pipeline_type} weather query: {query[:100]}...")
+        today = datetime.now()
         
         try:
             if pipeline_type == "specific":
                 return self._process_specific_query(query, farmer_profile)
             else:
-                return self._process_generic_query(query, farmer_profile)
+                return self._process_generic_query(query, farmer_profile, today)
                 
         except Exception as e:
             logger.error(f"Weather query processing failed: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "agent": "weather",
-                "fallback_advice": "Please check local weather reports and consult with local agricultural extension officers for weather-based farming decisions."
-            }
+            return self._error_response(e)
+    
+    def process_queries(self, queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process several weather queries, fetching all forecasts in batched API calls.
+        
+        Forecast requests from every query are collected first and coalesced into one
+        Open-Meteo call per date range (multiple coordinates per call), then each
+        query's analysis is generated from the demultiplexed results.
+        
+        Args:
+            queries (List[Dict[str, Any]]): Items with "query", optional "farmer_profile"
+                                            and optional "pipeline_type" ("specific"/"generic")
+            
+        Returns:
+            List[Dict[str, Any]]: One weather guidance response per query, in input order
+        """
+        logger.info(f"Processing batch of {len(queries)} weather queries")
+        today = datetime.now()
+        
+        # Step 1: Plan each query and collect the forecasts it needs
+        plans = []
+        fetch_requests = []
+        for item in queries:
+            query = item["query"]
+            farmer_profile = item.get("farmer_profile")
+            pipeline_type = item.get("pipeline_type", "specific")
+            try:
+                if pipeline_type == "specific":
+                    params = self._extract_weather_parameters(query, farmer_profile)
+                    periods = {"forecast": (params["location"], params["start_date"], params["end_date"])}
+                    plan = {"params": params}
+                else:
+                    seasonal_context = self._determine_seasonal_context(farmer_profile, today)
+                    date_ranges = self._generate_seasonal_date_ranges(seasonal_context, today)
+                    location = farmer_profile.get("pincode", "110001")
+                    periods = {
+                        period: (location, dates["start"], dates["end"])
+                        for period, dates in date_ranges.items()
+                    }
+                    plan = {"seasonal_context": seasonal_context, "date_ranges": date_ranges}
+                
+                plan.update(query=query, farmer_profile=farmer_profile,
+                            pipeline_type=pipeline_type, slots={})
+                for period, request in periods.items():
+                    plan["slots"][period] = len(fetch_requests)
+                    fetch_requests.append(request)
+                plans.append(plan)
+            except Exception as e:
+                logger.error(f"Weather query planning failed: {e}")
+                plans.append({"error": e})
+        
+        # Step 2: Fetch all forecasts in as few API calls as possible
+        fetched = self._fetch_weather_batch(fetch_requests)
+        
+        # Step 3: Generate analysis per query from the shared results
+        results = []
+        for plan in plans:
+            if "error" in plan:
+                results.append(self._error_response(plan["error"]))
+                continue
+            try:
+                weather_data = {}
+                for period, slot in plan["slots"].items():
+                    if isinstance(fetched[slot], Exception):
+                        raise fetched[slot]
+                    weather_data[period] = fetched[slot]
+                
+                if plan["pipeline_type"] == "specific":
+                    results.append(self._build_specific_response(
+                        plan["query"], plan["farmer_profile"], plan["params"], weather_data["forecast"]
+                    ))
+                else:
+                    results.append(self._build_generic_response(
+                        plan["query"], plan["farmer_profile"], plan["seasonal_context"],
+                        plan["date_ranges"], weather_data, today
+                    ))
+            except Exception as e:
+                logger.error(f"Weather query processing failed: {e}")
+                results.append(self._error_response(e))
+        
+        return results
+    
+    def _error_response(self, error: Exception) -> Dict[str, Any]:
+        """Build the standard failure response for a weather query."""
+        return {
+            "success": False,
+            "error": str(error),
+            "agent": "weather",
+            "fallback_advice": "Please check local weather reports and consult with local agricultural extension officers for weather-based farming decisions."
+        }
     
     def _process_specific_query(self, query: str, farmer_profile: Dict[str, Any]) -> Dict[str, Any]:
         """Process specific pipeline weather queries."""
@@ -126,6 +305,11 @@ class WeatherAgent:
         )
         
         # Step 3: Generate agricultural weather analysis
+        return self._build_specific_response(query, farmer_profile, params, weather_data)
+    
+    def _build_specific_response(self, query: str, farmer_profile: Dict[str, Any],
+                                 params: Dict[str, Any], weather_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate analysis and assemble the specific pipeline response."""
         analysis = self._generate_weather_analysis(
             query, weather_data, params, farmer_profile
         )
@@ -142,15 +326,16 @@ class WeatherAgent:
             "alerts": analysis.get("alerts", [])
         }
     
-    def _process_generic_query(self, query: str, farmer_profile: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_generic_query(self, query: str, farmer_profile: Dict[str, Any],
+                               today: datetime) -> Dict[str, Any]:
         """Process generic pipeline weather queries with seasonal context."""
         logger.info("Processing generic weather pipeline query")
         
         # Step 1: Determine current season and farming stage
-        seasonal_context = self._determine_seasonal_context(farmer_profile)
+        seasonal_context = self._determine_seasonal_context(farmer_profile, today)
         
         # Step 2: Generate appropriate date ranges based on farming season
-        date_ranges = self._generate_seasonal_date_ranges(seasonal_context)
+        date_ranges = self._generate_seasonal_date_ranges(seasonal_context, today)
         
         # Step 3: Get weather data for relevant periods
         weather_data = {}
@@ -162,8 +347,16 @@ class WeatherAgent:
             )
         
         # Step 4: Generate comprehensive seasonal weather guidance
+        return self._build_generic_response(
+            query, farmer_profile, seasonal_context, date_ranges, weather_data, today
+        )
+    
+    def _build_generic_response(self, query: str, farmer_profile: Dict[str, Any],
+                                seasonal_context: Dict[str, Any], date_ranges: Dict[str, Dict[str, str]],
+                                weather_data: Dict[str, Any], today: datetime) -> Dict[str, Any]:
+        """Generate seasonal analysis and assemble the generic pipeline response."""
         analysis = self._generate_seasonal_analysis(
-            query, weather_data, seasonal_context, farmer_profile
+            query, weather_data, seasonal_context, farmer_profile, today
         )
         
         return {
@@ -302,93 +495,127 @@ Return ONLY the JSON, no other text.
     
     def _fetch_weather_data(self, location: str, start_date: str, end_date: str) -> Dict[str, Any]:
         """Fetch weather data from Open-Meteo API."""
-        try:
-            # Get coordinates from location
-            latitude, longitude = self._get_coordinates(location)
-            
-            # Setup API parameters
-            url = "https://api.open-meteo.com/v1/forecast"
-            params = {
-                "latitude": latitude,
-                "longitude": longitude,
-                "hourly": [
-                    "temperature_2m", "relative_humidity_2m", "apparent_temperature", 
-                    "rain", "showers", "surface_pressure", "cloud_cover", 
-                    "vapour_pressure_deficit", "wind_direction_80m", 
-                    "wind_gusts_10m", "wind_speed_120m", "soil_moisture_3_to_9cm"
-                ],
-                "start_date": start_date,
-                "end_date": end_date,
-            }
-            
-            # Fetch data
-            responses = self.openmeteo.weather_api(url, params=params)
-            response = responses[0]
+        result = self._fetch_weather_batch([(location, start_date, end_date)])[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    def _fetch_weather_batch(self, fetch_requests: List[Tuple[str, str, str]]) -> List[Any]:
+        """
+        Fetch weather data for several (location, start_date, end_date) requests.
+        
+        Requests sharing a date range are sent as a single Open-Meteo call with lists
+        of coordinates; identical grid points (3-decimal coordinates, ~100m) are fetched once.
+        
+        Returns:
+            List[Any]: Weather data dict per request, or the Exception that request raised
+        """
+        results: List[Any] = [None] * len(fetch_requests)
+        coordinates: Dict[str, Tuple[float, float]] = {}
+        groups: Dict[Tuple[str, str], Dict[Tuple[float, float], List[int]]] = {}
+        
+        # Geocode once per location and group requests by date range and grid point
+        for idx, (location, start_date, end_date) in enumerate(fetch_requests):
+            if location not in coordinates:
+                coordinates[location] = self._get_coordinates(location)
+            latitude, longitude = coordinates[location]
+            grid_point = (round(latitude, _COORDINATE_DECIMALS), round(longitude, _COORDINATE_DECIMALS))
+            groups.setdefault((start_date, end_date), {}).setdefault(grid_point, []).append(idx)
+        
+        for (start_date, end_date), points in groups.items():
+            grid_points = list(points)
+            try:
+                responses = self._request_weather(grid_points, start_date, end_date)
+            except Exception as e:
+                logger.error(f"Weather data fetch failed: {e}")
+                for indices in points.values():
+                    for idx in indices:
+                        results[idx] = e
+                continue
             
-            # Process hourly data
-            hourly = response.Hourly()
-            hourly_data = {
-                "date": pd.date_range(
-                    start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-                    end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
-                    freq=pd.Timedelta(seconds=hourly.Interval()),
-                    inclusive="left"
+            # Grid points left without a response (short reply) get an error, not None
+            if len(responses) < len(grid_points):
+                missing = ValueError(
+                    f"Open-Meteo returned {len(responses)} responses for {len(grid_points)} locations"
                 )
-            }
-            
-            # Extract variables
-            variables = [
-                "temperature_2m", "relative_humidity_2m", "apparent_temperature", 
-                "rain", "showers", "surface_pressure", "cloud_cover",
-                "vapour_pressure_deficit", "wind_direction_80m", 
-                "wind_gusts_10m", "wind_speed_120m", "soil_moisture_3_to_9cm"
-            ]
-            
-            for i, var in enumerate(variables):
-                hourly_data[var] = hourly.Variables(i).ValuesAsNumpy()
+                logger.error(f"Weather data fetch failed: {missing}")
+                for grid_point in grid_points[len(responses):]:
+                    for idx in points[grid_point]:
+                        results[idx] = missing
             
-            # Create DataFrame and aggregate to daily
-            hourly_df = pd.DataFrame(data=hourly_data)
-            hourly_df.set_index("date", inplace=True)
-            
-            # Generate daily aggregations
-            daily_df = pd.DataFrame({
-                "temp_mean": hourly_df["temperature_2m"].resample("D").mean(),
-                "temp_max": hourly_df["temperature_2m"].resample("D").max(),
-                "temp_min": hourly_df["temperature_2m"].resample("D").min(),
-                "humidity_mean": hourly_df["relative_humidity_2m"].resample("D").mean(),
-                "rain_sum": hourly_df["rain"].resample("D").sum(),
-                "wind_speed_mean": hourly_df["wind_speed_120m"].resample("D").mean(),
-                "wind_gusts_max": hourly_df["wind_gusts_10m"].resample("D").max(),
-                "soil_moisture_mean": hourly_df["soil_moisture_3_to_9cm"].resample("D").mean()
+            # Demultiplex responses (returned in request order) back to callers
+            for grid_point, response in zip(grid_points, responses):
+                for idx in points[grid_point]:
+                    location = fetch_requests[idx][0]
+                    latitude, longitude = coordinates[location]
+                    try:
+                        results[idx] = self._build_weather_data(
+                            response, location, latitude, longitude, start_date, end_date
+                        )
+                    except Exception as e:
+                        logger.error(f"Weather data fetch failed: {e}")
+                        results[idx] = e
+        
+        return results
+    
+    def _request_weather(self, grid_points: List[Tuple[float, float]],
+                         start_date: str, end_date: str) -> List[Any]:
+        """Issue one Open-Meteo forecast call covering all given coordinates."""
+        url = "https://api.open-meteo.com/v1/forecast"
+        params = {
+            "latitude": [lat for lat, _ in grid_points],
+            "longitude": [lon for _, lon in grid_points],
+            "hourly": list(_HOURLY_VARIABLES),
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        
+        return self.openmeteo.weather_api(url, params=params)
+    
+    def _build_weather_data(self, response: Any, location: str, latitude: float, longitude: float,
+                            start_date: str, end_date: str) -> Dict[str, Any]:
+        """Aggregate one Open-Meteo response into daily data and summary."""
+        # Process hourly data as one (n_vars, n_hours) buffer
+        hourly = response.Hourly()
+        
+        col = {var: i for i, var in enumerate(_HOURLY_VARIABLES)}
+        values = stack_hourly_variables(hourly, len(_HOURLY_VARIABLES))
+        
+        # Generate daily aggregations (all variables per reduction in one pass)
+        day_ids, day_starts = day_boundaries(hourly.Time(), hourly.TimeEnd(), hourly.Interval())
+        daily = daily_reduce(values, day_starts)
+        mean, vmax, vmin, vsum = daily["mean"], daily["max"], daily["min"], daily["sum"]
+        dates = np.datetime_as_string(day_ids.astype("datetime64[D]"))
+        
+        temp = col["temperature_2m"]
+        humidity = col["relative_humidity_2m"]
+        rain = col["rain"]
+        wind = col["wind_speed_120m"]
+        gusts = col["wind_gusts_10m"]
+        soil = col["soil_moisture_3_to_9cm"]
+        
+        # Convert to JSON-serializable format
+        daily_data = []
+        for d, date_str in enumerate(dates):
+            daily_data.append({
+                "date": str(date_str),
+                "temp_mean": round(float(mean[temp, d]), 1),
+                "temp_max": round(float(vmax[temp, d]), 1),
+                "temp_min": round(float(vmin[temp, d]), 1),
+                "humidity_mean": round(float(mean[humidity, d]), 1),
+                "rain_sum": round(float(vsum[rain, d]), 1),
+                "wind_speed_mean": round(float(mean[wind, d]), 1),
+                "wind_gusts_max": round(float(vmax[gusts, d]), 1),
+                "soil_moisture_mean": round(float(mean[soil, d]), 3)
             })
-            
-            # Convert to JSON-serializable format
-            daily_data = []
-            for date_idx, row in daily_df.iterrows():
-                daily_data.append({
-                    "date": date_idx.strftime('%Y-%m-%d'),
-                    "temp_mean": round(float(row["temp_mean"]), 1),
-                    "temp_max": round(float(row["temp_max"]), 1),
-                    "temp_min": round(float(row["temp_min"]), 1),
-                    "humidity_mean": round(float(row["humidity_mean"]), 1),
-                    "rain_sum": round(float(row["rain_sum"]), 1),
-                    "wind_speed_mean": round(float(row["wind_speed_mean"]), 1),
-                    "wind_gusts_max": round(float(row["wind_gusts_max"]), 1),
-                    "soil_moisture_mean": round(float(row["soil_moisture_mean"]), 3)
-                })
-            
-            return {
-                "location": location,
-                "coordinates": {"latitude": latitude, "longitude": longitude},
-                "period": {"start": start_date, "end": end_date},
-                "daily_data": daily_data,
-                "summary": self._generate_weather_summary(daily_data)
-            }
-            
-        except Exception as e:
-            logger.error(f"Weather data fetch failed: {e}")
-            raise
+        
+        return {
+            "location": location,
+            "coordinates": {"latitude": latitude, "longitude": longitude},
+            "period": {"start": start_date, "end": end_date},
+            "daily_data": daily_data,
+            "summary": self._generate_weather_summary(daily_data)
+        }
     
     def _get_coordinates(self, location: str) -> Tuple[float, float]:
         """Get coordinates from location string (pincode or place name)."""
@@ -434,7 +661,7 @@ Return ONLY the JSON, no other text.
         """Generate comprehensive agricultural weather analysis using LLM."""
         
         # Build context for LLM
-        weather_summary = weather_data.get("summary", {})
+        weather_summary = WeatherSummary.from_dict(weather_data.get("summary", {}))
         daily_forecast = weather_data.get("daily_data", [])[:7]  # Next 7 days
         
         crop_context = ""
@@ -452,10 +679,10 @@ PERIOD: {params.get("start_date")} to {params.get("end_date")}
 {crop_context}
 
 WEATHER FORECAST SUMMARY:
-- Period: {weather_summary.get("period_days", 0)} days
-- Temperature: {weather_summary.get("temp_min", 0)}°C to {weather_summary.get("temp_max", 0)}°C (avg: {weather_summary.get("temp_avg", 0)}°C)
-- Total Rainfall: {weather_summary.get("total_rainfall", 0)}mm over {weather_summary.get("rainy_days", 0)} days
-- Wind Speed: {weather_summary.get("avg_wind_speed", 0)}km/h (max gusts: {weather_summary.get("max_wind_gust", 0)}km/h)
+- Period: {weather_summary.period_days} days
+- Temperature: {weather_summary.temp_min}°C to {weather_summary.temp_max}°C (avg: {weather_summary.temp_avg}°C)
+- Total Rainfall: {weather_summary.total_rainfall}mm over {weather_summary.rainy_days} days
+- Wind Speed: {weather_summary.avg_wind_speed}km/h (max gusts: {weather_summary.max_wind_gust}km/h)
 
 DETAILED DAILY FORECAST:
 {json.dumps(daily_forecast, indent=2)}
@@ -509,9 +736,9 @@ Provide specific dates and times where applicable.
                 "error": str(e)
             }
     
-    def _determine_seasonal_context(self, farmer_profile: Dict[str, Any]) -> Dict[str, Any]:
+    def _determine_seasonal_context(self, farmer_profile: Dict[str, Any], today: datetime) -> Dict[str, Any]:
         """Determine current farming season and stage."""
-        current_month = datetime.now().month
+        current_month = today.month
         
         # Determine current season
         current_season = None
@@ -532,9 +759,11 @@ Provide specific dates and times where applicable.
         season_info = self.farming_seasons[current_season]
         stage = "growing"  # Default
         
-        if season_info["sowing_period"]["start"] <= current_month <= season_info["sowing_period"]["end"]:
+        sowing = season_info["sowing_period"]
+        harvest = season_info["harvest_period"]
+        if sowing["start"] <= current_month <= sowing["end"]:
             stage = "sowing"
-        elif season_info["harvest_period"]["start"] <= current_month <= season_info["harvest_period"]["end"]:
+        elif harvest["start"] <= current_month <= harvest["end"]:
             stage = "harvest"
         
         return {
@@ -544,9 +773,10 @@ Provide specific dates and times where applicable.
             "current_month": current_month
         }
     
-    def _generate_seasonal_date_ranges(self, seasonal_context: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+    def _generate_seasonal_date_ranges(self, seasonal_context: Dict[str, Any],
+                                       today: datetime) -> Dict[str, Dict[str, str]]:
         """Generate appropriate date ranges for seasonal weather analysis."""
-        current_date = datetime.now().date()
+        current_date = today.date()
         
         # Base ranges on farming stage
         if seasonal_context["farming_stage"] == "sowing":
@@ -587,7 +817,8 @@ Provide specific dates and times where applicable.
             }
     
     def _generate_seasonal_analysis(self, query: str, weather_data: Dict[str, Any], 
-                                  seasonal_context: Dict[str, Any], farmer_profile: Dict[str, Any]) -> Dict[str, Any]:
+                                  seasonal_context: Dict[str, Any], farmer_profile: Dict[str, Any],
+                                  today: datetime) -> Dict[str, Any]:
         """Generate comprehensive seasonal weather analysis."""
         
         current_season = seasonal_context["current_season"]
@@ -641,7 +872,7 @@ Provide a comprehensive seasonal weather guidance that helps the farmer make inf
             analysis_response = self.llm_client.call_text_llm(prompt, temperature=0.3)
             
             # Generate seasonal calendar
-            seasonal_calendar = self._generate_seasonal_calendar(seasonal_context, all_weather_data)
+            seasonal_calendar = self._generate_seasonal_calendar(seasonal_context, all_weather_data, today)
             
             return {
                 "detailed_analysis": analysis_response,
@@ -688,20 +919,22 @@ Provide a comprehensive seasonal weather guidance that helps the farmer make inf
         
         return recommendations[:10]  # Limit to top 10 recommendations
     
-    def _extract_weather_alerts(self, weather_summary: Dict, daily_forecast: List[Dict]) -> List[Dict[str, Any]]:
+    def _extract_weather_alerts(self, weather_summary: WeatherSummary, daily_forecast: List[Dict]) -> List[Dict[str, Any]]:
         """Extract weather alerts and warnings."""
         alerts = []
+        temp_max = weather_summary.temp_max
+        total_rain = weather_summary.total_rainfall
+        max_wind = weather_summary.max_wind_gust
         
         # Temperature alerts
-        if weather_summary.get("temp_max", 0) > 40:
+        if temp_max > 40:
             alerts.append({
                 "type": "heat_wave",
                 "severity": "high",
-                "message": f"Heat wave warning: Temperature may reach {weather_summary['temp_max']}°C. Increase irrigation and provide shade to crops."
+                "message": f"Heat wave warning: Temperature may reach {temp_max}°C. Increase irrigation and provide shade to crops."
             })
         
         # Rainfall alerts
-        total_rain = weather_summary.get("total_rainfall", 0)
         if total_rain > 50:
             alerts.append({
                 "type": "heavy_rain",
@@ -716,7 +949,6 @@ Provide a comprehensive seasonal weather guidance that helps the farmer make inf
             })
         
         # Wind alerts
-        max_wind = weather_summary.get("max_wind_gust", 0)
         if max_wind > 50:
             alerts.append({
                 "type": "strong_winds",
@@ -726,10 +958,10 @@ Provide a comprehensive seasonal weather guidance that helps the farmer make inf
         
         return alerts
     
-    def _assess_irrigation_needs(self, weather_summary: Dict, daily_forecast: List[Dict]) -> Dict[str, Any]:
+    def _assess_irrigation_needs(self, weather_summary: WeatherSummary, daily_forecast: List[Dict]) -> Dict[str, Any]:
         """Assess irrigation needs based on weather forecast."""
-        total_rain = weather_summary.get("total_rainfall", 0)
-        avg_temp = weather_summary.get("temp_avg", 25)
+        total_rain = weather_summary.total_rainfall
+        avg_temp = weather_summary.temp_avg if weather_summary.period_days else 25
         
         if total_rain > 25:
             irrigation_need = "low"
@@ -750,37 +982,43 @@ Provide a comprehensive seasonal weather guidance that helps the farmer make inf
     
     def _identify_field_work_windows(self, daily_forecast: List[Dict]) -> List[Dict[str, Any]]:
         """Identify optimal windows for field operations."""
-        work_windows = []
+        if not daily_forecast:
+            return []
         
-        for i, day in enumerate(daily_forecast):
-            if day.get("rain_sum", 0) < 1 and day.get("wind_speed_mean", 0) < 15:
-                work_windows.append({
-                    "date": day.get("date"),
-                    "activities": ["spraying", "mechanical_operations", "harvesting"],
-                    "conditions": "favorable",
-                    "rain_risk": "low"
-                })
+        count = len(daily_forecast)
+        rain = np.fromiter((day.get("rain_sum", 0) for day in daily_forecast), float, count)
+        wind = np.fromiter((day.get("wind_speed_mean", 0) for day in daily_forecast), float, count)
+        favorable = np.flatnonzero((rain < 1) & (wind < 15))[:5]  # Next 5 favorable days
         
-        return work_windows[:5]  # Next 5 favorable days
+        return [
+            {
+                "date": daily_forecast[i].get("date"),
+                "activities": ["spraying", "mechanical_operations", "harvesting"],
+                "conditions": "favorable",
+                "rain_risk": "low"
+            }
+            for i in favorable
+        ]
     
-    def _assess_weather_risks(self, weather_summary: Dict, daily_forecast: List[Dict]) -> Dict[str, Any]:
+    def _assess_weather_risks(self, weather_summary: WeatherSummary, daily_forecast: List[Dict]) -> Dict[str, Any]:
         """Assess weather-related agricultural risks."""
         risks = []
+        total_rain = weather_summary.total_rainfall
         
         # Heat stress risk
-        if weather_summary.get("temp_max", 0) > 38:
+        if weather_summary.temp_max > 38:
             risks.append("heat_stress")
         
         # Drought risk
-        if weather_summary.get("total_rainfall", 0) < 5:
+        if total_rain < 5:
             risks.append("drought_stress")
         
         # Waterlogging risk
-        if weather_summary.get("total_rainfall", 0) > 75:
+        if total_rain > 75:
             risks.append("waterlogging")
         
         # Wind damage risk
-        if weather_summary.get("max_wind_gust", 0) > 45:
+        if weather_summary.max_wind_gust > 45:
             risks.append("wind_damage")
         
         return {
@@ -792,86 +1030,42 @@ Provide a comprehensive seasonal weather guidance that helps the farmer make inf
     def _extract_seasonal_recommendations(self, analysis: str) -> List[Dict[str, Any]]:
         """Extract seasonal recommendations from analysis."""
         # This is a simplified extraction - can be enhanced
-        recommendations = []
+        found = {match.lower() for match in _SEASONAL_KEYWORD_PATTERN.findall(analysis)}
         
-        if "irrigation" in analysis.lower():
-            recommendations.append({
-                "category": "irrigation",
-                "recommendation": "Monitor soil moisture and adjust irrigation based on weather forecast",
-                "priority": "high"
-            })
-        
-        if "sowing" in analysis.lower():
-            recommendations.append({
-                "category": "sowing",
-                "recommendation": "Plan sowing activities based on weather windows",
-                "priority": "high"
-            })
-        
-        return recommendations
+        return [
+            {"category": category, "recommendation": recommendation, "priority": priority}
+            for keyword, (category, recommendation, priority) in _SEASONAL_KEYWORDS.items()
+            if keyword in found
+        ]
     
-    def _generate_seasonal_calendar(self, seasonal_context: Dict, weather_data: List[Dict]) -> Dict[str, Any]:
+    def _generate_seasonal_calendar(self, seasonal_context: Dict, weather_data: List[Dict],
+                                    today: datetime) -> Dict[str, Any]:
         """Generate a seasonal farming calendar with weather considerations."""
         current_season = seasonal_context["current_season"]
         farming_stage = seasonal_context["farming_stage"]
         
+        week = weather_data[:7]
+        rain = np.fromiter((day.get("rain_sum", 0) for day in week), float, len(week))
+        spray_days = [week[i]["date"] for i in np.flatnonzero(rain < 1)[:3]]
+        harvest = self.farming_seasons[current_season]["harvest_period"]
+        
         return {
             "season": current_season,
             "current_stage": farming_stage,
             "key_dates": {
-                "next_irrigation": (datetime.now() + timedelta(days=3)).strftime('%Y-%m-%d'),
-                "optimal_spray_days": [day["date"] for day in weather_data[:7] if day.get("rain_sum", 0) < 1][:3],
-                "harvest_window": f"{current_season} harvest typically in {self.farming_seasons[current_season]['harvest_period']['start']}-{self.farming_seasons[current_season]['harvest_period']['end']} months"
+                "next_irrigation": (today + timedelta(days=3)).strftime('%Y-%m-%d'),
+                "optimal_spray_days": spray_days,
+                "harvest_window": f"{current_season} harvest typically in {harvest['start']}-{harvest['end']} months"
             }
         }
     
     def _get_stage_activities(self, stage: str, season: str) -> List[str]:
         """Get key activities for current farming stage."""
-        activities = {
-            "sowing": [
-                "Prepare seedbed",
-                "Check seed quality", 
-                "Plan irrigation schedule",
-                "Apply basal fertilizers",
-                "Monitor weather for optimal sowing window"
-            ],
-            "growing": [
-                "Monitor crop growth",
-                "Manage irrigation",
-                "Apply fertilizers as needed",
-                "Scout for pests and diseases",
-                "Weed management"
-            ],
-            "harvest": [
-                "Monitor crop maturity",
-                "Plan harvest timing",
-                "Arrange transportation",
-                "Check market prices",
-                "Prepare storage facilities"
-            ]
-        }
-        return activities.get(stage, [])
+        return list(_STAGE_ACTIVITIES.get(stage, ()))
     
     def _get_weather_considerations(self, stage: str) -> List[str]:
         """Get weather considerations for farming stage."""
-        considerations = {
-            "sowing": [
-                "Avoid sowing before heavy rains",
-                "Ensure adequate soil moisture",
-                "Check for favorable temperature conditions"
-            ],
-            "growing": [
-                "Monitor rainfall for irrigation planning",
-                "Watch for pest-favorable weather conditions",
-                "Protect crops from extreme weather"
-            ],
-            "harvest": [
-                "Ensure dry weather for harvest",
-                "Avoid harvest during rains",
-                "Plan around storm predictions"
-            ]
-        }
-        return considerations.get(stage, [])
+        return list(_WEATHER_CONSIDERATIONS.get(stage, ()))
 
 
 # Testing and demonstration
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Weather Aggregation Helpers
+Shared NumPy kernels that collapse Open-Meteo hourly variables into daily
+statistics without building a pandas DataFrame and resampling each column.
+
+Hourly variables are kept as a single (n_vars, n_hours) float buffer and every
+reduction (sum/mean/max/min) is computed for all variables in one vectorized
+pass. Missing values (NaN) are skipped, matching pandas resample semantics.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+SECONDS_PER_DAY = 86400
+HOURS_PER_DAY = 24
+
+
+def stack_hourly_variables(hourly, count: int) -> np.ndarray:
+    """Stack the first `count` Open-Meteo hourly variables into a (n_vars, n_hours) array."""
+    return np.stack(
+        [hourly.Variables(i).ValuesAsNumpy() for i in range(count)]
+    ).astype(np.float64, copy=False)
+
+
+def day_boundaries(start: int, end: int, interval: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Group hourly timestamps into UTC calendar days.
+
+    Args:
+        start (int): First timestamp (epoch seconds, inclusive)
+        end (int): Last timestamp (epoch seconds, exclusive)
+        interval (int): Step between samples in seconds
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Day numbers since epoch and the index of
+        the first sample of each day (suitable for ``ufunc.reduceat``).
+    """
+    epochs = np.arange(start, end, interval, dtype=np.int64)
+    day_ids = epochs // SECONDS_PER_DAY
+    if day_ids.size == 0:
+        return day_ids, day_ids
+    starts = np.flatnonzero(np.r_[True, day_ids[1:] != day_ids[:-1]])
+    return day_ids[starts], starts
+
+
+def daily_reduce(values: np.ndarray, starts: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Compute NaN-skipping daily sum, mean, max and min for every variable.
+
+    Args:
+        values (np.ndarray): Hourly values shaped (n_vars, n_hours)
+        starts (np.ndarray): First-sample index of each day from day_boundaries
+
+    Returns:
+        Dict[str, np.ndarray]: "sum", "mean", "max", "min" arrays shaped (n_vars, n_days)
+    """
+    if starts.size == 0:
+        empty = np.empty((values.shape[0], 0))
+        return {"sum": empty, "mean": empty, "max": empty, "min": empty}
+
+    # Whole, midnight-aligned hourly days (the common case) reduce as a fixed
+    # (n_vars, n_days, 24) block; ragged ranges fall back to reduceat.
+    n_hours = values.shape[1]
+    if n_hours == starts.size * HOURS_PER_DAY and np.array_equal(
+            starts, np.arange(0, n_hours, HOURS_PER_DAY)):
+        return _daily_reduce_fixed(values.reshape(values.shape[0], -1, HOURS_PER_DAY))
+
+    valid = ~np.isnan(values)
+    counts = np.add.reduceat(valid.astype(np.int64), starts, axis=1)
+    sums = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=1)
+    maxs = np.maximum.reduceat(np.where(valid, values, -np.inf), starts, axis=1)
+    mins = np.minimum.reduceat(np.where(valid, values, np.inf), starts, axis=1)
+
+    missing = counts == 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    maxs[missing] = np.nan
+    mins[missing] = np.nan
+
+    return {"sum": sums, "mean": means, "max": maxs, "min": mins}
+
+
+def _daily_reduce_fixed(days: np.ndarray) -> Dict[str, np.ndarray]:
+    """daily_reduce specialized for a (n_vars, n_days, 24) block."""
+    if not np.isnan(days).any():
+        return {
+            "sum": days.sum(axis=2),
+            "mean": days.mean(axis=2),
+            "max": days.max(axis=2),
+            "min": days.min(axis=2),
+        }
+
+    valid = ~np.isnan(days)
+    counts = valid.sum(axis=2)
+    sums = np.where(valid, days, 0.0).sum(axis=2)
+    maxs = np.where(valid, days, -np.inf).max(axis=2)
+    mins = np.where(valid, days, np.inf).min(axis=2)
+
+    missing = counts == 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    maxs[missing] = np.nan
+    mins[missing] = np.nan
+
+    return {"sum": sums, "mean": means, "max": maxs, "min": mins}
+
+
+def daily_circular_mean(degrees: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Daily circular mean of an hourly direction series in degrees, normalized to 0-360."""
+    radians = np.deg2rad(degrees)
+    means = daily_reduce(np.stack([np.sin(radians), np.cos(radians)]), starts)["mean"]
+    mean_angle = np.rad2deg(np.arctan2(means[0], means[1]))
+    return (mean_angle + 360) % 360
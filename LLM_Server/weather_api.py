@@ -1,9 +1,13 @@
+import json
 import openmeteo_requests
 import pandas as pd
 import requests_cache
 from retry_requests import retry
 from geopy.geocoders import Nominatim
 import numpy as np
+from weather_aggregation import (
+    SECONDS_PER_DAY, stack_hourly_variables, day_boundaries, daily_reduce, daily_circular_mean
+)
 
 def get_coordinates(address):
     geolocator = Nominatim(user_agent="weather_app")
@@ -29,15 +33,23 @@ if not end_date:
 latitude, longitude = get_coordinates(address)
 
 # Setup the Open-Meteo API client with cache and retry on error
-cache_session = requests_cache.CachedSession('.cache', expire_after=3600)
+cache_session = requests_cache.CachedSession(
+    'capone_weather',
+    backend='sqlite',
+    use_cache_dir=True,
+    expire_after=3600,
+    stale_if_error=True,
+    allowable_methods=('GET', 'POST'),
+    match_headers=False
+)
 retry_session = retry(cache_session, retries=5, backoff_factor=0.2)
 openmeteo = openmeteo_requests.Client(session=retry_session)
 
 # Weather API parameters
 url = "https://api.open-meteo.com/v1/forecast"
 params = {
-    "latitude": latitude,
-    "longitude": longitude,
+    "latitude": round(latitude, 3),
+    "longitude": round(longitude, 3),
     "hourly": [
         "temperature_2m", "relative_humidity_2m", "apparent_temperature", "rain",
         "showers", "snow_depth", "surface_pressure", "cloud_cover", "cloud_cover_low",
@@ -56,14 +68,11 @@ print(f"Coordinates: {response.Latitude()}°N {response.Longitude()}°E")
 print(f"Elevation: {response.Elevation()} m asl")
 print(f"Timezone difference to GMT+0: {response.UtcOffsetSeconds()}s")
 
-# Process hourly data
+# Process hourly data: ISO timestamps straight from the epoch-second range,
+# values as a single (n_vars, n_hours) buffer
 hourly = response.Hourly()
-hourly_data = {"date": pd.date_range(
-    start=pd.to_datetime(hourly.Time(), unit="s", utc=True),
-    end=pd.to_datetime(hourly.TimeEnd(), unit="s", utc=True),
-    freq=pd.Timedelta(seconds=hourly.Interval()),
-    inclusive="left"
-)}
+epochs = np.arange(hourly.Time(), hourly.TimeEnd(), hourly.Interval(), dtype="i8")
+hourly_dates = np.char.add(np.datetime_as_string(epochs.astype("datetime64[s]"), unit="s"), "+00:00")
 
 # Extract variables
 variables = [
@@ -73,61 +82,57 @@ variables = [
     "wind_direction_80m", "wind_gusts_10m", "wind_speed_120m",
     "soil_moisture_3_to_9cm", "soil_moisture_9_to_27cm"
 ]
+col = {var: i for i, var in enumerate(variables)}
+values = stack_hourly_variables(hourly, len(variables))
+print("\nHourly Data\n", pd.DataFrame(values[:, :5].T, index=hourly_dates[:5], columns=variables))
 
-for i, var in enumerate(variables):
-    hourly_data[var] = hourly.Variables(i).ValuesAsNumpy()
+# --- DAILY AGGREGATION ---
 
-# Convert to DataFrame
-hourly_df = pd.DataFrame(data=hourly_data)
-hourly_df.set_index("date", inplace=True)
-print("\nHourly Data\n", hourly_df.head())
+# Reduce all variables at once from the hourly buffer
+day_ids, day_starts = day_boundaries(hourly.Time(), hourly.TimeEnd(), hourly.Interval())
+daily = daily_reduce(values, day_starts)
+
+# (column name, hourly variable, reduction)
+daily_columns = [
+    ("temp_mean", "temperature_2m", "mean"),
+    ("temp_max", "temperature_2m", "max"),
+    ("temp_min", "temperature_2m", "min"),
+    ("apparent_temp_mean", "apparent_temperature", "mean"),
+    ("apparent_temp_max", "apparent_temperature", "max"),
+    ("apparent_temp_min", "apparent_temperature", "min"),
+    ("humidity_mean", "relative_humidity_2m", "mean"),
+    ("rain_sum", "rain", "sum"),
+    ("showers_sum", "showers", "sum"),
+    ("snow_depth_sum", "snow_depth", "sum"),
+    ("surface_pressure_mean", "surface_pressure", "mean"),
+    ("cloud_cover_mean", "cloud_cover", "mean"),
+    ("cloud_cover_low_mean", "cloud_cover_low", "mean"),
+    ("cloud_cover_high_mean", "cloud_cover_high", "mean"),
+    ("vapour_pressure_deficit_mean", "vapour_pressure_deficit", "mean"),
+    ("wind_gusts_max", "wind_gusts_10m", "max"),
+    ("wind_speed_120m_mean", "wind_speed_120m", "mean"),
+    ("soil_moisture_3_to_9cm_mean", "soil_moisture_3_to_9cm", "mean"),
+    ("soil_moisture_9_to_27cm_mean", "soil_moisture_9_to_27cm", "mean"),
+]
 
-# --- DAILY AGGREGATION ---
+daily_df = pd.DataFrame(
+    {name: daily[how][col[var]] for name, var, how in daily_columns},
+    index=pd.to_datetime(day_ids * SECONDS_PER_DAY, unit="s", utc=True)
+)
 
-# Function for circular mean (wind direction)
-def daily_wind_direction(hourly_series):
-    radians = np.deg2rad(hourly_series)
-    sin_avg = np.mean(np.sin(radians))
-    cos_avg = np.mean(np.cos(radians))
-    mean_angle = np.rad2deg(np.arctan2(sin_avg, cos_avg))
-    return (mean_angle + 360) % 360  # normalize to 0-360
-
-# Aggregate daily
-daily_df = pd.DataFrame({
-    "temp_mean": hourly_df["temperature_2m"].resample("D").mean(),
-    "temp_max": hourly_df["temperature_2m"].resample("D").max(),
-    "temp_min": hourly_df["temperature_2m"].resample("D").min(),
-    "apparent_temp_mean": hourly_df["apparent_temperature"].resample("D").mean(),
-    "apparent_temp_max": hourly_df["apparent_temperature"].resample("D").max(),
-    "apparent_temp_min": hourly_df["apparent_temperature"].resample("D").min(),
-    "humidity_mean": hourly_df["relative_humidity_2m"].resample("D").mean(),
-    "rain_sum": hourly_df["rain"].resample("D").sum(),
-    "showers_sum": hourly_df["showers"].resample("D").sum(),
-    "snow_depth_sum": hourly_df["snow_depth"].resample("D").sum(),
-    "surface_pressure_mean": hourly_df["surface_pressure"].resample("D").mean(),
-    "cloud_cover_mean": hourly_df["cloud_cover"].resample("D").mean(),
-    "cloud_cover_low_mean": hourly_df["cloud_cover_low"].resample("D").mean(),
-    "cloud_cover_high_mean": hourly_df["cloud_cover_high"].resample("D").mean(),
-    "vapour_pressure_deficit_mean": hourly_df["vapour_pressure_deficit"].resample("D").mean(),
-    "wind_gusts_max": hourly_df["wind_gusts_10m"].resample("D").max(),
-    "wind_speed_120m_mean": hourly_df["wind_speed_120m"].resample("D").mean(),
-    "soil_moisture_3_to_9cm_mean": hourly_df["soil_moisture_3_to_9cm"].resample("D").mean(),
-    "soil_moisture_9_to_27cm_mean": hourly_df["soil_moisture_9_to_27cm"].resample("D").mean(),
-})
-
-# Apply wind direction properly
-daily_df["wind_direction_80m_mean"] = hourly_df["wind_direction_80m"].resample("D").apply(daily_wind_direction)
+# Wind direction needs a circular mean
+daily_df["wind_direction_80m_mean"] = daily_circular_mean(values[col["wind_direction_80m"]], day_starts)
 
 print("\nDaily Data\n", daily_df.head())
 
 # --- SAVE TO JSON ---
 # Save hourly data
-hourly_df_reset = hourly_df.reset_index()
-hourly_df_reset["date"] = hourly_df_reset["date"].apply(lambda x: x.isoformat() if hasattr(x, "isoformat") else str(x))
-hourly_json = hourly_df_reset.to_dict(orient="records")
+hourly_json = [
+    {"date": date, **dict(zip(variables, row))}
+    for date, row in zip(hourly_dates.tolist(), values.T.tolist())
+]
 hourly_json_path = f"weather_hourly_{latitude:.4f}_{longitude:.4f}_{start_date}_to_{end_date}.json"
 with open(hourly_json_path, "w", encoding="utf-8") as f:
-    import json
     json.dump(hourly_json, f, ensure_ascii=False, indent=2)
 print(f"\n✅ Hourly data saved to {hourly_json_path}")
 
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+PCM helpers for splitting recordings into recognition chunks.
+
+Chunks are cut at the quietest point near their maximum length instead of at a
+fixed offset, so words are not split between chunks. The per-frame energy
+loops are compiled with Numba when it is installed (cached on disk across
+runs); otherwise the same values are computed with NumPy.
+"""
+
+import math
+from typing import List
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+
+
+def _rms_energy(samples: np.ndarray) -> float:
+    """Root mean square of 16-bit PCM samples (0.0 for an empty array)"""
+    if samples.shape[0] == 0:
+        return 0.0
+    total = 0.0
+    for i in prange(samples.shape[0]):
+        value = float(samples[i])
+        total += value * value
+    return math.sqrt(total / samples.shape[0])
+
+
+def _frame_rms(samples: np.ndarray, frame_length: int) -> np.ndarray:
+    """RMS of each whole frame_length-sample frame"""
+    count = samples.shape[0] // frame_length
+    energies = np.empty(count, dtype=np.float64)
+    for frame in prange(count):
+        total = 0.0
+        start = frame * frame_length
+        for i in range(start, start + frame_length):
+            value = float(samples[i])
+            total += value * value
+        energies[frame] = math.sqrt(total / frame_length)
+    return energies
+
+
+if NUMBA_AVAILABLE:
+    rms_energy = njit(cache=True, fastmath=True, parallel=True)(_rms_energy)
+    frame_rms = njit(cache=True, fastmath=True, parallel=True)(_frame_rms)
+else:
+    def rms_energy(samples: np.ndarray) -> float:
+        """Root mean square of 16-bit PCM samples (0.0 for an empty array)"""
+        if samples.shape[0] == 0:
+            return 0.0
+        values = samples.astype(np.float64)
+        return math.sqrt(np.dot(values, values) / values.shape[0])
+
+    def frame_rms(samples: np.ndarray, frame_length: int) -> np.ndarray:
+        """RMS of each whole frame_length-sample frame"""
+        count = samples.shape[0] // frame_length
+        frames = samples[:count * frame_length].astype(np.float64).reshape(count, frame_length)
+        return np.sqrt(np.einsum('ij,ij->i', frames, frames) / frame_length)
+
+
+def silence_split_points(samples: np.ndarray, sample_rate: int, max_chunk_seconds: float,
+                         search_seconds: float, frame_seconds: float = 0.1) -> List[int]:
+    """
+    Choose chunk boundaries at the quietest frame near each chunk's maximum length.
+
+    Args:
+        samples (np.ndarray): Mono 16-bit PCM samples
+        sample_rate (int): Samples per second
+        max_chunk_seconds (float): Longest allowed chunk
+        search_seconds (float): How far back from the maximum length to look for silence
+        frame_seconds (float): Length of the frames whose energy is compared
+
+    Returns:
+        List[int]: Sample offsets of the cuts, in order (empty if the audio fits in one chunk)
+    """
+    max_length = int(max_chunk_seconds * sample_rate)
+    search_length = min(int(search_seconds * sample_rate), max_length - 1)
+    frame_length = max(1, int(frame_seconds * sample_rate))
+
+    cuts = []
+    start = 0
+    while samples.shape[0] - start > max_length:
+        window_start = start + max_length - search_length
+        energies = frame_rms(samples[window_start:start + max_length], frame_length)
+        if energies.shape[0] == 0:
+            cut = start + max_length
+        else:
+            # Cut in the middle of the quietest frame
+            cut = window_start + int(np.argmin(energies)) * frame_length + frame_length // 2
+        cuts.append(cut)
+        start = cut
+    return cuts
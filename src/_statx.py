@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Lightweight file metadata probes.
+
+On Linux, fast_stat() calls statx(2) through libc with AT_STATX_DONT_SYNC, which
+lets network filesystems answer from their attribute cache instead of
+revalidating with the server, and requests only the type/mode, size and mtime
+fields. Elsewhere (macOS/BSD, old kernels or libc without statx) it falls back
+to os.stat().
+"""
+
+import ctypes
+import errno
+import os
+import sys
+from typing import NamedTuple, Optional
+
+AT_FDCWD = -100
+AT_SYMLINK_NOFOLLOW = 0x100
+AT_STATX_DONT_SYNC = 0x4000
+
+STATX_TYPE = 0x0001
+STATX_MODE = 0x0002
+STATX_MTIME = 0x0040
+STATX_SIZE = 0x0200
+
+
+class FastStat(NamedTuple):
+    """Subset of os.stat_result used by the fetcher"""
+    st_mode: int
+    st_size: int
+    st_mtime: float
+
+
+class _StatxTimestamp(ctypes.Structure):
+    _fields_ = [
+        ("tv_sec", ctypes.c_int64),
+        ("tv_nsec", ctypes.c_uint32),
+        ("__reserved", ctypes.c_int32),
+    ]
+
+
+class _Statx(ctypes.Structure):
+    # struct statx from <linux/stat.h> (256 bytes)
+    _fields_ = [
+        ("stx_mask", ctypes.c_uint32),
+        ("stx_blksize", ctypes.c_uint32),
+        ("stx_attributes", ctypes.c_uint64),
+        ("stx_nlink", ctypes.c_uint32),
+        ("stx_uid", ctypes.c_uint32),
+        ("stx_gid", ctypes.c_uint32),
+        ("stx_mode", ctypes.c_uint16),
+        ("__spare0", ctypes.c_uint16),
+        ("stx_ino", ctypes.c_uint64),
+        ("stx_size", ctypes.c_uint64),
+        ("stx_blocks", ctypes.c_uint64),
+        ("stx_attributes_mask", ctypes.c_uint64),
+        ("stx_atime", _StatxTimestamp),
+        ("stx_btime", _StatxTimestamp),
+        ("stx_ctime", _StatxTimestamp),
+        ("stx_mtime", _StatxTimestamp),
+        ("stx_rdev_major", ctypes.c_uint32),
+        ("stx_rdev_minor", ctypes.c_uint32),
+        ("stx_dev_major", ctypes.c_uint32),
+        ("stx_dev_minor", ctypes.c_uint32),
+        ("__spare2", ctypes.c_uint64 * 14),
+    ]
+
+
+def _load_statx():
+    """Return libc's statx function if it works on this system, else None (probed once at import)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        statx = libc.statx
+    except (OSError, AttributeError):
+        return None
+
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.POINTER(_Statx)]
+    statx.restype = ctypes.c_int
+
+    # Kernels older than 4.11 fail with ENOSYS
+    buf = _Statx()
+    if statx(AT_FDCWD, b"/", AT_STATX_DONT_SYNC, STATX_TYPE, ctypes.byref(buf)) != 0:
+        return None
+    return statx
+
+
+_statx = _load_statx()
+STATX_AVAILABLE = _statx is not None
+
+_MASK = STATX_TYPE | STATX_MODE | STATX_SIZE | STATX_MTIME
+
+
+def fast_stat(path, follow_symlinks: bool = True) -> Optional[FastStat]:
+    """
+    Stat a path without forcing a filesystem sync.
+
+    Returns:
+        Optional[FastStat]: Mode, size and mtime, or None if the path does not exist
+
+    Raises:
+        OSError: For errors other than a missing path
+    """
+    if _statx is None:
+        try:
+            st = os.stat(path, follow_symlinks=follow_symlinks)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return FastStat(st.st_mode, st.st_size, st.st_mtime)
+
+    flags = AT_STATX_DONT_SYNC if follow_symlinks else AT_STATX_DONT_SYNC | AT_SYMLINK_NOFOLLOW
+    buf = _Statx()
+    if _statx(AT_FDCWD, os.fsencode(path), flags, _MASK, ctypes.byref(buf)) != 0:
+        err = ctypes.get_errno()
+        if err in (errno.ENOENT, errno.ENOTDIR):
+            return None
+        raise OSError(err, os.strerror(err), str(path))
+
+    mtime = buf.stx_mtime.tv_sec + buf.stx_mtime.tv_nsec / 1e9
+    return FastStat(buf.stx_mode, buf.stx_size, mtime)
@@ -8,24 +8,68 @@ and saves transcripts to the transcripts directory.
 import os
 import time
 import json
-import shutil
+import atexit
+import heapq
 import logging
+import logging.handlers
+import multiprocessing
+import queue
+import selectors
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import sys
 
-# Import the recording processor
+# Sibling modules are imported from this file's directory. The recording
+# processor (and the Google Cloud libraries behind it) is only imported by
+# modes that process files.
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
+
+# statx-based metadata probes (os.stat fallback off Linux)
+from _statx import fast_stat
+
+# Fast JSON serialization when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Kernel file events (Linux only); falls back to interval polling elsewhere
 try:
-    from recording_processor import RecordingProcessorGoogle
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
 except ImportError:
-    # If not found, try importing from current directory
-    sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-    from recording_processor import RecordingProcessorGoogle
+    INOTIFY_AVAILABLE = False
+
+# Per-process recording processor for transcription worker processes
+_worker_processor = None
+
+
+def _init_worker_processor():
+    """Create the worker process's recording processor once, keeping its API clients warm"""
+    global _worker_processor
+    try:
+        from recording_processor import RecordingProcessorGoogle
+        _worker_processor = RecordingProcessorGoogle()
+    except Exception as e:
+        logging.getLogger('AudioFetcher').error(f"Failed to initialize recording processor in worker {os.getpid()}: {e}")
+
+
+def _process_recording_in_worker(source_path):
+    """Run process_recording in a worker process"""
+    if _worker_processor is None:
+        return {"success": False, "error": "Recording processor not available in worker"}
+    return _worker_processor.process_recording(source_path)
+
 
 class AudioFetcher:
     """Audio file fetcher and processor for monitoring directories and processing recordings"""
     
-    def __init__(self):
+    def __init__(self, init_processor=True):
         # Setup base directories
         self.base_dir = Path("/Users/apple/Desktop/asterisk")
         self.monitor_dir = self.base_dir / "monitor"
@@ -35,10 +79,25 @@ class AudioFetcher:
         
         # Log file
         self.log_file = self.recordings_dir / "fetcher.log"
-        self.processed_file = self.recordings_dir / "processed_files.json"
+        # The recording processor keeps its own processed_files.json (a list of
+        # paths); the fetcher's snapshot is separate so neither overwrites the other
+        self.processed_file = self.recordings_dir / "fetcher_processed_files.json"
+        # Snapshot shared with the recording processor by older versions, read
+        # until the fetcher has written its own
+        self.legacy_processed_file = self.recordings_dir / "processed_files.json"
+        # Files processed since the last snapshot, one path per line
+        self.processed_log = self.recordings_dir / "fetcher_processed_files.log"
+        
+        # Compact the processed-files log into the JSON snapshot every N monitoring cycles
+        self.compact_interval = 50
+        
+        # Seconds without modification after which a file counts as fully written
+        self.stability_time = 5
         
         # Supported audio formats (especially Asterisk formats)
         self.audio_formats = {'.wav', '.mp3', '.gsm', '.ulaw', '.alaw', '.sln', '.g722', '.au'}
+        # Lower- and upper-case suffixes for str.endswith on raw file names
+        self._audio_suffix_tuple = tuple(sorted({s for fmt in self.audio_formats for s in (fmt, fmt.upper())}))
         
         # Create required directories
         for directory in [self.recordings_dir, self.transcripts_dir, self.converted_dir]:
@@ -47,20 +106,49 @@ class AudioFetcher:
         # Setup logging
         self.setup_logging()
         
-        # Load processed files
+        # Load processed files (shared across worker threads)
         self.processed_files = self.load_processed_files()
+        self.processed_lock = threading.Lock()
+        
+        # Worker pool for processing files concurrently (readiness waits and
+        # transcription calls are I/O bound)
+        self.max_workers = int(os.environ.get("AUDIO_FETCHER_WORKERS", 4))
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="AudioFetcher")
+        
+        # Watch the monitor directory for new files
+        self.inotify = None
+        self.setup_inotify()
         
-        # Initialize recording processor
+        # Optional pool of long-lived transcription processes, each holding its
+        # own recording processor (0 = transcribe in the worker threads)
+        self.worker_processes = int(os.environ.get("AUDIO_FETCHER_PROCESSES", 0))
+        self.process_pool = None
+        
+        # Initialize recording processor (skipped for read-only modes like status)
         self.recording_processor = None
-        self.init_recording_processor()
+        self.processor_loaded = init_processor
+        if init_processor:
+            self.init_recording_processor()
         
         self.logger.info("Audio Fetcher and Processor initialized")
         self.logger.info(f"Monitor directory: {self.monitor_dir}")
         self.logger.info(f"Transcripts directory: {self.transcripts_dir}")
     
     def init_recording_processor(self):
-        """Initialize the recording processor"""
+        """Initialize the recording processor, or the worker processes that hold one each"""
+        if self.worker_processes > 0:
+            # Spawned, not forked: the parent already runs the log listener and
+            # worker threads, whose locks a forked child could inherit held
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=self.worker_processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker_processor
+            )
+            self.logger.info(f"Transcribing in {self.worker_processes} worker processes")
+            return
+        
         try:
+            from recording_processor import RecordingProcessorGoogle
             self.recording_processor = RecordingProcessorGoogle()
             self.logger.info("Recording processor initialized successfully")
         except Exception as e:
@@ -72,45 +160,127 @@ class AudioFetcher:
         # Ensure recordings directory exists for log file
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file),
-                logging.StreamHandler()
-            ]
-        )
+        # Worker threads only enqueue records; a background listener does the
+        # file and console writes
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [logging.FileHandler(self.log_file), logging.StreamHandler()]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.SimpleQueue()
+        self.log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        self.log_listener.start()
+        atexit.register(self.log_listener.stop)
+        
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
         self.logger = logging.getLogger('AudioFetcher')
     
+    def setup_inotify(self):
+        """Subscribe to file events on the monitor directory when inotify is available"""
+        if not INOTIFY_AVAILABLE:
+            self.logger.info("inotify not available, using interval polling")
+            return
+        if not self.monitor_dir.exists():
+            self.logger.warning(f"Monitor directory does not exist, using interval polling: {self.monitor_dir}")
+            return
+        
+        try:
+            self.inotify = INotify()
+            # Files written in place are reported on close; files moved in on rename
+            self.inotify.add_watch(self.monitor_dir, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+            self.logger.info("Watching monitor directory with inotify")
+        except OSError as e:
+            self.logger.warning(f"Could not set up inotify watch, using interval polling: {e}")
+            self.inotify = None
+    
     def load_processed_files(self):
-        """Load list of already processed files"""
+        """
+        Load already processed files from the JSON snapshot plus the append-only log.
+        
+        Files are keyed by name since the monitor directory is fixed; entries stored
+        as absolute paths by older versions are reduced to their names. Snapshots
+        may be the fetcher's {"files": [...]} object or a plain list of paths.
+        """
+        keys = []
         try:
-            if self.processed_file.exists():
-                with open(self.processed_file, 'r') as f:
+            snapshot = self.processed_file if self.processed_file.exists() else self.legacy_processed_file
+            if snapshot.exists():
+                with open(snapshot, 'r') as f:
                     data = json.load(f)
-                return set(data.get('files', []))
+                keys.extend(data.get('files', []) if isinstance(data, dict) else data)
         except Exception as e:
             self.logger.warning(f"Could not load processed files: {e}")
-        return set()
+        
+        try:
+            if self.processed_log.exists():
+                with open(self.processed_log, 'r') as f:
+                    keys.extend(line.rstrip('\n') for line in f if line.strip())
+        except Exception as e:
+            self.logger.warning(f"Could not load processed files log: {e}")
+        
+        return {sys.intern(os.path.basename(key)) for key in keys}
+    
+    def mark_processed(self, file_key):
+        """Add a file name to the processed set and append it to the processed-files log"""
+        file_key = sys.intern(file_key)
+        with self.processed_lock:
+            self.processed_files.add(file_key)
+            try:
+                with open(self.processed_log, 'a') as f:
+                    f.write(file_key + '\n')
+            except Exception as e:
+                self.logger.error(f"Could not append to processed files log: {e}")
     
     def save_processed_files(self):
-        """Save list of processed files"""
+        """
+        Compact the processed set into the JSON snapshot and truncate the log.
+        
+        The snapshot is written to a temporary file, fsynced and renamed over the old
+        one, so a crash leaves either the previous or the new snapshot (plus the log)
+        intact. Appends to the log between compactions are not fsynced.
+        """
         try:
-            data = {
-                'files': list(self.processed_files),
-                'last_updated': datetime.now().isoformat(),
-                'count': len(self.processed_files)
-            }
-            with open(self.processed_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self.processed_lock:
+                data = {
+                    'files': list(self.processed_files),
+                    'last_updated': datetime.now().isoformat(),
+                    'count': len(self.processed_files)
+                }
+                if ORJSON_AVAILABLE:
+                    payload = orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+                else:
+                    payload = json.dumps(data, separators=(',', ':')).encode() + b'\n'
+                tmp_file = self.processed_file.with_suffix('.json.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.processed_file)
+                
+                # Persist the rename before the log it supersedes is truncated
+                dir_fd = os.open(self.recordings_dir, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+                
+                # Everything in the log is now in the snapshot
+                open(self.processed_log, 'w').close()
         except Exception as e:
             self.logger.error(f"Could not save processed files: {e}")
     
     def is_audio_file(self, filepath):
         """Check if file is an audio file"""
-        return filepath.suffix.lower() in self.audio_formats
+        return filepath.name.endswith(self._audio_suffix_tuple)
     
-    def is_file_ready(self, filepath, stability_time=5, max_wait=120):
+    @staticmethod
+    def _completion_marker_path(filepath):
+        """Path string of the Asterisk completion marker for a recording"""
+        return os.path.splitext(str(filepath))[0] + '.complete'
+    
+    def is_file_ready(self, filepath, stability_time=5, max_wait=120, completion_marker=None):
         """
         Check if file is ready for processing by ensuring it's stable (not being written to)
         
@@ -118,71 +288,183 @@ class AudioFetcher:
             filepath: Path to the file to check
             stability_time: Seconds the file size must remain stable
             max_wait: Maximum time to wait for file stability
+            completion_marker: Precomputed marker path string (derived from filepath if omitted)
             
         Returns:
             bool: True if file is ready, False if still being written or timeout
         """
         try:
-            if not filepath.exists():
+            st = fast_stat(filepath)
+            if st is None:
                 return False
             
             self.logger.info(f"Checking file readiness: {filepath.name}")
             
             # Check for completion marker file first (more reliable for Asterisk recordings)
-            completion_marker = filepath.with_suffix('.complete')
-            if completion_marker.exists():
+            if completion_marker is None:
+                completion_marker = self._completion_marker_path(filepath)
+            if fast_stat(completion_marker) is not None:
                 self.logger.info(f"Found completion marker for {filepath.name}")
                 return True
             
-            # Fall back to file size stability check
+            # A file not modified for stability_time seconds is already stable
+            age = time.time() - st.st_mtime
+            if age >= stability_time:
+                self.logger.info(f"File {filepath.name} is stable (last modified {age:.0f}s ago)")
+                return True
+            
             # Initial file size
-            initial_size = filepath.stat().st_size
-            last_size = initial_size
-            stable_count = 0
-            total_wait = 0
+            initial_size = st.st_size
             
             # If file is very small (< 1KB), it might still be being created
             if initial_size < 1024:
                 self.logger.info(f"File {filepath.name} is very small ({initial_size} bytes), waiting...")
+            
+            if INOTIFY_AVAILABLE:
+                return self._wait_for_close_write(filepath, completion_marker, stability_time, max_wait)
+            
+            # Fall back to file size stability check
+            if initial_size < 1024:
                 time.sleep(2)
+            return self._wait_for_stable_size(filepath, completion_marker, initial_size, stability_time, max_wait)
             
-            while total_wait < max_wait:
-                time.sleep(1)  # Check every second
-                total_wait += 1
-                
-                # Check again for completion marker
-                if completion_marker.exists():
-                    self.logger.info(f"Completion marker appeared for {filepath.name} after {total_wait}s")
+        except Exception as e:
+            self.logger.error(f"Error checking file readiness for {filepath}: {e}")
+            return False
+    
+    def _wait_for_close_write(self, filepath, completion_marker, stability_time, max_wait):
+        """
+        Wait for the writer to finish using inotify events on the file's directory.
+        
+        The file is ready when it is closed after writing, when its completion marker
+        appears, or when no write to it is seen for stability_time seconds (it may
+        already have been closed before the watch was set up).
+        """
+        watch_mask = (inotify_flags.CLOSE_WRITE | inotify_flags.MODIFY | inotify_flags.CREATE |
+                      inotify_flags.MOVED_TO | inotify_flags.MOVED_FROM | inotify_flags.DELETE)
+        start = time.monotonic()
+        deadline = start + max_wait
+        last_write = start
+        marker_name = os.path.basename(completion_marker)
+        
+        with INotify() as inotify:
+            inotify.add_watch(filepath.parent, watch_mask)
+            
+            # The writer may have finished between the checks above and the watch
+            if fast_stat(completion_marker) is not None:
+                self.logger.info(f"Found completion marker for {filepath.name}")
+                return True
+            if fast_stat(filepath) is None:
+                self.logger.warning(f"File {filepath.name} became inaccessible")
+                return False
+            
+            while True:
+                now = time.monotonic()
+                if now - last_write >= stability_time:
+                    self.logger.info(f"File {filepath.name} is stable (no writes for {stability_time}s) after {now - start:.1f}s")
                     return True
+                if now >= deadline:
+                    break
                 
-                try:
-                    current_size = filepath.stat().st_size
-                    
-                    if current_size == last_size:
-                        stable_count += 1
-                        if stable_count >= stability_time:
-                            self.logger.info(f"File {filepath.name} is stable ({current_size} bytes) after {total_wait}s")
+                timeout = min(last_write + stability_time, deadline) - now
+                for event in inotify.read(timeout=max(1, int(timeout * 1000))):
+                    if event.name == marker_name:
+                        if event.mask & (inotify_flags.CREATE | inotify_flags.MOVED_TO | inotify_flags.CLOSE_WRITE):
+                            self.logger.info(f"Completion marker appeared for {filepath.name} after {time.monotonic() - start:.1f}s")
                             return True
-                    else:
-                        # File size changed, reset stability counter
-                        stable_count = 0
-                        self.logger.info(f"File {filepath.name} size changed: {last_size} -> {current_size} bytes")
-                        last_size = current_size
+                        continue
+                    if event.name != filepath.name:
+                        continue
                     
-                except (OSError, FileNotFoundError):
-                    # File might have been moved or deleted
-                    self.logger.warning(f"File {filepath.name} became inaccessible")
-                    return False
+                    if event.mask & inotify_flags.CLOSE_WRITE:
+                        self.logger.info(f"File {filepath.name} was closed after writing ({time.monotonic() - start:.1f}s)")
+                        return True
+                    if event.mask & (inotify_flags.MOVED_FROM | inotify_flags.DELETE):
+                        # File might have been moved or deleted
+                        self.logger.warning(f"File {filepath.name} became inaccessible")
+                        return False
+                    if event.mask & inotify_flags.MODIFY:
+                        last_write = time.monotonic()
+        
+        self.logger.warning(f"File {filepath.name} did not stabilize within {max_wait}s")
+        return False
+    
+    def _wait_for_stable_size(self, filepath, completion_marker, initial_size, stability_time, max_wait):
+        """Wait until the file size stays unchanged for stability_time seconds (polling)"""
+        last_size = initial_size
+        start = time.monotonic()
+        last_change = start
+        attempt = 0
+        # Per-poll messages are DEBUG; skip building their arguments otherwise
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        
+        while time.monotonic() - start < max_wait:
+            # Back off from 200ms up to 2s between checks
+            time.sleep(min(0.2 * 2 ** attempt, 2.0))
+            attempt += 1
+            now = time.monotonic()
+            total_wait = now - start
             
-            self.logger.warning(f"File {filepath.name} did not stabilize within {max_wait}s (final size: {last_size} bytes)")
-            return False
+            # Asterisk writes the marker atomically and size stability is tracked
+            # below, so re-check it only every 5th poll
+            if attempt % 5 == 0 and fast_stat(completion_marker) is not None:
+                self.logger.info(f"Completion marker appeared for {filepath.name} after {total_wait:.1f}s")
+                return True
             
-        except Exception as e:
-            self.logger.error(f"Error checking file readiness for {filepath}: {e}")
-            return False
+            try:
+                st = fast_stat(filepath)
+                if st is None:
+                    raise FileNotFoundError(filepath)
+                current_size = st.st_size
+                
+                if current_size == last_size:
+                    if now - last_change >= stability_time:
+                        self.logger.info(f"File {filepath.name} is stable ({current_size} bytes) after {total_wait:.1f}s")
+                        return True
+                else:
+                    # File size changed, restart the stability window
+                    last_change = now
+                    if debug_enabled:
+                        self.logger.debug("File %s size changed: %d -> %d bytes", filepath.name, last_size, current_size)
+                    last_size = current_size
+                
+            except (OSError, FileNotFoundError):
+                # File might have been moved or deleted
+                self.logger.warning(f"File {filepath.name} became inaccessible")
+                return False
+        
+        self.logger.warning(f"File {filepath.name} did not stabilize within {max_wait}s (final size: {last_size} bytes)")
+        return False
+    
+    def _scan_monitor(self, new_audio_only=False):
+        """
+        Read the monitor directory once, returning (name, path, FastStat) for each regular file.
+        
+        DirEntry caches the file type from the directory read, so each entry costs at
+        most one (non-syncing) stat call per scan. Names and paths are plain strings;
+        callers build Path objects only for the files they process.
+        
+        Args:
+            new_audio_only: Only return unprocessed audio files; other names are
+                skipped before any stat call
+        """
+        entries = []
+        with os.scandir(self.monitor_dir) as it:
+            for entry in it:
+                if new_audio_only and (not entry.name.endswith(self._audio_suffix_tuple) or
+                                       entry.name in self.processed_files):
+                    continue
+                try:
+                    if entry.is_file():
+                        st = fast_stat(entry.path)
+                        if st is not None:
+                            entries.append((entry.name, entry.path, st))
+                except OSError:
+                    continue
+        return entries
     
     def find_new_audio_files(self):
-        """Find new audio files in the monitor directory"""
+        """Find new audio files in the monitor directory, returning (Path, stat) from the scan"""
         new_files = []
         
         if not self.monitor_dir.exists():
@@ -190,49 +472,59 @@ class AudioFetcher:
             return new_files
                 
         try:
-            # Search for audio files in monitor directory
-            for file_path in self.monitor_dir.iterdir():
-                if (file_path.is_file() and 
-                    self.is_audio_file(file_path) and 
-                    str(file_path) not in self.processed_files):
-                    new_files.append(file_path)
+            # Search for unprocessed audio files in monitor directory
+            for _, path, st in self._scan_monitor(new_audio_only=True):
+                new_files.append((Path(path), st))
         except Exception as e:
             self.logger.error(f"Error scanning {self.monitor_dir}: {e}")
         
         return new_files
     
-    def process_audio_file(self, source_path):
-        """Process audio file using the recording processor and save to transcripts"""
+    def process_audio_file(self, source_path, pre_stat=None, complete=False):
+        """
+        Process audio file using the recording processor and save to transcripts
+        
+        Args:
+            source_path: Path to the audio file
+            pre_stat: Stat result from the directory scan, if any; files it shows as
+                unmodified for stability_time seconds skip the readiness wait
+            complete: The file was reported closed after writing (or moved in), so
+                it is ready without a readiness wait
+        """
         try:
             self.logger.info(f"Processing audio file: {source_path.name}")
+            completion_marker = self._completion_marker_path(source_path)
             
             # First, check if the file is ready (not being actively written)
-            if not self.is_file_ready(source_path):
+            already_stable = complete or (pre_stat is not None and
+                                          time.time() - pre_stat.st_mtime >= self.stability_time)
+            if not already_stable and not self.is_file_ready(source_path, self.stability_time,
+                                                              completion_marker=completion_marker):
                 self.logger.error(f"File {source_path.name} is not ready for processing (still being written or timed out)")
                 return False
             
-            # Check if recording processor is available
-            if not self.recording_processor:
+            # Process the recording
+            if self.process_pool:
+                result = self.process_pool.submit(_process_recording_in_worker, source_path).result()
+            elif self.recording_processor:
+                result = self.recording_processor.process_recording(source_path)
+            else:
                 self.logger.warning("Recording processor not available, skipping processing")
                 return False
             
-            # Process the recording
-            result = self.recording_processor.process_recording(source_path)
-            
             if result.get("success", False):
                 self.logger.info(f"Successfully processed {source_path.name}")
                 
                 # Clean up completion marker file if it exists
-                completion_marker = source_path.with_suffix('.complete')
-                if completion_marker.exists():
+                if os.path.lexists(completion_marker):
                     try:
-                        completion_marker.unlink()
+                        os.unlink(completion_marker)
                         self.logger.info(f"Removed completion marker for {source_path.name}")
                     except Exception as e:
                         self.logger.warning(f"Could not remove completion marker: {e}")
                 
                 # Mark as processed
-                self.processed_files.add(str(source_path))
+                self.mark_processed(source_path.name)
                 
                 # Log processing details
                 if "transcription" in result:
@@ -262,13 +554,46 @@ class AudioFetcher:
         
         self.logger.info(f"Found {len(new_files)} new audio files")
         
-        processed_count = 0
-        for file_path in new_files:
-            if self.process_audio_file(file_path):
-                processed_count += 1
+        return self.process_new_files(new_files)
+    
+    def process_file_events(self, events):
+        """Process files reported by inotify events"""
+        new_files = []
+        seen = set()
+        
+        for event in events:
+            if event.mask & inotify_flags.Q_OVERFLOW:
+                # Kernel dropped events, fall back to a full scan
+                self.logger.warning("inotify event queue overflowed, rescanning monitor directory")
+                return self.fetch_files_once()
+            
+            if not event.name:
+                continue
+            
+            if (event.name.endswith(self._audio_suffix_tuple) and 
+                event.name not in self.processed_files and
+                event.name not in seen):
+                seen.add(event.name)
+                new_files.append((self.monitor_dir / event.name, None))
+        
+        if not new_files:
+            return 0
+        
+        # The watch only reports CLOSE_WRITE and MOVED_TO, so each file is complete
+        self.logger.info(f"Detected {len(new_files)} new audio files")
+        return self.process_new_files(new_files, complete=True)
+    
+    def process_new_files(self, new_files, complete=False):
+        """
+        Process a list of (Path, stat or None) new files concurrently
         
-        # Save processed files list
-        self.save_processed_files()
+        Args:
+            new_files: Files to process, with their scan stat if any
+            complete: The files were reported closed after writing (or moved in)
+        """
+        futures = [self.executor.submit(self.process_audio_file, file_path, pre_stat, complete)
+                   for file_path, pre_stat in new_files]
+        processed_count = sum(1 for future in as_completed(futures) if future.result())
         
         self.logger.info(f"Successfully processed {processed_count} files")
         return processed_count
@@ -278,26 +603,83 @@ class AudioFetcher:
         self.logger.info(f"Starting continuous monitoring of {self.monitor_dir} (interval: {interval}s)")
         self.logger.info("Press Ctrl+C to stop")
         
+        selector = None
         try:
+            # Initial full scan picks up files dropped before the watch was set up
+            processed = self.fetch_files_once()
+            cycles = 0
+            next_scan = time.monotonic() + interval
+            
+            if self.inotify:
+                selector = selectors.DefaultSelector()
+                selector.register(self.inotify.fileno(), selectors.EVENT_READ)
+            
             while True:
-                processed = self.fetch_files_once()
-                
                 # Show stats
-                stats = self.get_stats()
                 if processed > 0:
+                    stats = self.get_stats()
                     self.logger.info(f"Stats: {stats}")
                 
-                time.sleep(interval)
+                # Periodically fold the processed-files log into the snapshot
+                cycles += 1
+                if cycles % self.compact_interval == 0:
+                    self.save_processed_files()
+                
+                # Wait for file events (if watching) until the next safety-net rescan;
+                # the rescan deadline holds even while events keep arriving
+                timeout = max(0.0, next_scan - time.monotonic())
+                if selector:
+                    processed = 0
+                    if selector.select(timeout=timeout):
+                        processed = self.process_file_events(self.inotify.read(timeout=0))
+                else:
+                    time.sleep(timeout)
+                    processed = 0
+                
+                if time.monotonic() >= next_scan:
+                    processed += self.fetch_files_once()
+                    next_scan = time.monotonic() + interval
                 
         except KeyboardInterrupt:
             self.logger.info("Monitoring stopped by user")
         except Exception as e:
             self.logger.error(f"Error in continuous monitoring: {e}")
+        finally:
+            if selector:
+                selector.close()
+            self.save_processed_files()
+    
+    def _scan_transcripts(self):
+        """Read the transcripts directory once, returning (name, mtime) for each JSON transcript"""
+        entries = []
+        with os.scandir(self.transcripts_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.json'):
+                    try:
+                        st = fast_stat(entry.path)
+                    except OSError:
+                        continue
+                    if st is not None:
+                        entries.append((entry.name, st.st_mtime))
+        return entries
     
-    def get_stats(self):
-        """Get current statistics"""
-        monitor_files = len(list(self.monitor_dir.glob("*"))) if self.monitor_dir.exists() else 0
-        transcript_files = len(list(self.transcripts_dir.glob("*.json"))) if self.transcripts_dir.exists() else 0
+    def get_stats(self, monitor_entries=None, transcript_entries=None):
+        """Get current statistics, optionally from existing directory scans"""
+        # Counts only need names, so read the directories without stat calls
+        # unless a scan was already done
+        if monitor_entries is not None:
+            monitor_files = len(monitor_entries)
+        elif self.monitor_dir.exists():
+            monitor_files = len(os.listdir(self.monitor_dir))
+        else:
+            monitor_files = 0
+        
+        if transcript_entries is not None:
+            transcript_files = len(transcript_entries)
+        elif self.transcripts_dir.exists():
+            transcript_files = sum(1 for name in os.listdir(self.transcripts_dir) if name.endswith('.json'))
+        else:
+            transcript_files = 0
         
         return {
             'total_processed': len(self.processed_files),
@@ -310,7 +692,9 @@ class AudioFetcher:
         """Show current status"""
         print("\n=== Audio Fetcher and Processor Status ===")
         
-        stats = self.get_stats()
+        monitor_entries = self._scan_monitor() if self.monitor_dir.exists() else []
+        transcript_entries = self._scan_transcripts() if self.transcripts_dir.exists() else []
+        stats = self.get_stats(monitor_entries, transcript_entries)
         for key, value in stats.items():
             print(f"{key.replace('_', ' ').title()}: {value}")
         
@@ -319,8 +703,7 @@ class AudioFetcher:
         print(f"  {monitor_exists} Directory exists")
         
         if self.monitor_dir.exists():
-            audio_files = [f for f in self.monitor_dir.iterdir() 
-                          if f.is_file() and self.is_audio_file(f)]
+            audio_files = [name for name, _, _ in monitor_entries if name.endswith(self._audio_suffix_tuple)]
             print(f"  Audio files: {len(audio_files)}")
         
         print(f"\nTranscripts directory: {self.transcripts_dir}")
@@ -328,29 +711,25 @@ class AudioFetcher:
         print(f"  {transcripts_exist} Directory exists")
         
         if self.transcripts_dir.exists():
-            transcript_files = list(self.transcripts_dir.glob("*.json"))
-            print(f"  Transcript files: {len(transcript_files)}")
+            print(f"  Transcript files: {len(transcript_entries)}")
         
-        print(f"\nRecording Processor: {'✓ Available' if self.recording_processor else '✗ Not available'}")
+        if not self.processor_loaded:
+            print("\nRecording Processor: not loaded")
+        elif self.process_pool:
+            print(f"\nRecording Processor: ✓ {self.worker_processes} worker processes")
+        else:
+            print(f"\nRecording Processor: {'✓ Available' if self.recording_processor else '✗ Not available'}")
         print(f"Log file: {self.log_file}")
         print(f"Supported formats: {', '.join(sorted(self.audio_formats))}")
         
-        # Show recent transcripts
-        if self.transcripts_dir.exists():
-            transcript_files = sorted(
-                [f for f in self.transcripts_dir.iterdir() if f.suffix == '.json'],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
+        # Show recent transcripts (mtimes cached from the scan above)
+        if transcript_entries:
+            recent = heapq.nlargest(3, transcript_entries, key=lambda entry: entry[1])
             
-            if transcript_files:
-                print(f"\nRecent transcripts (last 3):")
-                for transcript_file in transcript_files[:3]:
-                    try:
-                        mod_time = datetime.fromtimestamp(transcript_file.stat().st_mtime)
-                        print(f"  • {transcript_file.name} ({mod_time.strftime('%Y-%m-%d %H:%M:%S')})")
-                    except:
-                        print(f"  • {transcript_file.name}")
+            print(f"\nRecent transcripts (last 3):")
+            for name, mtime in recent:
+                mod_time = datetime.fromtimestamp(mtime)
+                print(f"  • {name} ({mod_time.strftime('%Y-%m-%d %H:%M:%S')})")
 
 
 def main():
@@ -365,8 +744,8 @@ def main():
     
     args = parser.parse_args()
     
-    # Create fetcher
-    fetcher = AudioFetcher()
+    # Create fetcher (status only reads directories, so skip the recording processor)
+    fetcher = AudioFetcher(init_processor=args.mode != 'status')
     
     if args.mode == 'single':
         # Single scan
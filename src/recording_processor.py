@@ -2,13 +2,23 @@
 
 import os
 import json
+import re
 import time
 import logging
 import shutil
 from datetime import datetime
 from pathlib import Path
 import threading
-from typing import Dict, List, Optional, Tuple
+import itertools
+import functools
+import contextlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+import wave
+import io
+import hashlib
+import mmap
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Set, Tuple, Union
 import signal
 import sys
 from dotenv import load_dotenv
@@ -18,30 +28,354 @@ load_dotenv()
 
 # Audio processing
 import subprocess
+import numpy as np
+from _pcm_ops import rms_energy, silence_split_points
 
 # Google Cloud APIs for speech-to-text, translation and TTS
 from google.cloud import speech
 from google.cloud import translate_v2 as translate
 from google.cloud import texttospeech
+from google.api_core import exceptions as google_exceptions
+from google.api_core.retry import Retry, if_exception_type
 
 # Free translation alternatives
 try:
+    import requests
+    from requests.adapters import HTTPAdapter
     from deep_translator import GoogleTranslator, MyMemoryTranslator, LibreTranslator, PonsTranslator
+    from deep_translator import google as _dt_google, libre as _dt_libre, mymemory as _dt_mymemory, pons as _dt_pons
     DEEP_TRANSLATOR_AVAILABLE = True
 except ImportError:
     DEEP_TRANSLATOR_AVAILABLE = False
 
+
+class _SessionRoutedRequests:
+    """Stand-in for the requests module inside the deep-translator backends
+
+    get/post go through the session the calling thread bound with bind(), or
+    through requests itself when none is bound; every other attribute
+    (exceptions, codes, ...) is the real module's.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+    def _target(self):
+        return getattr(self._local, 'session', None) or requests
+
+    def get(self, *args, **kwargs):
+        return self._target().get(*args, **kwargs)
+
+    def post(self, *args, **kwargs):
+        return self._target().post(*args, **kwargs)
+
+    @contextlib.contextmanager
+    def bind(self, session):
+        """Route this thread's backend requests through session for the block"""
+        previous = getattr(self._local, 'session', None)
+        self._local.session = session
+        try:
+            yield
+        finally:
+            self._local.session = previous
+
+
+if DEEP_TRANSLATOR_AVAILABLE:
+    # The backends call requests.get/post per translation, with no way to pass
+    # a session; installed once, the stand-in behaves like requests until bound
+    _TRANSLATOR_REQUESTS = _SessionRoutedRequests()
+    for _backend in (_dt_google, _dt_mymemory, _dt_libre, _dt_pons):
+        _backend.requests = _TRANSLATOR_REQUESTS
+    del _backend
+
 # Language detection and translation
-from langdetect import detect, DetectorFactory
+from langdetect import DetectorFactory, LangDetectException, PROFILES_DIRECTORY
 
-# File monitoring
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+# File monitoring fallback where inotify is not available (e.g. macOS)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
 import traceback
 
+# In-process decoding/encoding through FFmpeg's libraries; the ffmpeg/ffprobe
+# command line tools are used when PyAV is not installed
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+# SIMD/multithreaded hashing for transcript cache keys; SHA-256 otherwise
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Fast JSON serialization for transcripts and TTS metadata when available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Kernel file events (Linux only); readiness checks fall back to size polling elsewhere
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
 # Set seed for consistent language detection
 DetectorFactory.seed = 0
 
+# Streaming recognition accepts about 5 minutes of audio per stream and at most
+# 25 KB of audio per request
+_STREAMING_LIMIT_SECONDS = 290
+_STREAM_REQUEST_BYTES = 16 * 1024
+
+# recognize/long_running_recognize accept at most 10 MB of inline audio content
+_INLINE_AUDIO_LIMIT_BYTES = 10 * 1024 * 1024
+
+# Demuxer and options for headerless telephony formats, keyed by extension
+_RAW_AUDIO_INPUTS = MappingProxyType({
+    '.ulaw': ('mulaw', {'sample_rate': '8000', 'ch_layout': 'mono'}),
+    '.gsm': ('gsm', {'sample_rate': '8000'}),
+})
+
+# Chunks quieter than this (16-bit RMS, about -60 dBFS) hold no speech to recognize
+_SILENT_CHUNK_RMS = 30.0
+
+# Common Hindi phrases passed as recognition hints, shared by every config
+_HINDI_PHRASES = tuple(sys.intern(phrase) for phrase in ("नमस्ते", "धन्यवाद", "कैसे हैं", "अच्छा", "ठीक है"))
+_HINDI_SPEECH_CONTEXT = speech.SpeechContext(phrases=list(_HINDI_PHRASES))
+
+# Free web translators get several chunks per request, joined with a separator
+# that survives translation (their per-request character limits below)
+_BATCH_SEPARATOR = "\n\n<<<SEP>>>\n\n"
+_FREE_GOOGLE_MAX_CHARS = 5000
+_MYMEMORY_MAX_CHARS = 500
+# Google Cloud Translation takes a list of segments in one request
+_GOOGLE_CLOUD_MAX_SEGMENTS = 128
+_GOOGLE_CLOUD_MAX_CHARS = 30000
+# Text Google Cloud translates in one request, without chunking (below its 30K limit)
+_GOOGLE_CLOUD_SINGLE_REQUEST_BYTES = 28000
+
+# Characters that end a sentence when followed by whitespace (Hindi ones included)
+_TERMINATORS = frozenset('.!?।॥|')
+# One sentence: text up to a '.', '!', '?', '।' or '॥' followed by a space, a '|'
+# (Hindi sentence endings included), or the end of the text
+_SENTENCE_RE = re.compile(r'(?:[^.!?।॥|]|[.!?।॥](?! ))*(?:[.!?।॥] |\||$)')
+# Lines and words, for text without sentence endings
+_LINE_RE = re.compile(r'[^\n]+')
+_WORD_RE = re.compile(r'\S+')
+
+# Retry TTS requests rejected for quota or load, backing off 1s, 2s, 4s... for up to a minute
+_TTS_RETRY = Retry(
+    predicate=if_exception_type(google_exceptions.ResourceExhausted, google_exceptions.ServiceUnavailable),
+    initial=1.0, maximum=16.0, multiplier=2.0, timeout=60.0
+)
+
+# Most buffers a single writev() call accepts (the POSIX minimum for IOV_MAX)
+_IOV_MAX = 1024
+
+# Google Cloud language codes (lowercase) -> standard codes
+_GOOGLE_LANG_MAP = MappingProxyType({
+    'en-us': 'en', 'en-gb': 'en', 'en-au': 'en', 'en-ca': 'en', 'en-in': 'en',
+    'hi-in': 'hi', 'bn-in': 'bn', 'te-in': 'te', 'mr-in': 'mr',
+    'ta-in': 'ta', 'gu-in': 'gu', 'ur-in': 'ur', 'kn-in': 'kn',
+    'or-in': 'or', 'pa-in': 'pa', 'as-in': 'as', 'ml-in': 'ml',
+    'es-es': 'es', 'es-mx': 'es', 'es-us': 'es',
+    'fr-fr': 'fr', 'fr-ca': 'fr',
+    'de-de': 'de', 'it-it': 'it', 'pt-br': 'pt', 'pt-pt': 'pt',
+    'ru-ru': 'ru', 'ja-jp': 'ja', 'ko-kr': 'ko',
+    'zh-cn': 'zh', 'zh-tw': 'zh', 'ar-xa': 'ar',
+    'nl-nl': 'nl', 'sv-se': 'sv'
+})
+
+# Language codes LibreTranslate accepts
+_LIBRE_LANG_MAP = MappingProxyType({
+    'hi': 'hi', 'bn': 'bn', 'es': 'es', 'fr': 'fr', 'de': 'de',
+    'it': 'it', 'pt': 'pt', 'ru': 'ru', 'ja': 'ja', 'ko': 'ko',
+    'zh': 'zh', 'ar': 'ar', 'nl': 'nl', 'sv': 'sv', 'en': 'en'
+})
+
+# PONS language mapping
+_PONS_LANG_MAP = MappingProxyType({
+    'es': 'spanish', 'fr': 'french', 'de': 'german', 'it': 'italian',
+    'pt': 'portuguese', 'ru': 'russian', 'en': 'english'
+})
+
+# Simple phrase translations for common cases (extensive Indian languages)
+_SIMPLE_TRANSLATIONS = MappingProxyType({
+    "hi": MappingProxyType({
+        "hello": "नमस्ते",
+        "hello world": "नमस्ते दुनिया",
+        "how are you": "आप कैसे हैं",
+        "thank you": "धन्यवाद",
+        "goodbye": "अलविदा",
+        "yes": "हाँ",
+        "no": "नहीं"
+    }),
+    "bn": MappingProxyType({
+        "hello": "নমস্কার",
+        "hello world": "নমস্কার পৃথিবী",
+        "how are you": "আপনি কেমন আছেন",
+        "thank you": "ধন্যবাদ",
+        "goodbye": "বিদায়"
+    }),
+    "en": MappingProxyType({
+        "hello": "hello",
+        "hello world": "hello world",
+        "how are you": "how are you",
+        "thank you": "thank you",
+        "goodbye": "goodbye"
+    })
+})
+# Translated phrase -> English phrase, built once for the reverse lookups
+_SIMPLE_TRANSLATIONS_REV = MappingProxyType({
+    lang: MappingProxyType({translated: phrase for phrase, translated in phrases.items()})
+    for lang, phrases in _SIMPLE_TRANSLATIONS.items()
+})
+# Every phrase the offline fallback can translate, in either direction
+_OFFLINE_PHRASES = frozenset(
+    phrase for phrases in _SIMPLE_TRANSLATIONS.values() for pair in phrases.items() for phrase in pair
+)
+_OFFLINE_PHRASE_MAX_LENGTH = max(map(len, _OFFLINE_PHRASES))
+
+
+# Map language codes to Google Cloud TTS voices with extensive Indian language support
+_VOICE_CONFIGS = MappingProxyType({
+    # English
+    "en": MappingProxyType({
+        "language_code": "en-US",
+        "voice_name": "en-US-Neural2-C",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+
+    # Major Indian Languages
+    "hi": MappingProxyType({
+        "language_code": "hi-IN",
+        "voice_name": "hi-IN-Neural2-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "bn": MappingProxyType({
+        "language_code": "bn-IN",
+        "voice_name": "bn-IN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "te": MappingProxyType({
+        "language_code": "te-IN",
+        "voice_name": "te-IN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "mr": MappingProxyType({
+        "language_code": "mr-IN",
+        "voice_name": "mr-IN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "ta": MappingProxyType({
+        "language_code": "ta-IN",
+        "voice_name": "ta-IN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "gu": MappingProxyType({
+        "language_code": "gu-IN",
+        "voice_name": "gu-IN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "ur": MappingProxyType({
+        "language_code": "ur-IN",
+        "voice_name": "ur-IN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "kn": MappingProxyType({
+        "language_code": "kn-IN",
+        "voice_name": "kn-IN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "ml": MappingProxyType({
+        "language_code": "ml-IN",
+        "voice_name": "ml-IN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "pa": MappingProxyType({
+        "language_code": "pa-IN",
+        "voice_name": "pa-IN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+
+    # International Languages
+    "es": MappingProxyType({
+        "language_code": "es-ES",
+        "voice_name": "es-ES-Neural2-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "fr": MappingProxyType({
+        "language_code": "fr-FR",
+        "voice_name": "fr-FR-Neural2-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "de": MappingProxyType({
+        "language_code": "de-DE",
+        "voice_name": "de-DE-Neural2-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "it": MappingProxyType({
+        "language_code": "it-IT",
+        "voice_name": "it-IT-Neural2-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "pt": MappingProxyType({
+        "language_code": "pt-BR",
+        "voice_name": "pt-BR-Neural2-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "ru": MappingProxyType({
+        "language_code": "ru-RU",
+        "voice_name": "ru-RU-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "ja": MappingProxyType({
+        "language_code": "ja-JP",
+        "voice_name": "ja-JP-Neural2-B",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "ko": MappingProxyType({
+        "language_code": "ko-KR",
+        "voice_name": "ko-KR-Neural2-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "zh": MappingProxyType({
+        "language_code": "cmn-CN",
+        "voice_name": "cmn-CN-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "ar": MappingProxyType({
+        "language_code": "ar-XA",
+        "voice_name": "ar-XA-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "nl": MappingProxyType({
+        "language_code": "nl-NL",
+        "voice_name": "nl-NL-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    }),
+    "sv": MappingProxyType({
+        "language_code": "sv-SE",
+        "voice_name": "sv-SE-Standard-A",
+        "gender": texttospeech.SsmlVoiceGender.FEMALE
+    })
+})
+
+
 class RecordingProcessorGoogle:
     """Main class for processing call recordings with Google Cloud APIs"""
     
@@ -50,8 +384,18 @@ class RecordingProcessorGoogle:
         self.setup_directories()
         self.load_configuration(config_path)
         self.setup_models()
-        self.processed_files = self.load_processed_files()
+        self.processed_files: Set[str] = self.load_processed_files()
+        # Append handle for the processed-files log, opened on first use
+        self._processed_fp = None
         self.running = False
+        self._stop_event = threading.Event()
+        self.transcript_cache_hits = 0
+        self.transcript_cache_misses = 0
+        # In-process copy of the supported language list and when it expires
+        self._supported_languages: Optional[List[Dict]] = None
+        self._supported_languages_expiry = 0.0
+        self.setup_workers()
+        self.setup_file_watcher()
         
     def setup_logging(self):
         """Setup logging configuration"""
@@ -73,9 +417,16 @@ class RecordingProcessorGoogle:
         self.raw_dir = self.recordings_dir / 'raw'
         self.converted_dir = self.recordings_dir / 'converted'
         self.transcripts_dir = self.recordings_dir / 'transcripts'
+        self.transcript_cache_dir = self.recordings_dir / '.cache' / 'transcripts'
+        self.translation_cache_dir = self.recordings_dir / '.cache' / 'translations'
+        self.tts_cache_dir = self.recordings_dir / '.cache' / 'tts'
+        self.processed_file = self.recordings_dir / 'processed_files.json'
+        # Recordings processed since the last snapshot, one path per line
+        self.processed_log = self.recordings_dir / 'processed_files.log'
         
         # Create directories if they don't exist
-        for dir_path in [self.raw_dir, self.converted_dir, self.transcripts_dir]:
+        for dir_path in [self.raw_dir, self.converted_dir, self.transcripts_dir,
+                         self.transcript_cache_dir, self.translation_cache_dir, self.tts_cache_dir]:
             dir_path.mkdir(parents=True, exist_ok=True)
             
     def load_configuration(self, config_path: str = None):
@@ -88,7 +439,11 @@ class RecordingProcessorGoogle:
                 str(self.monitor_dir),
                 str(self.recordings_dir / 'raw')
             ],
-            "processing_delay": 2  # seconds to wait before processing new files
+            "processing_delay": 2,  # seconds to wait before processing new files
+            "transcript_cache_ttl": 7 * 24 * 3600,  # seconds a cached transcript stays valid
+            "translation_cache_ttl": 72 * 3600,  # seconds a cached translation stays valid
+            "tts_cache_ttl": 30 * 24 * 3600,  # seconds synthesized audio stays valid
+            "supported_languages_ttl": 24 * 3600  # seconds before the language list is fetched again
         }
         
         if config_path and os.path.exists(config_path):
@@ -97,6 +452,8 @@ class RecordingProcessorGoogle:
                 default_config.update(user_config)
                 
         self.config = default_config
+        # Lowercase suffixes as a set, for O(1) checks on every file event
+        self.audio_formats = frozenset(fmt.lower() for fmt in self.config["audio_formats"])
         self.logger.info(f"Configuration loaded: {self.config}")
         
     def setup_models(self):
@@ -106,6 +463,8 @@ class RecordingProcessorGoogle:
         self.translate_client = None
         self.tts_client = None
         self.speech_config = None
+        self._recognize_chunk_partial = None
+        self._lrr_partial = None
         self.speech_model = 'latest_long'
         self.auto_detect = True
         self.voice_quality = 'neural2'
@@ -113,39 +472,14 @@ class RecordingProcessorGoogle:
         self.primary_language = 'hi-IN'
         self.translation_preference = ['free_google', 'mymemory', 'libretranslate', 'google_cloud', 'pons']
         
-        # Create a basic speech config first to ensure it always exists
+        # Load the language profiles once; langdetect.detect() reloads all of them per call
+        self.lang_detector_factory = None
         try:
-            self.speech_config = speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,  # Changed to WAV format
-                sample_rate_hertz=self.sample_rate,
-                language_code=self.primary_language,
-                alternative_language_codes=['en-US', 'en-IN'] if self.auto_detect else [],
-                enable_automatic_punctuation=True,
-                diarization_config=speech.SpeakerDiarizationConfig(
-                    enable_speaker_diarization=True,
-                    min_speaker_count=1,
-                    max_speaker_count=2
-                ),
-                model=self.speech_model,
-                use_enhanced=True,
-                profanity_filter=False,
-                speech_contexts=[
-                    speech.SpeechContext(
-                        phrases=[
-                            "नमस्ते", "धन्यवाद", "कैसे हैं", "अच्छा", "ठीक है"
-                        ]
-                    )
-                ]
-            )
-            self.logger.info("Basic speech config created successfully")
+            self.lang_detector_factory = DetectorFactory()
+            self.lang_detector_factory.load_profile(PROFILES_DIRECTORY)
         except Exception as e:
-            self.logger.error(f"Failed to create basic speech config: {e}")
-            # Create minimal fallback config
-            self.speech_config = speech.RecognitionConfig(
-                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                sample_rate_hertz=16000,
-                language_code='hi-IN'
-            )
+            self.logger.warning(f"Could not load language detection profiles: {e}")
+            self.lang_detector_factory = None
         
         try:
             self.logger.info("Setting up Google Cloud Speech-to-Text, Translation, and TTS APIs")
@@ -164,6 +498,10 @@ class RecordingProcessorGoogle:
             
             # Translation service preference (comma-separated) - Prioritize Google Cloud Translation API
             self.translation_preference = os.getenv('TRANSLATION_SERVICES', 'google_cloud,free_google,mymemory,libretranslate,pons').split(',')
+            # Start the second service too if the first has not succeeded within the hedge delay
+            # (set TRANSLATION_HEDGING=false to avoid paying for duplicate requests)
+            self.hedge_translations = os.getenv('TRANSLATION_HEDGING', 'true').lower() == 'true'
+            self._hedge_delay = float(os.getenv('TRANSLATION_HEDGE_DELAY', '0.4'))
             
             self.logger.info(f"Using Google Cloud Speech model: {self.speech_model}")
             self.logger.info(f"Primary language: {self.primary_language}")
@@ -174,39 +512,39 @@ class RecordingProcessorGoogle:
             # Check for deep-translator availability
             if DEEP_TRANSLATOR_AVAILABLE:
                 self.logger.info("✅ deep-translator library available - free translation services enabled")
+                self._setup_translator_session()
             else:
                 self.logger.warning("⚠️ deep-translator library not found - only Google Cloud translation available")
                 self.logger.info("Install with: pip install deep-translator")
             
-            # Update speech config with environment variables
+            # Build the speech config once the environment settings are known
+            cfg_kwargs = dict(
+                encoding=speech.RecognitionConfig.AudioEncoding.FLAC,
+                sample_rate_hertz=self.sample_rate,
+                language_code=self.primary_language,
+                alternative_language_codes=['en-US', 'en-IN'] if self.auto_detect else [],
+                enable_automatic_punctuation=True,
+                diarization_config=speech.SpeakerDiarizationConfig(
+                    enable_speaker_diarization=True,
+                    min_speaker_count=1,
+                    max_speaker_count=2
+                ),
+                model=self.speech_model,
+                use_enhanced=True,  # Use enhanced model for better accuracy
+                profanity_filter=False,
+                speech_contexts=[_HINDI_SPEECH_CONTEXT]
+            )
             try:
+                self.speech_config = speech.RecognitionConfig(**cfg_kwargs)
+                self.logger.info("Speech config created with environment settings")
+            except Exception as e:
+                self.logger.error(f"Failed to create speech config: {e}")
+                # Create minimal fallback config
                 self.speech_config = speech.RecognitionConfig(
-                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,  # WAV format
+                    encoding=speech.RecognitionConfig.AudioEncoding.FLAC,
                     sample_rate_hertz=self.sample_rate,
-                    language_code=self.primary_language,
-                    alternative_language_codes=['en-US', 'en-IN'] if self.auto_detect else [],
-                    enable_automatic_punctuation=True,
-                    diarization_config=speech.SpeakerDiarizationConfig(
-                        enable_speaker_diarization=True,
-                        min_speaker_count=1,
-                        max_speaker_count=2
-                    ),
-                    model=self.speech_model,
-                    use_enhanced=True,  # Use enhanced model for better accuracy
-                    profanity_filter=False,
-                    speech_contexts=[
-                        speech.SpeechContext(
-                            phrases=[
-                                # Add common Hindi phrases for better recognition
-                                "नमस्ते", "धन्यवाद", "कैसे हैं", "अच्छा", "ठीक है"
-                            ]
-                        )
-                    ]
+                    language_code=self.primary_language
                 )
-                self.logger.info("Updated speech config with environment variables")
-            except Exception as e:
-                self.logger.warning(f"Failed to update speech config with environment variables: {e}")
-                self.logger.info("Using basic speech config")
             
             # Setup Google Cloud Authentication
             if google_api_key:
@@ -229,6 +567,7 @@ class RecordingProcessorGoogle:
                 self.translate_client = translate.Client()
                 self.tts_client = texttospeech.TextToSpeechClient()
                 self.logger.info("Google Cloud Speech-to-Text, Translation and TTS initialized successfully")
+                self._bind_recognizers()
             except Exception as e:
                 self.logger.error(f"Google Cloud services initialization failed: {e}")
                 self.speech_client = None
@@ -256,6 +595,155 @@ class RecordingProcessorGoogle:
             
             return False
     
+    def _setup_translator_session(self):
+        """Create the pooled session the deep-translator backends use during this processor's calls"""
+        # Plain requests.get/post open a new connection (and TLS handshake) per
+        # translation; a Session keeps them alive
+        pool_size = max(16, int(os.getenv('TRANSLATE_CONCURRENCY', '8')))
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+    
+    def setup_workers(self):
+        """Create the pool that processes recordings concurrently"""
+        self.worker_concurrency = max(1, int(os.getenv('WORKER_CONCURRENCY', '4')))
+        # Created on first use, so processors used only for translation or TTS start no threads
+        self._worker_pool: Optional[ThreadPoolExecutor] = None
+        self._worker_pool_lock = threading.Lock()
+        # Guards processed_files and its log, which workers update concurrently
+        self._processed_lock = threading.Lock()
+        # Compact the processed-files log into the JSON snapshot every N new entries
+        self.compact_interval = 100
+        self._log_entries = 0
+        self.logger.info(f"Processing up to {self.worker_concurrency} recordings concurrently")
+        
+        # Chunks are translated in parallel, with each service limited to
+        # translate_concurrency requests in flight across all recordings
+        self.translate_concurrency = max(1, int(os.getenv('TRANSLATE_CONCURRENCY', '8')))
+        self._translation_semaphores = {
+            name: threading.Semaphore(self.translate_concurrency)
+            for name in ('_translate_with_google_cloud', '_translate_with_free_google', '_translate_with_mymemory',
+                         '_translate_with_libre', '_translate_with_pons')
+        }
+        
+        # TTS requests in flight across all recordings, kept under the per-project quota
+        self._tts_semaphore = threading.Semaphore(max(1, int(os.getenv('TTS_CONCURRENCY', '8'))))
+    
+    @property
+    def worker_pool(self) -> ThreadPoolExecutor:
+        """The pool that processes recordings, created on first use"""
+        if self._worker_pool is None:
+            with self._worker_pool_lock:
+                if self._worker_pool is None:
+                    self._worker_pool = ThreadPoolExecutor(max_workers=self.worker_concurrency,
+                                                           thread_name_prefix="RecordingWorker")
+        return self._worker_pool
+    
+    def _bind_recognizers(self):
+        """Bind the recognition configs to the client calls once, for reuse by every request"""
+        # Chunks are cut as PCM samples, so they go up as LINEAR16 WAV
+        chunk_config = speech.RecognitionConfig.deserialize(
+            speech.RecognitionConfig.serialize(self.speech_config)
+        )
+        chunk_config.encoding = speech.RecognitionConfig.AudioEncoding.LINEAR16
+        
+        self._recognize_chunk_partial = functools.partial(self.speech_client.recognize, config=chunk_config)
+        self._lrr_partial = functools.partial(self.speech_client.long_running_recognize, config=self.speech_config)
+    
+    def setup_file_watcher(self):
+        """Set up the state shared by the file watcher and the readiness checks"""
+        self.inotify = None
+        self.watch_dirs: Dict[int, Path] = {}
+        # Files currently waited on by is_file_ready -> event set when the file is closed
+        self._ready_events: Dict[Path, threading.Event] = {}
+        # Recordings reported closed -> time of the event, for files dispatched to processing
+        self._closed_at: Dict[Path, float] = {}
+        # Recordings submitted for processing by the watcher or the startup scan
+        self._in_flight: Set[Path] = set()
+        self._ready_lock = threading.Lock()
+    
+    def start_file_watcher(self):
+        """Watch the monitoring directories for files closed after writing (or moved in)"""
+        if self.inotify is not None:
+            return
+        if not INOTIFY_AVAILABLE:
+            self.logger.info("inotify not available, file readiness uses size polling")
+            return
+        
+        try:
+            self.inotify = INotify()
+            for monitor_dir in self.config["monitoring_directories"]:
+                monitor_path = Path(monitor_dir)
+                if monitor_path.exists():
+                    wd = self.inotify.add_watch(monitor_path, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO)
+                    self.watch_dirs[wd] = monitor_path
+        except OSError as e:
+            self.logger.warning(f"Could not set up inotify watches, file readiness uses size polling: {e}")
+            self.inotify = None
+            self.watch_dirs = {}
+            return
+        
+        watcher = threading.Thread(target=self._watch_files, name="RecordingWatcher", daemon=True)
+        watcher.start()
+        self.logger.info(f"Watching {len(self.watch_dirs)} directories for completed recordings")
+    
+    def _watch_files(self):
+        """Background thread dispatching inotify events to waiting readiness checks"""
+        while True:
+            try:
+                events = self.inotify.read()
+            except OSError as e:
+                self.logger.error(f"inotify watcher stopped: {e}")
+                return
+            
+            for event in events:
+                directory = self.watch_dirs.get(event.wd)
+                if directory is None or not event.name:
+                    continue
+                self._on_file_closed(directory / event.name)
+    
+    def _on_file_closed(self, file_path: Path):
+        """Handle a file that was closed after writing or moved into a watched directory"""
+        with self._ready_lock:
+            ready = self._ready_events.get(file_path)
+            if ready is not None:
+                ready.set()
+                return
+            
+            if file_path in self._in_flight:
+                # Already queued (e.g. by the startup scan); let its readiness
+                # check know the file has been closed
+                self._closed_at[file_path] = time.time()
+                return
+            
+            # While monitoring, the same watcher replaces a per-directory Observer
+            if (not self.running or
+                file_path.suffix.lower() not in self.audio_formats or
+                str(file_path) in self.processed_files):
+                return
+            self._closed_at[file_path] = time.time()
+            self._in_flight.add(file_path)
+        
+        self.logger.info(f"New audio file detected: {file_path.name}")
+        self.worker_pool.submit(self.process_new_file, file_path)
+    
+    def process_new_file(self, file_path: Path):
+        """Process a newly detected recording and record it as processed"""
+        try:
+            if not file_path.exists():
+                return
+            # process_recording waits for the file to be ready first
+            result = self.process_recording(file_path)
+            if result["success"]:
+                self.mark_processed(file_path)
+        except Exception as e:
+            self.logger.error(f"Error processing new file {file_path.name}: {e}")
+        finally:
+            with self._ready_lock:
+                self._closed_at.pop(file_path, None)
+                self._in_flight.discard(file_path)
+    
     def is_file_ready(self, filepath: Path, stability_time: int = 5, max_wait: int = 120) -> bool:
         """
         Check if file is ready for processing by ensuring it's stable (not being written to)
@@ -280,7 +768,10 @@ class RecordingProcessorGoogle:
                 self.logger.info(f"Found completion marker for {filepath.name}")
                 return True
             
-            # Fall back to file size stability check
+            if self.inotify is not None and filepath.parent in self.watch_dirs.values():
+                return self._wait_for_close_write(filepath, completion_marker, stability_time, max_wait)
+            
+            # Fall back to file size stability check (unwatched or network directories)
             # Initial file size
             initial_size = filepath.stat().st_size
             last_size = initial_size
@@ -326,87 +817,200 @@ class RecordingProcessorGoogle:
         except Exception as e:
             self.logger.error(f"Error checking file readiness for {filepath}: {e}")
             return False
+    
+    def _wait_for_close_write(self, filepath: Path, completion_marker: Path, stability_time: int, max_wait: int) -> bool:
+        """
+        Wait for the watcher to report the file closed after writing.
+        
+        The file may have been closed before the wait was registered, so a file whose
+        size and mtime do not change for stability_time seconds also counts as ready.
+        """
+        ready = threading.Event()
+        with self._ready_lock:
+            self._ready_events[filepath] = ready
+        
+        try:
+            st = filepath.stat()
+            with self._ready_lock:
+                closed_at = self._closed_at.get(filepath)
+            if closed_at is not None and st.st_mtime <= closed_at:
+                self.logger.info(f"File {filepath.name} was closed after its last write")
+                return True
+            if time.time() - st.st_mtime >= stability_time:
+                self.logger.info(f"File {filepath.name} is stable (not modified for {stability_time}s)")
+                return True
+            
+            last_state = (st.st_size, st.st_mtime)
+            start = time.monotonic()
+            deadline = start + max_wait
+            
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                
+                if ready.wait(timeout=min(stability_time, remaining)):
+                    self.logger.info(f"File {filepath.name} was closed after writing ({time.monotonic() - start:.1f}s)")
+                    return True
+                
+                if completion_marker.exists():
+                    self.logger.info(f"Completion marker appeared for {filepath.name}")
+                    return True
+                
+                try:
+                    st = filepath.stat()
+                except OSError:
+                    self.logger.warning(f"File {filepath.name} became inaccessible")
+                    return False
+                
+                state = (st.st_size, st.st_mtime)
+                if state == last_state:
+                    self.logger.info(f"File {filepath.name} is stable ({st.st_size} bytes) after {time.monotonic() - start:.1f}s")
+                    return True
+                last_state = state
+            
+            self.logger.warning(f"File {filepath.name} was not closed within {max_wait}s")
+            return False
+        finally:
+            with self._ready_lock:
+                self._ready_events.pop(filepath, None)
             
-    def load_processed_files(self) -> List[str]:
-        """Load list of already processed files"""
-        processed_file_path = self.recordings_dir / 'processed_files.json'
-        if processed_file_path.exists():
+    def load_processed_files(self) -> Set[str]:
+        """Load already processed files from the JSON snapshot plus the append-only log"""
+        processed_files = set()
+        if self.processed_file.exists():
             try:
-                with open(processed_file_path, 'r') as f:
-                    return json.load(f)
+                with open(self.processed_file, 'r') as f:
+                    data = json.load(f)
+                # The audio fetcher stores {"files": [...]} in the same file
+                processed_files.update(data.get('files', []) if isinstance(data, dict) else data)
             except Exception as e:
                 self.logger.error(f"Error loading processed files: {e}")
-        return []
+        if self.processed_log.exists():
+            try:
+                with open(self.processed_log, 'r', encoding='utf-8') as f:
+                    processed_files.update(line.rstrip('\n') for line in f if line.strip())
+            except Exception as e:
+                self.logger.error(f"Error loading processed files log: {e}")
+        return processed_files
+        
+    def mark_processed(self, file_path: Path):
+        """Add a recording to the processed set and append it to the processed-files log"""
+        with self._processed_lock:
+            self.processed_files.add(str(file_path))
+            try:
+                if self._processed_fp is None:
+                    self._processed_fp = open(self.processed_log, 'a', encoding='utf-8')
+                self._processed_fp.write(f"{file_path}\n")
+                self._processed_fp.flush()
+            except Exception as e:
+                self.logger.error(f"Error appending to processed files log: {e}")
+            self._log_entries += 1
+            compact = self._log_entries >= self.compact_interval
+        # The snapshot is otherwise only rewritten at shutdown and after the
+        # startup scan, so a long-running monitor folds its log in periodically
+        if compact:
+            self.save_processed_files()
         
     def save_processed_files(self):
-        """Save list of processed files"""
-        processed_file_path = self.recordings_dir / 'processed_files.json'
+        """
+        Compact the processed set into the JSON snapshot and truncate the log.
+        
+        The snapshot is written to a temporary file, fsynced and renamed over the old
+        one, so a crash leaves either the previous or the new snapshot (plus the log).
+        """
         try:
-            with open(processed_file_path, 'w') as f:
-                json.dump(self.processed_files, f, indent=2)
+            with self._processed_lock:
+                tmp_path = self.processed_file.with_suffix('.json.tmp')
+                with open(tmp_path, 'w') as f:
+                    json.dump(sorted(self.processed_files), f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.processed_file)
+                
+                # Persist the rename before the log it supersedes is truncated
+                dir_fd = os.open(self.recordings_dir, os.O_RDONLY)
+                try:
+                    os.fsync(dir_fd)
+                finally:
+                    os.close(dir_fd)
+                if self._processed_fp is not None:
+                    self._processed_fp.truncate(0)
+                else:
+                    open(self.processed_log, 'w').close()
+                self._log_entries = 0
         except Exception as e:
             self.logger.error(f"Error saving processed files: {e}")
             
     def convert_audio_to_wav(self, input_path: Path) -> Path:
-        """Convert audio file to WAV format for Google Cloud Speech recognition"""
+        """Convert audio file to 16 kHz mono FLAC for Google Cloud Speech recognition (half the bytes of PCM WAV)"""
         try:
             # Output path
-            output_path = self.converted_dir / f"{input_path.stem}.wav"
+            output_path = self.converted_dir / f"{input_path.stem}.flac"
+            
+            if AV_AVAILABLE:
+                try:
+                    self._convert_audio_in_process(input_path, output_path)
+                    self.logger.info(f"Converted {input_path.name} to FLAC format")
+                    return output_path
+                except Exception as e:
+                    self.logger.warning(f"In-process conversion of {input_path.name} failed, using ffmpeg: {e}")
             
             # Determine ffmpeg input format based on file extension
             file_ext = input_path.suffix.lower()
             
             if file_ext == '.ulaw':
                 cmd = [
-                    'ffmpeg', '-y',
+                    'ffmpeg', '-y', '-loglevel', 'error', '-nostats',
                     '-f', 'mulaw', '-ar', '8000', '-ac', '1',
                     '-i', str(input_path),
                     '-ar', str(self.sample_rate),
                     '-ac', '1',
-                    '-acodec', 'pcm_s16le',
+                    '-c:a', 'flac', '-compression_level', '5',
                     str(output_path)
                 ]
             elif file_ext == '.gsm':
                 cmd = [
-                    'ffmpeg', '-y',
+                    'ffmpeg', '-y', '-loglevel', 'error', '-nostats',
                     '-f', 'gsm', '-ar', '8000',
                     '-i', str(input_path),
                     '-ar', str(self.sample_rate),
                     '-ac', '1',
-                    '-acodec', 'pcm_s16le',
+                    '-c:a', 'flac', '-compression_level', '5',
                     str(output_path)
                 ]
             elif file_ext in ['.wav']:
-                # Already WAV, just ensure proper settings
+                # Resample/downmix WAV to the recognition settings
                 cmd = [
-                    'ffmpeg', '-y',
+                    'ffmpeg', '-y', '-loglevel', 'error', '-nostats',
                     '-i', str(input_path),
                     '-ar', str(self.sample_rate),
                     '-ac', '1',
-                    '-acodec', 'pcm_s16le',
+                    '-c:a', 'flac', '-compression_level', '5',
                     str(output_path)
                 ]
             else:
                 # For other formats (mp3, flac, etc.)
                 cmd = [
-                    'ffmpeg', '-y',
+                    'ffmpeg', '-y', '-loglevel', 'error', '-nostats',
                     '-i', str(input_path),
                     '-ar', str(self.sample_rate),
                     '-ac', '1',
-                    '-acodec', 'pcm_s16le',
+                    '-c:a', 'flac', '-compression_level', '5',
                     str(output_path)
                 ]
             
-            # Run ffmpeg conversion
+            # Run ffmpeg conversion; only errors are logged, so stderr stays small
             result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
                 timeout=300  # 5 minutes for longer recordings
             )
             
             if result.returncode == 0:
-                self.logger.info(f"Converted {input_path.name} to WAV format")
+                self.logger.info(f"Converted {input_path.name} to FLAC format")
                 return output_path
             else:
                 raise RuntimeError(f"ffmpeg failed: {result.stderr}")
@@ -415,10 +1019,122 @@ class RecordingProcessorGoogle:
             self.logger.error(f"Timeout converting {input_path.name}")
             raise
         except Exception as e:
-            self.logger.error(f"Error converting {input_path.name} to WAV: {e}")
+            self.logger.error(f"Error converting {input_path.name} to FLAC: {e}")
             raise
             
+    def _convert_audio_in_process(self, input_path: Path, output_path: Path):
+        """Decode, resample and FLAC-encode audio with PyAV, without spawning ffmpeg"""
+        input_format, input_options = _RAW_AUDIO_INPUTS.get(input_path.suffix.lower(), (None, None))
+        resampler = av.AudioResampler(format='s16', layout='mono', rate=self.sample_rate)
+        
+        with av.open(str(input_path), format=input_format, options=input_options) as source, \
+                av.open(str(output_path), 'w', format='flac') as output:
+            stream = output.add_stream('flac', rate=self.sample_rate, options={'compression_level': '5'})
+            stream.layout = 'mono'
+            stream.format = 's16'
+            
+            def encode(frames):
+                for frame in frames:
+                    for packet in stream.encode(frame):
+                        output.mux(packet)
+            
+            for frame in source.decode(audio=0):
+                encode(resampler.resample(frame))
+            # Flush the resampler, then the encoder
+            encode(resampler.resample(None))
+            for packet in stream.encode(None):
+                output.mux(packet)
+    
     def transcribe_audio(self, audio_path: Path) -> Dict:
+        """Transcribe audio file to text, reusing the cached result if the same audio was recognized before"""
+        cache_key = None
+        try:
+            cache_key = self._transcript_cache_key(audio_path)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Could not hash {audio_path.name} for the transcript cache: {e}")
+        
+        if cache_key:
+            cached = self._load_cache_entry(self.transcript_cache_dir, cache_key, self.config["transcript_cache_ttl"])
+            if cached is not None:
+                self.transcript_cache_hits += 1
+                self.logger.info(f"Transcript cache hit for {audio_path.name} ({self._transcript_cache_stats()})")
+                return cached
+            self.transcript_cache_misses += 1
+        
+        result = self._transcribe_audio_uncached(audio_path)
+        
+        # Only successful transcripts are cached; failures are retried next time
+        if cache_key and result.get("transcript") and "error" not in result:
+            self._save_cache_entry(self.transcript_cache_dir, cache_key, result)
+        return result
+    
+    def _transcript_cache_key(self, audio_path: Path) -> Optional[str]:
+        """
+        Hash the audio content and the recognition settings that affect the transcript.
+        
+        Returns:
+            Optional[str]: BLAKE3 (or SHA-256) hex digest, or None for an empty file
+        """
+        with open(audio_path, 'rb') as audio_file:
+            if os.fstat(audio_file.fileno()).st_size == 0:
+                return None
+            # Hash through mmap so the recording is not copied onto the Python heap
+            with mmap.mmap(audio_file.fileno(), 0, access=mmap.ACCESS_READ) as audio_map:
+                if BLAKE3_AVAILABLE:
+                    digest = blake3.blake3(audio_map, max_threads=blake3.blake3.AUTO)
+                else:
+                    digest = hashlib.sha256(audio_map)
+        digest.update(f"|{self.speech_model}|{self.primary_language}|{self.auto_detect}".encode())
+        return digest.hexdigest()
+    
+    def _load_cache_entry(self, cache_dir: Path, cache_key: str, ttl: float) -> Optional[Dict]:
+        """Return the cached result for a key, or None if missing or older than ttl seconds"""
+        cache_path = cache_dir / f"{cache_key}.json"
+        try:
+            if time.time() - cache_path.stat().st_mtime > ttl:
+                return None
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable cache entry {cache_path}: {e}")
+            return None
+    
+    def _save_cache_entry(self, cache_dir: Path, cache_key: str, result: Dict):
+        """Persist a result under its cache key"""
+        cache_path = cache_dir / f"{cache_key}.json"
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write cache entry {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _write_json(path: Path, data: Dict):
+        """
+        Write data as indented UTF-8 JSON, encoded with orjson when it is installed.
+        
+        orjson encodes straight to a single bytes object. Without it, json.dump
+        streams the encoder's pieces to the file, so a long transcript is never
+        held as a second full-size string plus its encoded copy.
+        """
+        if ORJSON_AVAILABLE:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+    
+    def _transcript_cache_stats(self) -> str:
+        """Describe the transcript cache hit rate for log messages"""
+        lookups = self.transcript_cache_hits + self.transcript_cache_misses
+        return f"{self.transcript_cache_hits}/{lookups} lookups hit, {self.transcript_cache_hits / lookups:.0%}"
+    
+    def _transcribe_audio_uncached(self, audio_path: Path) -> Dict:
         """Transcribe audio file to text using Google Cloud Speech-to-Text with Hindi support"""
         try:
             self.logger.info(f"Transcribing audio with Google Cloud Speech-to-Text: {audio_path.name}")
@@ -439,34 +1155,25 @@ class RecordingProcessorGoogle:
             duration = self._get_audio_duration(audio_path)
             self.logger.info(f"Audio duration: {duration:.2f} seconds")
             
-            # Read audio file
-            with open(audio_path, 'rb') as audio_file:
-                audio_content = audio_file.read()
-            
-            # Create audio object
-            audio = speech.RecognitionAudio(content=audio_content)
-            
-            # Choose recognition method based on duration
-            if duration <= 60:
-                # Use synchronous recognition for shorter audio
-                self.logger.info("Using synchronous recognition (audio <= 60 seconds)")
-                response = self.speech_client.recognize(
-                    config=self.speech_config,
-                    audio=audio
-                )
-                results = response.results
+            if duration <= _STREAMING_LIMIT_SECONDS:
+                # Stream the file from disk instead of uploading it whole
+                self.logger.info(f"Using streaming recognition (audio <= {_STREAMING_LIMIT_SECONDS} seconds)")
+                results = self._streaming_recognize(audio_path)
+                
+            elif file_size > _INLINE_AUDIO_LIMIT_BYTES:
+                # The API rejects larger inline audio; go straight to chunks instead of
+                # reading the whole file into memory for a request that would fail
+                self.logger.info(f"Audio exceeds the {_INLINE_AUDIO_LIMIT_BYTES // (1024*1024)} MB inline limit, transcribing in chunks")
+                return self._transcribe_audio_chunked(audio_path, duration)
                 
             else:
                 # Use asynchronous long-running recognition for longer audio
-                self.logger.info("Using asynchronous long-running recognition (audio > 60 seconds)")
+                self.logger.info(f"Using asynchronous long-running recognition (audio > {_STREAMING_LIMIT_SECONDS} seconds)")
                 
                 # For long audio, we need to upload to Google Cloud Storage or use streaming
                 # For now, we'll try with the content method but may need to implement GCS upload
                 try:
-                    operation = self.speech_client.long_running_recognize(
-                        config=self.speech_config,
-                        audio=audio
-                    )
+                    operation = self._lrr_partial(audio=self._read_recognition_audio(audio_path))
                     
                     self.logger.info("Waiting for long-running recognition to complete...")
                     response = operation.result(timeout=600)  # 10 minute timeout
@@ -550,8 +1257,49 @@ class RecordingProcessorGoogle:
                 "error": str(e)
             }
     
+    def _read_recognition_audio(self, audio_path: Path) -> "speech.RecognitionAudio":
+        """Read a whole audio file into a RecognitionAudio for recognize/long_running_recognize"""
+        with open(audio_path, 'rb') as audio_file:
+            return speech.RecognitionAudio(content=audio_file.read())
+    
+    def _streaming_recognize(self, audio_path: Path) -> list:
+        """
+        Recognize a FLAC file with StreamingRecognize, reading it in small blocks.
+        
+        Returns:
+            list: Final recognition results, in order
+        """
+        streaming_config = speech.StreamingRecognitionConfig(config=self.speech_config, interim_results=False)
+        
+        with open(audio_path, 'rb') as audio_file:
+            def requests():
+                # The FLAC stream is sent as-is, header first
+                while True:
+                    block = audio_file.read(_STREAM_REQUEST_BYTES)
+                    if not block:
+                        return
+                    yield speech.StreamingRecognizeRequest(audio_content=block)
+            
+            responses = self.speech_client.streaming_recognize(streaming_config, requests())
+            return [result for response in responses for result in response.results if result.is_final]
+    
     def _get_audio_duration(self, audio_path: Path) -> float:
-        """Get audio duration in seconds using ffprobe"""
+        """Get audio duration in seconds, from the file header, with PyAV or using ffprobe"""
+        try:
+            duration = self._read_header_duration(audio_path)
+            if duration is not None:
+                return duration
+        except OSError as e:
+            self.logger.warning(f"Could not read header of {audio_path.name}: {e}")
+        
+        if AV_AVAILABLE:
+            try:
+                with av.open(str(audio_path)) as container:
+                    if container.duration is not None:
+                        return container.duration / av.time_base
+            except Exception as e:
+                self.logger.warning(f"Could not read duration of {audio_path.name} in process: {e}")
+        
         try:
             cmd = [
                 'ffprobe', '-v', 'quiet', '-show_entries', 'format=duration',
@@ -570,85 +1318,91 @@ class RecordingProcessorGoogle:
             self.logger.warning(f"Error getting audio duration: {e}, assuming 60 seconds")
             return 60.0
     
+    @staticmethod
+    def _read_header_duration(audio_path: Path) -> Optional[float]:
+        """
+        Read the duration of a FLAC or PCM WAV file from its header.
+        
+        Returns:
+            Optional[float]: Duration in seconds, or None if the file is neither or
+            the header does not record the length
+        """
+        with open(audio_path, 'rb') as f:
+            magic = f.read(4)
+            
+            if magic == b'fLaC':
+                # STREAMINFO is always the first metadata block; after the 4-byte
+                # block header and 10 bytes of block/frame sizes come 20 bits of
+                # sample rate, 3 of channels, 5 of bits per sample, 36 of total samples
+                block = f.read(4 + 18)
+                if len(block) < 22 or block[0] & 0x7F != 0:
+                    return None
+                packed = int.from_bytes(block[14:22], 'big')
+                sample_rate = packed >> 44
+                total_samples = packed & 0xFFFFFFFFF
+                if not sample_rate or not total_samples:
+                    return None
+                return total_samples / sample_rate
+            
+            if magic != b'RIFF' or f.read(8)[4:] != b'WAVE':
+                return None
+            # Walk the chunks; ffmpeg puts a LIST chunk before 'data', so the
+            # header is not always 44 bytes
+            byte_rate = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                chunk_id, chunk_size = header[:4], int.from_bytes(header[4:], 'little')
+                if chunk_id == b'fmt ':
+                    fmt = f.read(chunk_size + (chunk_size & 1))
+                    if len(fmt) < 16 or int.from_bytes(fmt[0:2], 'little') not in (1, 0xFFFE):
+                        return None
+                    byte_rate = int.from_bytes(fmt[8:12], 'little')
+                elif chunk_id == b'data':
+                    if not byte_rate:
+                        return None
+                    # Streamed WAVs leave the size unset; use the rest of the file
+                    data_start = f.tell()
+                    data_end = f.seek(0, os.SEEK_END)
+                    if chunk_size in (0, 0xFFFFFFFF) or data_start + chunk_size > data_end:
+                        chunk_size = data_end - data_start
+                    return chunk_size / byte_rate
+                else:
+                    f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    
     def _transcribe_audio_chunked(self, audio_path: Path, duration: float) -> Dict:
         """Transcribe long audio by splitting into chunks"""
         try:
             self.logger.info(f"Transcribing audio in chunks: {audio_path.name}")
             
-            # Split audio into 50-second chunks with 5-second overlap
-            chunk_duration = 50
-            overlap = 5
-            chunks = []
-            
-            current_start = 0
-            chunk_index = 0
-            
-            while current_start < duration:
-                chunk_end = min(current_start + chunk_duration, duration)
-                
-                # Create chunk file
-                chunk_path = self.converted_dir / f"{audio_path.stem}_chunk_{chunk_index:03d}.wav"
-                
-                cmd = [
-                    'ffmpeg', '-y',
-                    '-i', str(audio_path),
-                    '-ss', str(current_start),
-                    '-t', str(chunk_end - current_start),
-                    '-acodec', 'pcm_s16le',
-                    str(chunk_path)
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-                
-                if result.returncode == 0:
-                    chunks.append(chunk_path)
-                    self.logger.info(f"Created chunk {chunk_index}: {current_start:.1f}s - {chunk_end:.1f}s")
-                else:
-                    self.logger.error(f"Failed to create chunk {chunk_index}")
-                
-                chunk_index += 1
-                current_start += chunk_duration - overlap
+            # Split audio into chunks of at most 50 seconds, cut at the quietest
+            # point of their last 10 seconds
+            chunks = self._split_audio_chunks(audio_path, max_chunk_seconds=50, search_seconds=10)
             
-            # Transcribe each chunk
+            # Transcribe up to TRANSCRIBE_CONCURRENCY chunks at a time; map() keeps
+            # the results in chunk order
             all_transcripts = []
             total_confidence = 0.0
             confidence_count = 0
             
-            for i, chunk_path in enumerate(chunks):
-                try:
-                    with open(chunk_path, 'rb') as audio_file:
-                        audio_content = audio_file.read()
-                    
-                    audio = speech.RecognitionAudio(content=audio_content)
-                    
-                    response = self.speech_client.recognize(
-                        config=self.speech_config,
-                        audio=audio
-                    )
-                    
-                    if response.results:
-                        for result in response.results:
-                            if result.alternatives:
-                                best_alternative = result.alternatives[0]
-                                all_transcripts.append(best_alternative.transcript)
-                                
-                                if best_alternative.confidence:
-                                    total_confidence += best_alternative.confidence
-                                    confidence_count += 1
-                    
-                    self.logger.info(f"Transcribed chunk {i+1}/{len(chunks)}")
-                    
-                    # Clean up chunk file
-                    chunk_path.unlink()
-                    
-                except Exception as e:
-                    self.logger.error(f"Error transcribing chunk {i}: {e}")
+            max_workers = max(1, min(int(os.getenv('TRANSCRIBE_CONCURRENCY', '4')), len(chunks)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="TranscribeChunk") as executor:
+                chunk_results = executor.map(
+                    self._recognize_chunk, range(len(chunks)), chunks, itertools.repeat(len(chunks))
+                )
+                for transcripts, confidences in chunk_results:
+                    all_transcripts.extend(transcripts)
+                    total_confidence += sum(confidences)
+                    confidence_count += len(confidences)
             
             # Combine results
             full_transcript = " ".join(all_transcripts).strip()
             average_confidence = total_confidence / confidence_count if confidence_count > 0 else 0.8
             
-            normalized_language = self._normalize_language_code(self.primary_language)
+            # Chunk results carry no language code; detect it from the text
+            detected_language = self._detect_language(full_transcript) if self.auto_detect else None
+            normalized_language = detected_language or self._normalize_language_code(self.primary_language)
             
             return {
                 "transcript": full_transcript,
@@ -667,32 +1421,121 @@ class RecordingProcessorGoogle:
                 "error": str(e)
             }
             
-    def _normalize_language_code(self, lang_code: str) -> str:
-        """Normalize language codes from Google Cloud to standard format"""
-        # Map Google Cloud language codes to standard codes
-        google_language_mapping = {
-            'en-us': 'en', 'en-gb': 'en', 'en-au': 'en', 'en-ca': 'en', 'en-in': 'en',
-            'hi-in': 'hi', 'bn-in': 'bn', 'te-in': 'te', 'mr-in': 'mr',
-            'ta-in': 'ta', 'gu-in': 'gu', 'ur-in': 'ur', 'kn-in': 'kn',
-            'or-in': 'or', 'pa-in': 'pa', 'as-in': 'as', 'ml-in': 'ml',
-            'es-es': 'es', 'es-mx': 'es', 'es-us': 'es',
-            'fr-fr': 'fr', 'fr-ca': 'fr',
-            'de-de': 'de', 'it-it': 'it', 'pt-br': 'pt', 'pt-pt': 'pt',
-            'ru-ru': 'ru', 'ja-jp': 'ja', 'ko-kr': 'ko',
-            'zh-cn': 'zh', 'zh-tw': 'zh', 'ar-xa': 'ar',
-            'nl-nl': 'nl', 'sv-se': 'sv'
-        }
-        
-        normalized = google_language_mapping.get(lang_code.lower(), lang_code.lower())
-        # Extract base language code if it contains region info
-        if '-' in normalized:
-            normalized = normalized.split('-')[0]
-        return normalized
+    def _recognize_chunk(self, index: int, audio_content: bytes, total: int) -> Tuple[List[str], List[float]]:
+        """Recognize one chunk, returning its transcripts and non-zero confidences"""
+        transcripts = []
+        confidences = []
+        try:
+            audio = speech.RecognitionAudio(content=audio_content)
             
+            response = self._recognize_chunk_partial(audio=audio)
+            
+            for result in response.results:
+                if result.alternatives:
+                    best_alternative = result.alternatives[0]
+                    transcripts.append(best_alternative.transcript)
+                    
+                    if best_alternative.confidence:
+                        confidences.append(best_alternative.confidence)
+            
+            self.logger.info(f"Transcribed chunk {index+1}/{total}")
+            
+        except Exception as e:
+            self.logger.error(f"Error transcribing chunk {index}: {e}")
+        
+        return transcripts, confidences
+    
+    def _split_audio_chunks(self, audio_path: Path, max_chunk_seconds: float, search_seconds: float) -> List[bytes]:
+        """
+        Split audio into WAV chunks cut at silences.
+        
+        Each chunk ends at the quietest 100 ms frame within the last search_seconds
+        before max_chunk_seconds, so words are not cut in half. Chunks without any
+        signal are dropped.
+        
+        Returns:
+            List[bytes]: In-memory 16-bit mono WAV files, in order
+        """
+        samples = self._decode_pcm(audio_path)
+        cuts = silence_split_points(samples, self.sample_rate, max_chunk_seconds, search_seconds)
+        
+        chunks = []
+        for chunk_samples in np.split(samples, cuts):
+            if rms_energy(chunk_samples) < _SILENT_CHUNK_RMS:
+                continue
+            buffer = io.BytesIO()
+            with wave.open(buffer, 'wb') as chunk:
+                chunk.setnchannels(1)
+                chunk.setsampwidth(2)
+                chunk.setframerate(self.sample_rate)
+                chunk.writeframes(chunk_samples.tobytes())
+            chunks.append(buffer.getvalue())
+        
+        self.logger.info(f"Split {audio_path.name} into {len(chunks)} chunks")
+        return chunks
+    
+    def _decode_pcm(self, audio_path: Path) -> np.ndarray:
+        """Decode audio to mono 16-bit PCM samples at the recognition sample rate"""
+        if AV_AVAILABLE:
+            try:
+                resampler = av.AudioResampler(format='s16', layout='mono', rate=self.sample_rate)
+                blocks = []
+                with av.open(str(audio_path)) as container:
+                    for frame in container.decode(audio=0):
+                        blocks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(frame))
+                blocks.extend(out.to_ndarray().reshape(-1) for out in resampler.resample(None))
+                return np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.int16)
+            except Exception as e:
+                self.logger.warning(f"In-process decoding of {audio_path.name} failed, using ffmpeg: {e}")
+        
+        # Raw PCM straight from ffmpeg's stdout, no temporary file
+        cmd = [
+            'ffmpeg', '-loglevel', 'error', '-nostats',
+            '-i', str(audio_path),
+            '-ar', str(self.sample_rate),
+            '-ac', '1',
+            '-f', 's16le',
+            'pipe:1'
+        ]
+        result = subprocess.run(cmd, capture_output=True, timeout=300)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg decoding failed: {result.stderr.decode(errors='replace')}")
+        return np.frombuffer(result.stdout, dtype='<i2')
+    
+    def _detect_language(self, text: str) -> Optional[str]:
+        """Detect the language of a text with the preloaded langdetect profiles"""
+        if not self.lang_detector_factory or not text.strip():
+            return None
+        try:
+            detector = self.lang_detector_factory.create()
+            detector.append(text)
+            return self._normalize_language_code(detector.detect())
+        except LangDetectException as e:
+            self.logger.warning(f"Language detection failed: {e}")
+            return None
+            
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _normalize_language_code(lang_code: str) -> str:
+        """Normalize language codes from Google Cloud to standard format"""
+        lang_code = lang_code.lower()
+        # Unmapped codes keep their base language, without the region
+        return _GOOGLE_LANG_MAP.get(lang_code) or lang_code.split('-', 1)[0]
+            
+    @staticmethod
+    def _same_language(lang_a: str, lang_b: str) -> bool:
+        """Compare two language codes by base language, e.g. 'en' and 'en-US'"""
+        return lang_a.split('-', 1)[0].lower() == lang_b.split('-', 1)[0].lower()
+    
+    def _should_translate(self, language: str) -> bool:
+        """Whether a transcript in this language needs translating to the target language"""
+        return (self.config["translation_enabled"] and
+                not self._same_language(language, self.config["target_language"]))
+    
     def translate_text(self, text: str, source_lang: str, target_lang: str = "en") -> Dict:
         """Translate text to target language using multiple translation services"""
         try:
-            if source_lang == target_lang or not text.strip():
+            if self._same_language(source_lang, target_lang) or not text.strip():
                 return {
                     "translated_text": text,
                     "source_language": source_lang,
@@ -701,73 +1544,73 @@ class RecordingProcessorGoogle:
                     "service": "no_translation_needed"
                 }
             
+            # Identical text was translated recently
+            cache_key = self._translation_cache_key(text, source_lang, target_lang)
+            cached = self._load_cache_entry(self.translation_cache_dir, cache_key, self.config["translation_cache_ttl"])
+            if cached is not None:
+                self.logger.info(f"Using cached translation from {source_lang} to {target_lang}")
+                return cached
+            
+            # Try translation services in order of preference - Google Cloud first for reliability
+            translation_services = self._service_chain
+            if translation_services is None:
+                translation_services = self._service_chain = self._build_service_chain()
+            primary_is_google_cloud = translation_services[:1] == (self._translate_with_google_cloud,)
+            
+            # Google Cloud accepts most transcripts in a single request, without chunking
+            if primary_is_google_cloud and len(text.encode('utf-8')) <= _GOOGLE_CLOUD_SINGLE_REQUEST_BYTES:
+                result = self._call_translation_service(self._translate_with_google_cloud, text, source_lang, target_lang)
+                if result["success"]:
+                    self.logger.info("Translation successful using google_cloud")
+                    result = {
+                        "translated_text": result["translated_text"],
+                        "source_language": source_lang,
+                        "target_language": target_lang,
+                        "success": True,
+                        "service": result["service"],
+                        "chunks_processed": 1
+                    }
+                    self._save_cache_entry(self.translation_cache_dir, cache_key, result)
+                    return result
+            
             # Split long text into chunks to avoid API limits - Google Cloud can handle larger chunks
-            max_chunk_size = 10000 if 'google_cloud' in self.translation_preference[:2] else 4000  # Google Cloud has higher limits
-            text_chunks = self._split_text_into_chunks(text, max_chunk_size)
-            translated_chunks = []
+            max_chunk_size = _GOOGLE_CLOUD_SINGLE_REQUEST_BYTES if primary_is_google_cloud else 4000
+            split_chunks = self._split_text_into_chunks(text, max_chunk_size)
+            text_chunks = [chunk for chunk, _ in split_chunks]
+            # Chunks translated so far; each service is only given the ones still missing
+            translated_chunks: List[Optional[str]] = [None] * len(text_chunks)
             
             self.logger.info(f"Translating {len(text_chunks)} chunks from {source_lang} to {target_lang} (chunk size: {max_chunk_size})")
             
-            # Try translation services in order of preference - Google Cloud first for reliability
-            translation_services = []
-            
-            # Build services list based on preference and availability
-            for service_name in self.translation_preference:
-                if service_name == 'google_cloud' and self.translate_client:
-                    translation_services.append(self._translate_with_google_cloud)
-                elif service_name == 'free_google' and DEEP_TRANSLATOR_AVAILABLE:
-                    translation_services.append(self._translate_with_free_google)
-                elif service_name == 'mymemory' and DEEP_TRANSLATOR_AVAILABLE:
-                    translation_services.append(self._translate_with_mymemory)
-                elif service_name == 'libretranslate' and DEEP_TRANSLATOR_AVAILABLE:
-                    translation_services.append(self._translate_with_libre)
-                elif service_name == 'pons' and DEEP_TRANSLATOR_AVAILABLE:
-                    translation_services.append(self._translate_with_pons)
-            
-            # Fallback services if none were added from preferences
-            if not translation_services:
-                if self.translate_client:
-                    translation_services.append(self._translate_with_google_cloud)
-                if DEEP_TRANSLATOR_AVAILABLE:
-                    translation_services.extend([
-                        self._translate_with_free_google,
-                        self._translate_with_mymemory,
-                        self._translate_with_libre,
-                        self._translate_with_pons
-                    ])
-            
             successful_service = None
             
-            for service_func in translation_services:
-                try:
-                    all_success = True
-                    translated_chunks = []
-                    
-                    for chunk in text_chunks:
-                        if not chunk.strip():
-                            translated_chunks.append(chunk)
-                            continue
-                            
-                        result = service_func(chunk, source_lang, target_lang)
-                        if result["success"]:
-                            translated_chunks.append(result["translated_text"])
-                        else:
-                            all_success = False
-                            break
-                    
-                    if all_success:
-                        successful_service = result.get("service", service_func.__name__)
-                        break
-                        
-                except Exception as e:
-                    self.logger.warning(f"Translation service {service_func.__name__} failed: {e}")
-                    continue
+            remaining_services = translation_services
+            if self.hedge_translations and len(translation_services) >= 2:
+                result = self._translate_hedged(translation_services[:2], text_chunks, source_lang, target_lang)
+                if self._fill_translations(translated_chunks, range(len(text_chunks)), result):
+                    successful_service = result["service"]
+                remaining_services = translation_services[2:]
             
-            if translated_chunks and successful_service:
-                final_translation = " ".join(translated_chunks)
+            for service_func in remaining_services:
+                missing = [index for index, translated in enumerate(translated_chunks) if translated is None]
+                if not missing:
+                    break
+                if len(missing) < len(text_chunks):
+                    self.logger.info(f"Keeping {len(text_chunks) - len(missing)} translated chunks, trying {service_func.__name__} for the other {len(missing)}")
+                result = self._call_translation_service(
+                    service_func, [text_chunks[index] for index in missing], source_lang, target_lang
+                )
+                if self._fill_translations(translated_chunks, missing, result):
+                    successful_service = result["service"]
+
+            if text_chunks and None not in translated_chunks:
+                # Rejoin with the whitespace that separated the chunks in the original text
+                final_translation = "".join(
+                    translated + separator for translated, (_, separator) in zip(translated_chunks, split_chunks)
+                )
                 self.logger.info(f"Translation successful using {successful_service}")
                 
-                return {
+                result = {
                     "translated_text": final_translation,
                     "source_language": source_lang,
                     "target_language": target_lang,
@@ -775,6 +1618,8 @@ class RecordingProcessorGoogle:
                     "service": successful_service,
                     "chunks_processed": len(text_chunks)
                 }
+                self._save_cache_entry(self.translation_cache_dir, cache_key, result)
+                return result
             
             # All services failed, use offline fallback
             self.logger.warning("All translation services failed, using offline fallback")
@@ -784,104 +1629,389 @@ class RecordingProcessorGoogle:
             self.logger.error(f"Translation failed: {e}")
             return self._get_offline_translation(text, source_lang, target_lang)
     
-    def _split_text_into_chunks(self, text: str, max_size: int) -> List[str]:
-        """Split text into chunks that respect sentence boundaries and preserve context"""
-        if len(text) <= max_size:
-            return [text]
+    def translate_texts(self, texts: List[str], source_lang: str, target_lang: str = "en") -> List[Dict]:
+        """
+        Translate several independent texts, sending the uncached ones to Google Cloud together.
         
-        chunks = []
+        Texts that Google Cloud cannot take in the shared request, or that it
+        fails to translate, go through translate_text one at a time.
         
-        # Try to split by sentences first (works for most languages)
-        # Handle multiple sentence endings for better language support
-        sentence_endings = ['. ', '! ', '? ', '। ', '॥ ', '|']  # Include Hindi sentence endings
+        Args:
+            texts (List[str]): Texts to translate
+            source_lang (str): Language of the texts
+            target_lang (str): Language to translate to
+            
+        Returns:
+            List[Dict]: One translate_text-style result per text, in order
+        """
+        results: List[Optional[Dict]] = [None] * len(texts)
+        pending = []
+        if self._service_chain is None:
+            self._service_chain = self._build_service_chain()
         
-        # Find sentence boundaries
-        sentences = []
-        current_sentence = ""
-        i = 0
+        if not self._same_language(source_lang, target_lang) and self._service_chain[:1] == (self._translate_with_google_cloud,):
+            for index, text in enumerate(texts):
+                if not text.strip() or len(text.encode('utf-8')) > _GOOGLE_CLOUD_SINGLE_REQUEST_BYTES:
+                    continue
+                cached = self._load_cache_entry(self.translation_cache_dir,
+                                                self._translation_cache_key(text, source_lang, target_lang),
+                                                self.config["translation_cache_ttl"])
+                if cached is not None:
+                    results[index] = cached
+                else:
+                    pending.append(index)
         
-        while i < len(text):
-            current_sentence += text[i]
-            
-            # Check for sentence endings
-            for ending in sentence_endings:
-                if text[i:i+len(ending)] == ending:
-                    sentences.append(current_sentence)
-                    current_sentence = ""
-                    i += len(ending) - 1
-                    break
-            i += 1
+        if pending:
+            self.logger.info(f"Translating {len(pending)} texts from {source_lang} to {target_lang} in one Google Cloud batch")
+            result = self._call_translation_service(
+                self._translate_with_google_cloud, [texts[index] for index in pending], source_lang, target_lang
+            )
+            translated: List[Optional[str]] = [None] * len(pending)
+            self._fill_translations(translated, range(len(pending)), result)
+            for index, piece in zip(pending, translated):
+                if piece is None:
+                    continue
+                results[index] = {
+                    "translated_text": piece,
+                    "source_language": source_lang,
+                    "target_language": target_lang,
+                    "success": True,
+                    "service": result["service"],
+                    "chunks_processed": 1
+                }
+                self._save_cache_entry(self.translation_cache_dir,
+                                       self._translation_cache_key(texts[index], source_lang, target_lang),
+                                       results[index])
         
-        # Add remaining text as last sentence
-        if current_sentence.strip():
-            sentences.append(current_sentence)
+        return [result if result is not None else self.translate_text(text, source_lang, target_lang)
+                for text, result in zip(texts, results)]
+    
+    @staticmethod
+    def _translation_cache_key(text: str, source_lang: str, target_lang: str) -> str:
+        """Cache file name of a translation"""
+        return hashlib.blake2b(f"{source_lang}|{target_lang}|{text}".encode(), digest_size=16).hexdigest()
+    
+    @property
+    def translation_preference(self) -> List[str]:
+        """Translation service names in order of preference"""
+        return self._translation_preference
+    
+    @translation_preference.setter
+    def translation_preference(self, services: List[str]):
+        self._translation_preference = services
+        # Rebuilt from the new preference on the next translation
+        self._service_chain: Optional[Tuple[Callable, ...]] = None
+    
+    def _build_service_chain(self) -> Tuple[Callable, ...]:
+        """Resolve the preferred translation services to the available service functions"""
+        translation_services = []
         
-        # If no clear sentences found, split by line breaks or word boundaries
-        if len(sentences) <= 1:
-            if '\n' in text:
-                sentences = text.split('\n')
-            else:
-                # Split by words as last resort
-                words = text.split(' ')
-                sentences = []
-                current = ""
-                for word in words:
-                    if len(current + word + " ") <= max_size // 2:  # Conservative chunking
-                        current += word + " "
-                    else:
-                        if current:
-                            sentences.append(current.strip())
-                        current = word + " "
-                if current:
-                    sentences.append(current.strip())
-        
-        # Combine sentences into chunks
-        current_chunk = ""
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-                
-            # Check if adding this sentence would exceed the limit
-            if len(current_chunk + sentence + " ") <= max_size:
-                current_chunk += sentence + " "
-            else:
-                # Save current chunk and start new one
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    
-                # Handle very long sentences that exceed max_size
-                if len(sentence) > max_size:
-                    # Split long sentence by words
-                    words = sentence.split()
-                    temp_chunk = ""
-                    for word in words:
-                        if len(temp_chunk + word + " ") <= max_size:
-                            temp_chunk += word + " "
-                        else:
-                            if temp_chunk:
-                                chunks.append(temp_chunk.strip())
-                            temp_chunk = word + " "
-                    current_chunk = temp_chunk
+        # Build services list based on preference and availability
+        for service_name in self.translation_preference:
+            if service_name == 'google_cloud' and self.translate_client:
+                translation_services.append(self._translate_with_google_cloud)
+            elif service_name == 'free_google' and DEEP_TRANSLATOR_AVAILABLE:
+                translation_services.append(self._translate_with_free_google)
+            elif service_name == 'mymemory' and DEEP_TRANSLATOR_AVAILABLE:
+                translation_services.append(self._translate_with_mymemory)
+            elif service_name == 'libretranslate' and DEEP_TRANSLATOR_AVAILABLE:
+                translation_services.append(self._translate_with_libre)
+            elif service_name == 'pons' and DEEP_TRANSLATOR_AVAILABLE:
+                translation_services.append(self._translate_with_pons)
+        
+        # Fallback services if none were added from preferences
+        if not translation_services:
+            if self.translate_client:
+                translation_services.append(self._translate_with_google_cloud)
+            if DEEP_TRANSLATOR_AVAILABLE:
+                translation_services.extend([
+                    self._translate_with_free_google,
+                    self._translate_with_mymemory,
+                    self._translate_with_libre,
+                    self._translate_with_pons
+                ])
+        
+        return tuple(translation_services)
+    
+    @staticmethod
+    def _fill_translations(translated_chunks: List[Optional[str]], indexes, result: Dict) -> int:
+        """
+        Store a service's translations of the chunks at the given indexes.
+        
+        Failed results may carry the chunks they did translate in
+        partial_translation (None for the others); those are kept too.
+        
+        Returns:
+            int: Number of chunks filled in
+        """
+        pieces = result["translated_text"] if result["success"] else result.get("partial_translation") or []
+        filled = 0
+        for index, piece in zip(indexes, pieces):
+            if piece is not None and translated_chunks[index] is None:
+                translated_chunks[index] = piece
+                filled += 1
+        return filled
+    
+    def _call_translation_service(self, service_func: Callable, text_chunks: Union[str, List[str]], source_lang: str,
+                                  target_lang: str) -> Dict:
+        """Translate the chunk list (or a single text) with one service, reporting exceptions as a failed result"""
+        session = getattr(self, '_session', None)
+        try:
+            # Each service takes the whole chunk list and batches what it can;
+            # free backends reuse this processor's session for the call
+            with _TRANSLATOR_REQUESTS.bind(session) if session is not None else contextlib.nullcontext():
+                result = service_func(text_chunks, source_lang, target_lang)
+        except Exception as e:
+            self.logger.warning(f"Translation service {service_func.__name__} failed: {e}")
+            return {"success": False, "error": str(e), "service": service_func.__name__}
+        
+        if result.get("service") is None:
+            result["service"] = service_func.__name__
+        return result
+    
+    def _translate_hedged(self, services: List[Callable], text_chunks: List[str], source_lang: str,
+                          target_lang: str) -> Dict:
+        """
+        Translate with the first service, starting the second as a hedge.
+        
+        The second service is started once the first has failed or has not
+        finished within the hedge delay; the first successful result wins and
+        the other request is abandoned.
+        
+        Args:
+            services (List[Callable]): The two preferred translation services
+            text_chunks (List[str]): Chunks to translate
+            source_lang (str): Source language code
+            target_lang (str): Target language code
+        
+        Returns:
+            Dict: The winning result, or the last failure if both services failed
+        """
+        primary, backup = services
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="TranslationHedge")
+        try:
+            first = executor.submit(self._call_translation_service, primary, text_chunks, source_lang, target_lang)
+            pending = {first}
+            wait(pending, timeout=self._hedge_delay)
+            if not (first.done() and first.result()["success"]):
+                if not first.done():
+                    self.logger.info(f"{primary.__name__} is slow, also trying {backup.__name__}")
+                pending.add(executor.submit(self._call_translation_service, backup, text_chunks, source_lang, target_lang))
+            
+            result = {"success": False, "error": "no translation service finished"}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result["success"]:
+                        return result
+            return result
+        finally:
+            # Don't wait for the losing request
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _split_text_into_chunks(self, text: str, max_size: int) -> List[Tuple[str, str]]:
+        """
+        Split text into chunks that respect sentence boundaries and preserve context.
+        
+        Chunks are slices of the original text, so the translations can be
+        joined back with the separators the text had.
+        
+        Returns:
+            List[Tuple[str, str]]: Each chunk with the whitespace that followed it in the text
+        """
+        text_length = len(text)
+        if text_length <= max_size:
+            return [(text, "")]
+        
+        def strip_span(start: int, end: int) -> Tuple[int, int]:
+            segment = text[start:end]
+            return start + len(segment) - len(segment.lstrip()), end - len(segment) + len(segment.rstrip())
+        
+        spans = []
+        
+        # Barely over the limit: a single cut at the last sentence end that fits
+        # avoids walking every sentence. Only the stretch where both halves
+        # would fit is searched, back from the limit.
+        if text_length <= max_size * 1.1:
+            lowest = max(1, text_length - max_size - 1)
+            cut = next((i for i in range(max_size - 1, lowest - 1, -1)
+                        if text[i] in _TERMINATORS and text[i + 1].isspace()), None)
+            if cut is not None:
+                head = strip_span(0, cut + 1)
+                tail = strip_span(cut + 1, text_length)
+                if head[0] < head[1] and tail[0] < tail[1]:
+                    spans = [head, tail]
+        
+        if not spans:
+            # Try to split by sentences first (works for most languages), then by
+            # line breaks, then by words as last resort
+            units = [match.span() for match in _SENTENCE_RE.finditer(text) if match.group(0).strip()]
+            if len(units) <= 1:
+                pattern = _LINE_RE if '\n' in text else _WORD_RE
+                units = [match.span() for match in pattern.finditer(text) if match.group(0).strip()]
+            
+            # Pieces no longer than max_size: sentences that are too long are
+            # split by words, and words that are too long are cut
+            pieces = []
+            for unit_start, unit_end in units:
+                unit_start, unit_end = strip_span(unit_start, unit_end)
+                if unit_end - unit_start <= max_size:
+                    pieces.append((unit_start, unit_end))
+                    continue
+                for word in _WORD_RE.finditer(text, unit_start, unit_end):
+                    word_start, word_end = word.span()
+                    while word_end - word_start > max_size:
+                        pieces.append((word_start, word_start + max_size))
+                        word_start += max_size
+                    pieces.append((word_start, word_end))
+            
+            # Combine consecutive pieces into chunks
+            for piece_start, piece_end in pieces:
+                if spans and piece_end - spans[-1][0] <= max_size:
+                    spans[-1] = (spans[-1][0], piece_end)
                 else:
-                    current_chunk = sentence + " "
+                    spans.append((piece_start, piece_end))
         
-        # Add the last chunk
-        if current_chunk.strip():
-            chunks.append(current_chunk.strip())
+        if not spans:
+            return [(text, "")]
         
-        # Fallback: if still no chunks, force split
-        if not chunks:
-            for i in range(0, len(text), max_size):
-                chunks.append(text[i:i + max_size])
+        next_starts = [start for start, _ in spans[1:]] + [None]
+        chunks = [(text[start:end], text[end:next_start] if next_start is not None else "")
+                  for (start, end), next_start in zip(spans, next_starts)]
         
         self.logger.info(f"Split text into {len(chunks)} chunks for translation")
         return chunks
     
-    def _translate_with_free_google(self, text: str, source_lang: str, target_lang: str) -> Dict:
+    @staticmethod
+    def _batch_chunks(chunks: List[str], max_chars: int, max_items: int = None) -> List[List[str]]:
+        """Group consecutive chunks into batches of at most max_chars (joined) and max_items"""
+        batches = []
+        batch = []
+        batch_chars = 0
+        for chunk in chunks:
+            added = len(chunk) + (len(_BATCH_SEPARATOR) if batch else 0)
+            if batch and (batch_chars + added > max_chars or (max_items and len(batch) >= max_items)):
+                batches.append(batch)
+                batch = []
+                batch_chars = 0
+                added = len(chunk)
+            batch.append(chunk)
+            batch_chars += added
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    @staticmethod
+    def _is_rate_limited(result: Dict) -> bool:
+        """Check whether a failed translation was rejected for sending too many requests"""
+        error = str(result.get("error", "")).lower()
+        return not result["success"] and ("429" in error or "too many requests" in error)
+    
+    def _translate_each(self, service_func: Callable, chunks: List[str], source_lang: str, target_lang: str) -> Dict:
+        """
+        Translate chunks one request each, sending the requests in parallel.
+        
+        If the service rate-limits the parallel requests, the chunks it rejected
+        are retried one at a time. On failure, the chunks that were translated
+        are returned in partial_translation (None for the rest).
+        """
+        translated: List[Optional[str]] = [None if chunk.strip() else chunk for chunk in chunks]
+        pending = [index for index, chunk in enumerate(chunks) if chunk.strip()]
+        semaphore = self._translation_semaphores.get(service_func.__name__) or threading.Semaphore(self.translate_concurrency)
+        
+        def translate(chunk: str) -> Dict:
+            with semaphore:
+                return service_func(chunk, source_lang, target_lang)
+        
+        results = {}
+        if len(pending) > 1:
+            max_workers = min(self.translate_concurrency, len(pending))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Futures are read in submission order to keep the chunks in order
+                futures = [executor.submit(translate, chunks[index]) for index in pending]
+                results = dict(zip(pending, (future.result() for future in futures)))
+            
+            if any(self._is_rate_limited(result) for result in results.values()):
+                self.logger.warning(f"{service_func.__name__} is rate limiting parallel requests, translating the remaining chunks one by one")
+                results = {index: result for index, result in results.items() if result["success"]}
+        
+        service = None
+        failure = None
+        for index in pending:
+            result = results.get(index)
+            if result is None:
+                if failure is not None:
+                    # Don't send more requests to a failing service
+                    continue
+                result = translate(chunks[index])
+            if result["success"]:
+                translated[index] = result["translated_text"]
+                service = result.get("service")
+            elif failure is None:
+                failure = result
+        
+        if failure is not None:
+            return {**failure, "partial_translation": translated}
+        
+        return {
+            "translated_text": translated,
+            "source_language": source_lang,
+            "target_language": target_lang,
+            "success": True,
+            "service": service
+        }
+    
+    def _translate_joined(self, service_func: Callable, chunks: List[str], source_lang: str,
+                          target_lang: str, max_chars: int) -> Dict:
+        """
+        Translate chunks with as few requests as possible by joining them with a separator.
+        
+        Batches that fail or come back with a different number of pieces are
+        translated again one chunk per request. On failure, the chunks that were
+        translated are returned in partial_translation (None for the rest).
+        """
+        translated: List[Optional[str]] = [None] * len(chunks)
+        # Chunks left for one request each, translated together in parallel
+        remaining = []
+        result = {"success": True}
+        offset = 0
+        for batch in self._batch_chunks(chunks, max_chars):
+            indexes = range(offset, offset + len(batch))
+            offset += len(batch)
+            if len(batch) > 1:
+                result = service_func(_BATCH_SEPARATOR.join(batch), source_lang, target_lang)
+                if result["success"]:
+                    pieces = result["translated_text"].split(_BATCH_SEPARATOR.strip())
+                    if len(pieces) == len(batch):
+                        for index, piece in zip(indexes, pieces):
+                            translated[index] = piece.strip()
+                        continue
+                    self.logger.warning(f"Batched translation returned {len(pieces)} pieces for {len(batch)} chunks, translating them one by one")
+            
+            remaining.extend(indexes)
+        
+        if remaining:
+            result = self._translate_each(service_func, [chunks[index] for index in remaining], source_lang, target_lang)
+            self._fill_translations(translated, remaining, result)
+            if not result["success"]:
+                return {**result, "partial_translation": translated}
+        
+        return {
+            "translated_text": translated,
+            "source_language": source_lang,
+            "target_language": target_lang,
+            "success": True,
+            "service": result.get("service")
+        }
+    
+    def _translate_with_free_google(self, text: Union[str, List[str]], source_lang: str, target_lang: str) -> Dict:
         """Translate using free Google Translator (deep-translator)"""
         if not DEEP_TRANSLATOR_AVAILABLE:
             return {"success": False, "error": "deep-translator not available"}
+        if isinstance(text, list):
+            return self._translate_joined(self._translate_with_free_google, text, source_lang, target_lang,
+                                          _FREE_GOOGLE_MAX_CHARS)
         
         try:
             # Use auto-detect if source language is unknown
@@ -903,10 +2033,13 @@ class RecordingProcessorGoogle:
         except Exception as e:
             return {"success": False, "error": str(e), "service": "free_google"}
     
-    def _translate_with_mymemory(self, text: str, source_lang: str, target_lang: str) -> Dict:
+    def _translate_with_mymemory(self, text: Union[str, List[str]], source_lang: str, target_lang: str) -> Dict:
         """Translate using MyMemory API (free with generous limits)"""
         if not DEEP_TRANSLATOR_AVAILABLE:
             return {"success": False, "error": "deep-translator not available"}
+        if isinstance(text, list):
+            return self._translate_joined(self._translate_with_mymemory, text, source_lang, target_lang,
+                                          _MYMEMORY_MAX_CHARS)
         
         try:
             # MyMemory supports auto-detection
@@ -928,21 +2061,17 @@ class RecordingProcessorGoogle:
         except Exception as e:
             return {"success": False, "error": str(e), "service": "mymemory"}
     
-    def _translate_with_libre(self, text: str, source_lang: str, target_lang: str) -> Dict:
+    def _translate_with_libre(self, text: Union[str, List[str]], source_lang: str, target_lang: str) -> Dict:
         """Translate using LibreTranslate (free and open source)"""
         if not DEEP_TRANSLATOR_AVAILABLE:
             return {"success": False, "error": "deep-translator not available"}
+        if isinstance(text, list):
+            return self._translate_each(self._translate_with_libre, text, source_lang, target_lang)
         
         try:
             # LibreTranslate requires specific language codes
-            libre_lang_map = {
-                'hi': 'hi', 'bn': 'bn', 'es': 'es', 'fr': 'fr', 'de': 'de',
-                'it': 'it', 'pt': 'pt', 'ru': 'ru', 'ja': 'ja', 'ko': 'ko',
-                'zh': 'zh', 'ar': 'ar', 'nl': 'nl', 'sv': 'sv', 'en': 'en'
-            }
-            
-            source_code = libre_lang_map.get(source_lang, 'auto')
-            target_code = libre_lang_map.get(target_lang, 'en')
+            source_code = _LIBRE_LANG_MAP.get(source_lang, 'auto')
+            target_code = _LIBRE_LANG_MAP.get(target_lang, 'en')
             
             if source_code == 'auto' or source_lang == "unknown":
                 # LibreTranslate auto-detection
@@ -963,10 +2092,12 @@ class RecordingProcessorGoogle:
         except Exception as e:
             return {"success": False, "error": str(e), "service": "libretranslate"}
     
-    def _translate_with_google_cloud(self, text: str, source_lang: str, target_lang: str) -> Dict:
+    def _translate_with_google_cloud(self, text: Union[str, List[str]], source_lang: str, target_lang: str) -> Dict:
         """Translate using Google Cloud Translation API (paid but most accurate and reliable)"""
         if not self.translate_client:
             return {"success": False, "error": "Google Cloud Translation not configured"}
+        if isinstance(text, list):
+            return self._translate_list_with_google_cloud(text, source_lang, target_lang)
         
         try:
             # Clean and prepare text for translation
@@ -1023,24 +2154,55 @@ class RecordingProcessorGoogle:
             self.logger.error(f"Google Cloud Translation failed: {e}")
             return {"success": False, "error": str(e), "service": "google_cloud"}
     
-    def _translate_with_pons(self, text: str, source_lang: str, target_lang: str) -> Dict:
+    def _translate_list_with_google_cloud(self, texts: List[str], source_lang: str, target_lang: str) -> Dict:
+        """Translate a list of chunks with one Google Cloud request per batch of up to 128 segments"""
+        translated = []
+        try:
+            auto_detect = source_lang == "unknown" or not source_lang or source_lang == "auto"
+            language_kwargs = {} if auto_detect else {"source_language": source_lang}
+            
+            detected_source = source_lang
+            for batch in self._batch_chunks(texts, _GOOGLE_CLOUD_MAX_CHARS, _GOOGLE_CLOUD_MAX_SEGMENTS):
+                self.logger.info(f"Translating {len(batch)} chunks from {source_lang} to {target_lang} using Google Cloud")
+                results = self.translate_client.translate(
+                    batch,
+                    target_language=target_lang,
+                    format_='text',  # Ensure plain text format
+                    **language_kwargs
+                )
+                translated.extend(result['translatedText'] for result in results)
+                if auto_detect and detected_source == source_lang and results:
+                    detected_source = results[0].get('detectedSourceLanguage', 'unknown')
+            
+            return {
+                "translated_text": translated,
+                "source_language": detected_source,
+                "target_language": target_lang,
+                "success": True,
+                "service": "google_cloud",
+                "auto_detected": auto_detect
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Google Cloud Translation failed: {e}")
+            # Keep the batches translated before the failure
+            partial = translated + [None] * (len(texts) - len(translated))
+            return {"success": False, "error": str(e), "service": "google_cloud", "partial_translation": partial}
+    
+    def _translate_with_pons(self, text: Union[str, List[str]], source_lang: str, target_lang: str) -> Dict:
         """Translate using PONS dictionary (good for short phrases)"""
         if not DEEP_TRANSLATOR_AVAILABLE:
             return {"success": False, "error": "deep-translator not available"}
+        if isinstance(text, list):
+            return self._translate_each(self._translate_with_pons, text, source_lang, target_lang)
         
         try:
             # PONS works well for shorter texts
             if len(text) > 500:
                 return {"success": False, "error": "Text too long for PONS", "service": "pons"}
             
-            # PONS language mapping
-            pons_lang_map = {
-                'es': 'spanish', 'fr': 'french', 'de': 'german', 'it': 'italian',
-                'pt': 'portuguese', 'ru': 'russian', 'en': 'english'
-            }
-            
-            source_name = pons_lang_map.get(source_lang)
-            target_name = pons_lang_map.get(target_lang)
+            source_name = _PONS_LANG_MAP.get(source_lang)
+            target_name = _PONS_LANG_MAP.get(target_lang)
             
             if not source_name or not target_name:
                 return {"success": False, "error": "Language not supported by PONS", "service": "pons"}
@@ -1062,39 +2224,15 @@ class RecordingProcessorGoogle:
     def _get_offline_translation(self, text: str, source_lang: str, target_lang: str) -> Dict:
         """Fallback offline translation for common phrases"""
         try:
-            # Check for simple translations
-            text_lower = text.lower().strip()
-            
-            # Simple phrase translations for common cases (extensive Indian languages)
-            simple_translations = {
-                "hi": {
-                    "hello": "नमस्ते",
-                    "hello world": "नमस्ते दुनिया", 
-                    "how are you": "आप कैसे हैं",
-                    "thank you": "धन्यवाद",
-                    "goodbye": "अलविदा",
-                    "yes": "हाँ",
-                    "no": "नहीं"
-                },
-                "bn": {
-                    "hello": "নমস্কার",
-                    "hello world": "নমস্কার পৃথিবী",
-                    "how are you": "আপনি কেমন আছেন",
-                    "thank you": "ধন্যবাদ",
-                    "goodbye": "বিদায়"
-                },
-                "en": {
-                    "hello": "hello",
-                    "hello world": "hello world",
-                    "how are you": "how are you",
-                    "thank you": "thank you",
-                    "goodbye": "goodbye"
-                }
-            }
+            # Check for simple translations; most text (whole transcripts) is
+            # ruled out by its length or a single set lookup
+            text_stripped = text.strip()
+            text_lower = text_stripped.lower() if len(text_stripped) <= _OFFLINE_PHRASE_MAX_LENGTH else None
+            known_phrase = text_lower in _OFFLINE_PHRASES
             
             # If translating TO a supported language
-            if target_lang in simple_translations and source_lang == "en":
-                translated = simple_translations[target_lang].get(text_lower, text)
+            if known_phrase and target_lang in _SIMPLE_TRANSLATIONS and source_lang == "en":
+                translated = _SIMPLE_TRANSLATIONS[target_lang].get(text_lower, text)
                 return {
                     "translated_text": translated,
                     "source_language": source_lang,
@@ -1104,9 +2242,8 @@ class RecordingProcessorGoogle:
                 }
             
             # If translating FROM a supported language to English
-            if source_lang in simple_translations and target_lang == "en":
-                reverse_dict = {v: k for k, v in simple_translations[source_lang].items()}
-                translated = reverse_dict.get(text_lower, text)
+            if known_phrase and source_lang in _SIMPLE_TRANSLATIONS_REV and target_lang == "en":
+                translated = _SIMPLE_TRANSLATIONS_REV[source_lang].get(text_lower, text)
                 return {
                     "translated_text": translated,
                     "source_language": source_lang,
@@ -1137,6 +2274,18 @@ class RecordingProcessorGoogle:
             
     def get_supported_languages(self) -> List[Dict]:
         """Get list of supported languages from Google Translate"""
+        # The list rarely changes, so it is kept in memory and on disk for a day
+        ttl = self.config["supported_languages_ttl"]
+        if self._supported_languages is not None and time.time() < self._supported_languages_expiry:
+            return self._supported_languages
+        
+        cache_dir = self.recordings_dir / '.cache'
+        cached = self._load_cache_entry(cache_dir, 'supported_languages', ttl)
+        if cached is not None:
+            self._supported_languages = cached["languages"]
+            self._supported_languages_expiry = cached["fetched_at"] + ttl
+            return self._supported_languages
+        
         try:
             self.logger.info("Getting supported languages from Google Translate")
             
@@ -1152,6 +2301,11 @@ class RecordingProcessorGoogle:
                 })
             
             self.logger.info(f"Retrieved {len(supported_languages)} supported languages from Google Translate")
+            fetched_at = time.time()
+            self._save_cache_entry(cache_dir, 'supported_languages',
+                                   {"fetched_at": fetched_at, "languages": supported_languages})
+            self._supported_languages = supported_languages
+            self._supported_languages_expiry = fetched_at + ttl
             return supported_languages
             
         except Exception as e:
@@ -1243,65 +2397,97 @@ class RecordingProcessorGoogle:
                 "error": str(e)
             }
             
-    def _chunk_text_for_tts(self, text: str, max_bytes: int = 4500) -> List[str]:
+    def _chunk_text_for_tts(self, text: str, max_bytes: int = 4500, encoded: bytes = None) -> List[str]:
         """
         Split text into chunks that don't exceed Google Cloud TTS byte limit.
         Uses 4500 bytes as a safe limit (below the 5000-byte limit).
+        
+        Args:
+            text (str): Text to split
+            max_bytes (int): Largest UTF-8 size of a chunk
+            encoded (bytes): text already encoded as UTF-8, if the caller has it
         """
-        if len(text.encode('utf-8')) <= max_bytes:
+        if encoded is None:
+            encoded = text.encode('utf-8')
+        if len(encoded) <= max_bytes:
             return [text]
         
+        # The text is encoded once. byte_offsets holds the byte offset where each
+        # character starts (UTF-8 lead bytes, i.e. not 0b10xxxxxx) plus the
+        # total, so the encoded size of text[a:b] is offsets[b] - offsets[a]
+        byte_view = np.frombuffer(encoded, dtype=np.uint8)
+        byte_offsets = np.append(np.flatnonzero((byte_view & 0xC0) != 0x80), len(encoded))
+        offsets = byte_offsets.tolist()
+        
+        # Sentences (ending in . ! ? । ॥ or |) come from one regex pass, and chunk
+        # sizes are kept as running byte counts instead of re-encoding the
+        # growing chunk
         chunks = []
-        sentences = text.split('. ')
-        current_chunk = ""
+        current_parts: List[str] = []
+        current_bytes = 0
         
-        for sentence in sentences:
-            # Add period back if it's not the last sentence
-            test_sentence = sentence + ('. ' if sentence != sentences[-1] else '')
-            test_chunk = current_chunk + test_sentence
+        for match in _SENTENCE_RE.finditer(text):
+            sentence_start, sentence_end = match.span()
+            if sentence_start == sentence_end:
+                continue
+            sentence = match.group()
+            sentence_bytes = offsets[sentence_end] - offsets[sentence_start]
             
             # Check if adding this sentence would exceed the limit
-            if len(test_chunk.encode('utf-8')) > max_bytes:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                    current_chunk = test_sentence
-                else:
-                    # Single sentence is too long, split by words
-                    words = sentence.split(' ')
-                    word_chunk = ""
-                    for word in words:
-                        test_word_chunk = word_chunk + ' ' + word if word_chunk else word
-                        if len(test_word_chunk.encode('utf-8')) > max_bytes:
-                            if word_chunk:
-                                chunks.append(word_chunk.strip())
-                                word_chunk = word
-                            else:
-                                # Single word is too long, split by characters
-                                char_chunk = ""
-                                for char in word:
-                                    test_char_chunk = char_chunk + char
-                                    if len(test_char_chunk.encode('utf-8')) > max_bytes:
-                                        if char_chunk:
-                                            chunks.append(char_chunk)
-                                        char_chunk = char
-                                    else:
-                                        char_chunk = test_char_chunk
-                                if char_chunk:
-                                    chunks.append(char_chunk)
-                                word_chunk = ""
-                        else:
-                            word_chunk = test_word_chunk
-                    if word_chunk:
-                        current_chunk = word_chunk + ('. ' if sentence != sentences[-1] else '')
-                    else:
-                        current_chunk = ""
-            else:
-                current_chunk = test_chunk
+            if current_bytes + sentence_bytes <= max_bytes:
+                current_parts.append(sentence)
+                current_bytes += sentence_bytes
+                continue
+            
+            if current_parts:
+                chunks.append(''.join(current_parts).strip())
+                current_parts = []
+                current_bytes = 0
+                if sentence_bytes <= max_bytes:
+                    current_parts.append(sentence)
+                    current_bytes = sentence_bytes
+                    continue
+            
+            # Single sentence is too long, split by words
+            word_parts: List[str] = []
+            word_bytes = 0
+            for word_match in _WORD_RE.finditer(text, sentence_start, sentence_end):
+                char_start, word_end = word_match.span()
+                encoded_word = offsets[word_end] - offsets[char_start]
+                
+                separator_bytes = 1 if word_parts else 0
+                if word_bytes + separator_bytes + encoded_word <= max_bytes:
+                    word_parts.append(word_match.group())
+                    word_bytes += separator_bytes + encoded_word
+                    continue
+                
+                if word_parts:
+                    chunks.append(' '.join(word_parts))
+                    word_parts = []
+                    word_bytes = 0
+                if encoded_word <= max_bytes:
+                    word_parts.append(word_match.group())
+                    word_bytes = encoded_word
+                    continue
+                
+                # Single word is too long, split by characters: each cut is the
+                # last character start within max_bytes of the previous cut
+                while char_start < word_end:
+                    char_stop = int(np.searchsorted(byte_offsets, offsets[char_start] + max_bytes, side='right')) - 1
+                    char_stop = min(max(char_stop, char_start + 1), word_end)
+                    chunks.append(text[char_start:char_stop])
+                    char_start = char_stop
+            
+            # Carry the remaining words over as the start of the next chunk
+            if word_parts:
+                current_parts = [' '.join(word_parts) + ' ']
+                current_bytes = word_bytes + 1
         
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if current_parts:
+            chunks.append(''.join(current_parts).strip())
         
-        return chunks
+        # Runs of whitespace between sentences can leave empty chunks
+        return [chunk for chunk in chunks if chunk]
 
     def text_to_speech(self, text: str, language: str, voice_name: str = None) -> Path:
         """Convert text to speech audio file using Google Cloud Text-to-Speech"""
@@ -1312,8 +2498,8 @@ class RecordingProcessorGoogle:
             generated_audio_dir = self.recordings_dir / 'generated_audio'
             generated_audio_dir.mkdir(parents=True, exist_ok=True)
             
-            # Generate unique filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Generate unique filename (microseconds keep concurrent requests apart)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
             audio_filename = f"tts_{language}_{timestamp}"
             output_path = generated_audio_dir / f"{audio_filename}.mp3"
             metadata_path = generated_audio_dir / f"{audio_filename}_metadata.json"
@@ -1336,34 +2522,47 @@ class RecordingProcessorGoogle:
                 volume_gain_db=0.0
             )
             
+            # The text is encoded once for chunking, the cache key and the metadata
+            encoded_text = text.encode('utf-8')
+            
             # Check if text exceeds Google Cloud TTS limits and chunk if necessary
-            text_chunks = self._chunk_text_for_tts(text)
+            text_chunks = self._chunk_text_for_tts(text, encoded=encoded_text)
+            
+            # Same text was synthesized with this voice recently
+            cache_key = self._tts_cache_key(text, voice, encoded_text)
+            cached_audio = self._load_cached_audio(cache_key)
             
-            if len(text_chunks) == 1:
+            if cached_audio is not None:
+                self.logger.info("Using cached TTS audio")
+                with open(output_path, 'wb') as out:
+                    out.write(cached_audio)
+            elif len(text_chunks) == 1:
                 # Single chunk - process normally
                 synthesis_input = texttospeech.SynthesisInput(text=text)
-                response = self.tts_client.synthesize_speech(
-                    input=synthesis_input, voice=voice, audio_config=audio_config
-                )
+                with self._tts_semaphore:
+                    response = self.tts_client.synthesize_speech(
+                        input=synthesis_input, voice=voice, audio_config=audio_config, retry=_TTS_RETRY
+                    )
                 
                 # Write the response to the output file
                 with open(output_path, 'wb') as out:
                     out.write(response.audio_content)
+                self._save_cached_audio(cache_key, response.audio_content)
             else:
-                # Multiple chunks - process each and concatenate
+                # Multiple chunks - synthesize up to TTS_CONCURRENCY at a time and
+                # concatenate; map() keeps the segments in chunk order
                 self.logger.info(f"Text too long, splitting into {len(text_chunks)} chunks")
-                audio_segments = []
                 
-                for i, chunk in enumerate(text_chunks):
-                    self.logger.info(f"Processing chunk {i+1}/{len(text_chunks)}")
-                    synthesis_input = texttospeech.SynthesisInput(text=chunk)
-                    response = self.tts_client.synthesize_speech(
-                        input=synthesis_input, voice=voice, audio_config=audio_config
-                    )
-                    audio_segments.append(response.audio_content)
+                max_workers = max(1, min(int(os.getenv('TTS_CONCURRENCY', '8')), len(text_chunks)))
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="SynthesizeChunk") as executor:
+                    audio_segments = list(executor.map(
+                        self._synthesize_chunk, range(len(text_chunks)), text_chunks,
+                        itertools.repeat(len(text_chunks)), itertools.repeat(voice), itertools.repeat(audio_config)
+                    ))
                 
-                # Concatenate audio segments using ffmpeg
+                # Concatenate audio segments into one MP3 file
                 self._concatenate_audio_segments(audio_segments, output_path)
+                self._save_cached_audio(cache_key, output_path.read_bytes())
             
             # Create metadata file
             metadata = {
@@ -1377,11 +2576,10 @@ class RecordingProcessorGoogle:
                 "format": "mp3",
                 "service": "Google Cloud Text-to-Speech",
                 "text_chunks": len(text_chunks),
-                "original_text_bytes": len(text.encode('utf-8'))
+                "original_text_bytes": len(encoded_text)
             }
             
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, ensure_ascii=False, indent=2)
+            self._write_json(metadata_path, metadata)
             
             self.logger.info(f"TTS audio generated successfully: {output_path}")
             return output_path
@@ -1390,208 +2588,175 @@ class RecordingProcessorGoogle:
             self.logger.error(f"Error generating TTS audio: {e}")
             raise
     
+    def _synthesize_chunk(self, index: int, text: str, total: int, voice, audio_config) -> bytes:
+        """Synthesize one chunk of text, returning its encoded audio"""
+        # Chunks are cached too, so texts that share chunks reuse their audio
+        cache_key = self._tts_cache_key(text, voice)
+        cached_audio = self._load_cached_audio(cache_key)
+        if cached_audio is not None:
+            self.logger.info(f"Using cached audio for chunk {index + 1}/{total}")
+            return cached_audio
+        
+        self.logger.info(f"Processing chunk {index + 1}/{total}")
+        synthesis_input = texttospeech.SynthesisInput(text=text)
+        with self._tts_semaphore:
+            response = self.tts_client.synthesize_speech(
+                input=synthesis_input, voice=voice, audio_config=audio_config, retry=_TTS_RETRY
+            )
+        self._save_cached_audio(cache_key, response.audio_content)
+        return response.audio_content
+    
+    @staticmethod
+    def _tts_cache_key(text: str, voice, encoded: bytes = None) -> str:
+        """Cache key for MP3 audio of text (optionally already UTF-8 encoded) spoken by a voice"""
+        digest = hashlib.sha256(text.encode() if encoded is None else encoded)
+        digest.update(f"|{voice.language_code}|{voice.name}|{voice.ssml_gender}|mp3".encode())
+        return digest.hexdigest()
+    
+    def _load_cached_audio(self, cache_key: str) -> Optional[bytes]:
+        """Return cached audio for a key, or None if missing or older than tts_cache_ttl"""
+        cache_path = self.tts_cache_dir / f"{cache_key}.mp3"
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.config["tts_cache_ttl"]:
+                return None
+            return cache_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            self.logger.warning(f"Ignoring unreadable cached audio {cache_path}: {e}")
+            return None
+    
+    def _save_cached_audio(self, cache_key: str, audio_content: bytes):
+        """Persist synthesized audio under its cache key"""
+        cache_path = self.tts_cache_dir / f"{cache_key}.mp3"
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_bytes(audio_content)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write cached audio {cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _is_mp3(audio_content: bytes) -> bool:
+        """Check for an ID3 tag or an MPEG audio frame sync at the start of the data"""
+        if audio_content[:3] == b'ID3':
+            return True
+        return len(audio_content) > 1 and audio_content[0] == 0xFF and audio_content[1] & 0xE0 == 0xE0
+    
+    @staticmethod
+    def _write_buffers(fd: int, buffers: List[bytes]):
+        """
+        Write buffers to a file descriptor back to back.
+        
+        The buffers are written unbuffered, gathered into one writev() call
+        where the platform has it, instead of being copied through a file
+        object's buffer.
+        
+        Args:
+            fd (int): File descriptor open for writing
+            buffers (List[bytes]): Data to write, in order
+        """
+        views = [memoryview(buffer) for buffer in buffers if buffer]
+        first = 0
+        while first < len(views):
+            if hasattr(os, 'writev'):
+                written = os.writev(fd, views[first:first + _IOV_MAX])
+            else:
+                written = os.write(fd, views[first])
+            # Skip the buffers that were written in full and trim a partial one
+            while first < len(views) and written >= len(views[first]):
+                written -= len(views[first])
+                first += 1
+            if written:
+                views[first] = views[first][written:]
+    
     def _concatenate_audio_segments(self, audio_segments: List[bytes], output_path: Path):
         """Concatenate multiple audio segments into a single MP3 file"""
-        import tempfile
+        # Every segment is synthesized with the same MP3 audio config, and MP3
+        # frames are self-contained, so the segments are written back to back
+        # without ffmpeg. Players skip the ID3 tags between segments.
+        if all(self._is_mp3(segment) for segment in audio_segments):
+            fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                self._write_buffers(fd, audio_segments)
+            finally:
+                os.close(fd)
+            self.logger.info(f"Successfully concatenated {len(audio_segments)} audio segments")
+            return
         
+        # Otherwise pipe the segments to ffmpeg as one stream and let it remux them
+        # (not re-encode) into a clean file in a single pass. The pipe is read
+        # front to back, never probed by seeking, and a deeper input queue keeps
+        # the reader from stalling.
+        self.logger.warning("Audio segments do not look like MP3, remuxing with ffmpeg")
+        audio_stream = b''.join(audio_segments)
         try:
-            # Create temporary directory for audio segments
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_dir_path = Path(temp_dir)
-                segment_files = []
-                
-                # Save each audio segment as a temporary file
-                for i, audio_content in enumerate(audio_segments):
-                    segment_file = temp_dir_path / f"segment_{i:03d}.mp3"
-                    with open(segment_file, 'wb') as f:
-                        f.write(audio_content)
-                    segment_files.append(segment_file)
-                
-                # Create ffmpeg concat file
-                concat_file = temp_dir_path / "concat.txt"
-                with open(concat_file, 'w') as f:
-                    for segment_file in segment_files:
-                        f.write(f"file '{segment_file.absolute()}'\n")
-                
-                # Use ffmpeg to concatenate the segments
-                ffmpeg_cmd = [
-                    'ffmpeg', '-f', 'concat', '-safe', '0',
-                    '-i', str(concat_file),
-                    '-c', 'copy',
-                    '-y',  # Overwrite output file
-                    str(output_path)
-                ]
-                
-                result = subprocess.run(
-                    ffmpeg_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
+            ffmpeg_cmd = [
+                'ffmpeg', '-hide_banner', '-loglevel', 'error', '-nostats',
+                '-thread_queue_size', '1024',
+                '-i', 'pipe:0',
+                '-c', 'copy',
+                '-y',  # Overwrite output file
+                str(output_path)
+            ]
+            
+            result = subprocess.run(
+                ffmpeg_cmd,
+                input=audio_stream,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE
+            )
+            
+            if result.returncode != 0:
+                self.logger.error(f"ffmpeg concatenation failed: {result.stderr.decode(errors='replace')}")
+            else:
+                self.logger.info(f"Successfully concatenated {len(audio_segments)} audio segments")
+                return
                 
-                if result.returncode != 0:
-                    self.logger.error(f"ffmpeg concatenation failed: {result.stderr}")
-                    # Fallback: just use the first segment
-                    with open(output_path, 'wb') as f:
-                        f.write(audio_segments[0])
-                    self.logger.warning("Using first audio segment only due to concatenation failure")
-                else:
-                    self.logger.info(f"Successfully concatenated {len(audio_segments)} audio segments")
-                    
         except Exception as e:
             self.logger.error(f"Error concatenating audio segments: {e}")
-            # Fallback: just save the first segment
-            try:
-                with open(output_path, 'wb') as f:
-                    f.write(audio_segments[0])
-                self.logger.warning("Using first audio segment only due to concatenation error")
-            except Exception as fallback_error:
-                self.logger.error(f"Failed to save even first audio segment: {fallback_error}")
-                raise
-            
-    def _get_google_tts_voice(self, language: str, voice_name: str = None) -> Dict:
-        """Get Google Cloud TTS voice configuration for a language"""
-        # Map language codes to Google Cloud TTS voices with extensive Indian language support
-        voice_configs = {
-            # English
-            "en": {
-                "language_code": "en-US",
-                "voice_name": "en-US-Neural2-C",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            
-            # Major Indian Languages
-            "hi": {
-                "language_code": "hi-IN", 
-                "voice_name": "hi-IN-Neural2-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "bn": {
-                "language_code": "bn-IN",
-                "voice_name": "bn-IN-Standard-A", 
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "te": {
-                "language_code": "te-IN",
-                "voice_name": "te-IN-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "mr": {
-                "language_code": "mr-IN", 
-                "voice_name": "mr-IN-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "ta": {
-                "language_code": "ta-IN",
-                "voice_name": "ta-IN-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "gu": {
-                "language_code": "gu-IN",
-                "voice_name": "gu-IN-Standard-A", 
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "ur": {
-                "language_code": "ur-IN",
-                "voice_name": "ur-IN-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "kn": {
-                "language_code": "kn-IN",
-                "voice_name": "kn-IN-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "ml": {
-                "language_code": "ml-IN",
-                "voice_name": "ml-IN-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "pa": {
-                "language_code": "pa-IN",
-                "voice_name": "pa-IN-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            
-            # International Languages
-            "es": {
-                "language_code": "es-ES",
-                "voice_name": "es-ES-Neural2-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "fr": {
-                "language_code": "fr-FR", 
-                "voice_name": "fr-FR-Neural2-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "de": {
-                "language_code": "de-DE",
-                "voice_name": "de-DE-Neural2-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "it": {
-                "language_code": "it-IT",
-                "voice_name": "it-IT-Neural2-A", 
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "pt": {
-                "language_code": "pt-BR",
-                "voice_name": "pt-BR-Neural2-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "ru": {
-                "language_code": "ru-RU",
-                "voice_name": "ru-RU-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "ja": {
-                "language_code": "ja-JP",
-                "voice_name": "ja-JP-Neural2-B",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "ko": {
-                "language_code": "ko-KR",
-                "voice_name": "ko-KR-Neural2-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "zh": {
-                "language_code": "cmn-CN",
-                "voice_name": "cmn-CN-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "ar": {
-                "language_code": "ar-XA",
-                "voice_name": "ar-XA-Standard-A", 
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "nl": {
-                "language_code": "nl-NL",
-                "voice_name": "nl-NL-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            },
-            "sv": {
-                "language_code": "sv-SE",
-                "voice_name": "sv-SE-Standard-A",
-                "gender": texttospeech.SsmlVoiceGender.FEMALE
-            }
-        }
         
+        # Fallback: keep the joined segments rather than losing the audio
+        try:
+            with open(output_path, 'wb') as f:
+                f.write(audio_stream)
+            self.logger.warning("Wrote the joined audio segments without remuxing due to concatenation failure")
+        except Exception as fallback_error:
+            self.logger.error(f"Failed to save the joined audio segments: {fallback_error}")
+            raise
+            
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _get_google_tts_voice(language: str, voice_name: str = None) -> Mapping:
+        """Get Google Cloud TTS voice configuration for a language (cached, read-only)"""
         # Get configuration for the language, fallback to English
-        config = voice_configs.get(language, voice_configs["en"])
+        config = _VOICE_CONFIGS.get(language, _VOICE_CONFIGS["en"])
         
         # Override voice name if specified
         if voice_name:
-            config = config.copy()
-            config["voice_name"] = voice_name
+            config = MappingProxyType({**config, "voice_name": voice_name})
             
         return config
             
-    def generate_multilingual_audio(self, english_text: str, target_language: str, voice_name: str = None) -> Dict:
-        """Translate English text to target language and generate audio"""
+    def generate_multilingual_audio(self, english_text: str, target_language: str, voice_name: str = None,
+                                    source_language: str = "en") -> Dict:
+        """
+        Translate English text to target language and generate audio
+        
+        Args:
+            english_text (str): Text to speak
+            target_language (str): Language of the audio
+            voice_name (str): Optional voice override
+            source_language (str): Language of english_text; callers that translated
+                the text themselves pass the target language to skip translation
+        """
         try:
             self.logger.info(f"Generating multilingual audio for language: {target_language}")
             
-            # Step 1: Translate text if not already in English
-            if target_language.lower() != "en":
+            # Step 1: Translate text unless the caller says it is already in the target language
+            target = target_language.lower()
+            if not self._same_language(source_language, target):
                 translation_result = self.translate_to_language(english_text, target_language)
                 if not translation_result["success"]:
                     return {
@@ -1606,8 +2771,8 @@ class RecordingProcessorGoogle:
                 translation_result = {
                     "original_text": english_text,
                     "translated_text": english_text,
-                    "source_language": "en",
-                    "target_language": "en",
+                    "source_language": target,
+                    "target_language": target,
                     "success": True
                 }
             
@@ -1648,14 +2813,14 @@ class RecordingProcessorGoogle:
                     "file": str(file_path)
                 }
             
-            # Convert to WAV if necessary
-            if file_path.suffix.lower() != '.wav':
-                wav_path = self.convert_audio_to_wav(file_path)
+            # Convert to FLAC if necessary
+            if file_path.suffix.lower() != '.flac':
+                audio_path = self.convert_audio_to_wav(file_path)
             else:
-                wav_path = file_path
+                audio_path = file_path
             
             # Transcribe audio
-            transcription_result = self.transcribe_audio(wav_path)
+            transcription_result = self.transcribe_audio(audio_path)
             
             if not transcription_result["transcript"]:
                 self.logger.warning(f"No transcript generated for {file_path.name}")
@@ -1666,8 +2831,8 @@ class RecordingProcessorGoogle:
                     "transcription_error": transcription_result.get("error", "Unknown error")
                 }
             
-            # Translate if not in English
-            if self.config["translation_enabled"] and transcription_result["language"] != self.config["target_language"]:
+            # Translate if not already in the target language
+            if self._should_translate(transcription_result["language"]):
                 translation_result = self.translate_text(
                     transcription_result["transcript"],
                     transcription_result["language"],
@@ -1678,7 +2843,8 @@ class RecordingProcessorGoogle:
                     "translated_text": transcription_result["transcript"],
                     "source_language": transcription_result["language"],
                     "target_language": self.config["target_language"],
-                    "success": True
+                    "success": True,
+                    "skipped": True
                 }
             
             # Save results
@@ -1694,8 +2860,7 @@ class RecordingProcessorGoogle:
             transcript_filename = f"{file_path.stem}_transcript.json"
             transcript_path = self.transcripts_dir / transcript_filename
             
-            with open(transcript_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+            self._write_json(transcript_path, result)
             
             self.logger.info(f"Successfully processed {file_path.name}")
             self.logger.info(f"Transcript: '{transcription_result['transcript'][:100]}...'")
@@ -1716,22 +2881,43 @@ class RecordingProcessorGoogle:
         """Process all existing unprocessed files"""
         self.logger.info("Processing existing files...")
         
-        processed_count = 0
+        # DirEntry caches the file type from the directory read, so candidates are
+        # found without a stat call per entry; all of them go to the worker pool
+        # at once and the processed-files snapshot is compacted once at the end
+        futures = {}
         for monitor_dir in self.config["monitoring_directories"]:
-            monitor_path = Path(monitor_dir)
-            if monitor_path.exists():
-                for file_path in monitor_path.iterdir():
-                    if (file_path.is_file() and 
-                        file_path.suffix.lower() in self.config["audio_formats"] and
-                        str(file_path) not in self.processed_files):
-                        
-                        try:
-                            result = self.process_recording(file_path)
-                            if result["success"]:
-                                self.processed_files.append(str(file_path))
-                                processed_count += 1
-                        except Exception as e:
-                            self.logger.error(f"Error processing existing file {file_path.name}: {e}")
+            try:
+                with os.scandir(monitor_dir) as it:
+                    for entry in it:
+                        if (os.path.splitext(entry.name)[1].lower() not in self.audio_formats or
+                                not entry.is_file()):
+                            continue
+                        file_path = Path(entry.path)
+                        if str(file_path) in self.processed_files:
+                            continue
+                        # The watcher is already running; whichever of it and the
+                        # scan claims the file first processes it
+                        with self._ready_lock:
+                            if file_path in self._in_flight:
+                                continue
+                            self._in_flight.add(file_path)
+                        futures[self.worker_pool.submit(self.process_recording, file_path)] = file_path
+            except FileNotFoundError:
+                continue
+        
+        processed_count = 0
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                if future.result()["success"]:
+                    self.mark_processed(file_path)
+                    processed_count += 1
+            except Exception as e:
+                self.logger.error(f"Error processing existing file {file_path.name}: {e}")
+            finally:
+                with self._ready_lock:
+                    self._closed_at.pop(file_path, None)
+                    self._in_flight.discard(file_path)
                         
         self.save_processed_files()
         self.logger.info(f"Processed {processed_count} existing files")
@@ -1740,37 +2926,52 @@ class RecordingProcessorGoogle:
         """Start monitoring directories for new files"""
         self.logger.info("Starting file monitoring...")
         self.running = True
+        self._stop_event.clear()
+        self.start_file_watcher()
         
         # Process existing files first
         self.process_existing_files()
         
-        # Set up file system watchers
-        event_handler = RecordingFileHandler(self)
-        observer = Observer()
-        
-        for monitor_dir in self.config["monitoring_directories"]:
-            monitor_path = Path(monitor_dir)
-            if monitor_path.exists():
-                observer.schedule(event_handler, str(monitor_path), recursive=False)
+        # New files are dispatched by the shared inotify watcher thread; fall back
+        # to a watchdog Observer where inotify is not available
+        observer = None
+        if self.inotify is not None:
+            for monitor_path in self.watch_dirs.values():
                 self.logger.info(f"Monitoring directory: {monitor_path}")
-            else:
-                self.logger.warning(f"Monitor directory does not exist: {monitor_path}")
-                
-        observer.start()
+        elif WATCHDOG_AVAILABLE:
+            event_handler = RecordingFileHandler(self)
+            observer = Observer()
+            
+            for monitor_dir in self.config["monitoring_directories"]:
+                monitor_path = Path(monitor_dir)
+                if monitor_path.exists():
+                    observer.schedule(event_handler, str(monitor_path), recursive=False)
+                    self.logger.info(f"Monitoring directory: {monitor_path}")
+                else:
+                    self.logger.warning(f"Monitor directory does not exist: {monitor_path}")
+                    
+            observer.start()
+        else:
+            self.logger.error("Neither inotify_simple nor watchdog is available; new files will not be detected")
         
+        # Block until stop_monitoring() is called, without polling
         try:
-            while self.running:
-                time.sleep(1)
+            self._stop_event.wait()
         except KeyboardInterrupt:
             self.logger.info("Received keyboard interrupt")
         finally:
-            observer.stop()
-            observer.join()
+            if observer is not None:
+                observer.stop()
+                observer.join()
+            # Let recordings in progress finish, then save what they completed
+            self.worker_pool.shutdown(wait=True, cancel_futures=True)
+            self.save_processed_files()
             self.logger.info("File monitoring stopped")
             
     def stop_monitoring(self):
         """Stop monitoring"""
         self.running = False
+        self._stop_event.set()
 
 
 class RecordingFileHandler(FileSystemEventHandler):
@@ -1778,7 +2979,8 @@ class RecordingFileHandler(FileSystemEventHandler):
     
     def __init__(self, processor: RecordingProcessorGoogle):
         self.processor = processor
-        self.pending_files = {}  # Track files that might still be being written
+        self.pending_files = {}  # Delay timers for files that might still be being written
+        self._pending_lock = threading.Lock()
         
     def on_created(self, event):
         """Handle file creation events"""
@@ -1788,26 +2990,28 @@ class RecordingFileHandler(FileSystemEventHandler):
         file_path = Path(event.src_path)
         
         # Check if it's an audio file we care about
-        if file_path.suffix.lower() in self.processor.config["audio_formats"]:
+        if (file_path.suffix.lower() in self.processor.audio_formats and
+                str(file_path) not in self.processor.processed_files):
             self.processor.logger.info(f"New audio file detected: {file_path.name}")
-            # Schedule processing after delay to ensure file is complete
+            # Schedule processing after delay to ensure file is complete; a repeated
+            # event for the same file restarts its delay instead of queueing it twice
             timer = threading.Timer(self.processor.config["processing_delay"], self._process_file_delayed, [file_path])
+            with self._pending_lock:
+                previous = self.pending_files.pop(str(file_path), None)
+                if previous is not None:
+                    previous.cancel()
+                self.pending_files[str(file_path)] = timer
             timer.start()
             
     def _process_file_delayed(self, file_path: Path):
-        """Process file after checking it's completely written"""
-        if file_path.exists():
-            try:
-                # Check if file is ready before processing
-                if self.processor.is_file_ready(file_path):
-                    result = self.processor.process_recording(file_path)
-                    if result["success"]:
-                        self.processor.processed_files.append(str(file_path))
-                        self.processor.save_processed_files()
-                else:
-                    self.processor.logger.warning(f"File {file_path.name} was not ready for processing")
-            except Exception as e:
-                self.processor.logger.error(f"Error processing new file {file_path.name}: {e}")
+        """Queue the file for processing (the worker checks it's completely written)"""
+        # This runs on the timer's own thread; leave a newer timer for the file in place
+        with self._pending_lock:
+            if self.pending_files.get(str(file_path)) is threading.current_thread():
+                del self.pending_files[str(file_path)]
+        if str(file_path) in self.processor.processed_files:
+            return
+        self.processor.worker_pool.submit(self.processor.process_new_file, file_path)
 
 
 def signal_handler(signum, frame):
@@ -1881,12 +3085,19 @@ def show_status():
         else:
             print(f"  ❌ {name}: Directory not found")
     
-    # Check processed files
+    # Check processed files (JSON snapshot plus entries logged since)
     processed_file_path = recordings_dir / 'processed_files.json'
-    if processed_file_path.exists():
+    processed_log_path = recordings_dir / 'processed_files.log'
+    if processed_file_path.exists() or processed_log_path.exists():
         try:
-            with open(processed_file_path, 'r') as f:
-                processed_files = json.load(f)
+            processed_files = set()
+            if processed_file_path.exists():
+                with open(processed_file_path, 'r') as f:
+                    data = json.load(f)
+                processed_files.update(data.get('files', []) if isinstance(data, dict) else data)
+            if processed_log_path.exists():
+                with open(processed_log_path, 'r', encoding='utf-8') as f:
+                    processed_files.update(line.rstrip('\n') for line in f if line.strip())
             print(f"\n📊 Processed files: {len(processed_files)}")
         except:
             print("\n📊 Processed files: Error reading file")
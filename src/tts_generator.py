@@ -7,6 +7,7 @@ Simple utility to generate multilingual audio from text.
 import sys
 import argparse
 from pathlib import Path
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,6 +16,35 @@ load_dotenv()
 # Import our main processor
 from recording_processor import RecordingProcessorGoogle
 
+SUPPORTED_LANGUAGES = MappingProxyType({
+    "en": "English",
+    "hi": "Hindi",
+    "bn": "Bengali",
+    "te": "Telugu",
+    "mr": "Marathi",
+    "ta": "Tamil",
+    "gu": "Gujarati",
+    "ur": "Urdu",
+    "kn": "Kannada",
+    "ml": "Malayalam",
+    "pa": "Punjabi",
+    "es": "Spanish",
+    "fr": "French",
+    "de": "German",
+    "it": "Italian",
+    "pt": "Portuguese",
+    "ru": "Russian",
+    "ja": "Japanese",
+    "ko": "Korean",
+    "zh": "Chinese",
+    "ar": "Arabic"
+})
+
+# Output of list_supported_languages, built once and written in one call
+_LANGUAGE_LISTING = "🎯 Supported Languages for TTS\n" + "=" * 40 + "\n" + "".join(
+    f"  {code} - {name}\n" for code, name in SUPPORTED_LANGUAGES.items()
+)
+
 def main():
     """Main function for TTS generation"""
     parser = argparse.ArgumentParser(description='Generate speech from text using Google Cloud TTS')
@@ -48,35 +78,7 @@ def main():
 
 def list_supported_languages(processor):
     """List supported languages"""
-    print("🎯 Supported Languages for TTS")
-    print("=" * 40)
-    
-    languages = {
-        "en": "English",
-        "hi": "Hindi", 
-        "bn": "Bengali",
-        "te": "Telugu",
-        "mr": "Marathi", 
-        "ta": "Tamil",
-        "gu": "Gujarati",
-        "ur": "Urdu",
-        "kn": "Kannada",
-        "ml": "Malayalam",
-        "pa": "Punjabi",
-        "es": "Spanish",
-        "fr": "French", 
-        "de": "German",
-        "it": "Italian",
-        "pt": "Portuguese",
-        "ru": "Russian",
-        "ja": "Japanese",
-        "ko": "Korean",
-        "zh": "Chinese",
-        "ar": "Arabic"
-    }
-    
-    for code, name in languages.items():
-        print(f"  {code} - {name}")
+    sys.stdout.write(_LANGUAGE_LISTING)
 
 def interactive_mode(processor):
     """Interactive TTS generation"""
@@ -22,16 +22,28 @@ Date: August 18, 2025
 """
 
 import os
+import re
 import sys
 import json
 import time
+import queue
+import signal
 import logging
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Set
+from typing import Dict, Any, List, Optional, Set, Tuple
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Add the Capital-One-Competition directory to Python path for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
 competition_dir = os.path.join(script_dir, "Capital-One-Competition")
@@ -52,10 +64,183 @@ except ImportError as e:
 TRANSCRIPTS_DIR = "/Users/apple/Desktop/asterisk/recordings/transcripts"
 DEFAULT_PHONE = "9876001234"  # Default phone number for testing
 PROCESSED_FILES_LOG = "/Users/apple/Desktop/asterisk/recordings/processed_transcripts.json"
+# Transcripts processed since the last snapshot, one filename per line
+PROCESSED_FILES_APPEND_LOG = "/Users/apple/Desktop/asterisk/recordings/processed_transcripts.log"
+# Fold the append log into the JSON snapshot after this many entries
+PROCESSED_FILES_COMPACT_INTERVAL = 1000
+# Orchestrator responses and audio metadata, one JSON record per line
+RESPONSES_LOG = "/Users/apple/Desktop/asterisk/recordings/responses/responses.jsonl"
+AUDIO_METADATA_LOG = "/Users/apple/Desktop/asterisk/recordings/audio_metadata/audio_metadata.jsonl"
+# Size at which a JSONL log is moved to "<name>.<timestamp>" and a new one started
+JSONL_LOG_MAX_BYTES = 64 * 1024 * 1024
+# Transcripts waiting between pipeline stages before the earlier stage waits
+# (the intake queue is unbounded so event handlers never block)
+PIPELINE_QUEUE_SIZE = 16
+# Transcripts seen only through a creation event or the startup scan may still
+# be being written; they are read once their size has stopped changing, checked
+# every STABLE_SIZE_INTERVAL seconds for at most STABLE_SIZE_TIMEOUT. Writers that
+# publish atomically (write "<name>.json.tmp", then rename it to "<name>.json")
+# or that are seen closing the file skip this wait
+STABLE_SIZE_INTERVAL = float(os.getenv("TRANSCRIPT_STABLE_SIZE_INTERVAL", "0.05"))
+STABLE_SIZE_TIMEOUT = float(os.getenv("TRANSCRIPT_STABLE_SIZE_TIMEOUT", "5.0"))
+# Longest wait, in seconds, between attempts to re-create a failed TTS processor
+TTS_INIT_MAX_BACKOFF = 60
+# Phrases that mark an orchestrator response as an error message
+_ERROR_INDICATOR_RE = re.compile(r'error:|failed|exception|unauthorized|not found|invalid|timeout', re.IGNORECASE)
+# Seconds to collect translation requests before sending them as one batch
+TRANSLATION_BATCH_WINDOW = 0.1
 
 # Setup logging
 logger = setup_logging('TranscriptMonitor')
 
+# watchdog's native observer on Linux is inotify, which also reports when a writer
+# closes a file, so a transcript written in place is handled when complete; other
+# platforms only report creation. inotify also reports a file moved in from
+# outside the watched directory only as created, with no close to follow
+INOTIFY_AVAILABLE = Observer.__name__ == 'InotifyObserver'
+
+# Directories already created by this process
+_DIRS_ENSURED: Set[str] = set()
+
+def _ensure_dir(path: str):
+    """Create a directory (and its parents) unless this process already has."""
+    if path not in _DIRS_ENSURED:
+        os.makedirs(path, exist_ok=True)
+        _DIRS_ENSURED.add(path)
+
+@functools.lru_cache(maxsize=1)
+def _tts_proc() -> RecordingProcessorGoogle:
+    """
+    The process-wide TTS processor, created on first use.
+    
+    Its Google clients authenticate when they are constructed, so they are
+    built once and shared. A failed construction is not cached and is retried
+    on the next call.
+    """
+    return RecordingProcessorGoogle()
+
+class _JsonlLog:
+    """
+    Append-only JSON Lines file kept open for the life of the monitor.
+    
+    Each record costs one buffered write instead of creating, writing and
+    closing a file of its own. Once the file reaches max_bytes it is renamed with
+    a timestamp suffix and a new one is started; rotated files are never
+    overwritten or deleted.
+    """
+    
+    def __init__(self, path: str, max_bytes: int = JSONL_LOG_MAX_BYTES):
+        """
+        Args:
+            path (str): Log file path; its directory is created if missing
+            max_bytes (int): Size at which the log is rotated
+        """
+        self.path = path
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        _ensure_dir(os.path.dirname(path))
+        self._fp = open(path, 'ab', buffering=8192)
+    
+    def append(self, record: Dict[str, Any]):
+        """Write one record as a line and flush it to the OS."""
+        if ORJSON_AVAILABLE:
+            line = orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        else:
+            line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        with self._lock:
+            self._fp.write(line)
+            self._fp.flush()
+            if self._fp.tell() >= self._max_bytes:
+                self._fp.close()
+                os.rename(self.path, f"{self.path}.{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}")
+                self._fp = open(self.path, 'ab', buffering=8192)
+    
+    def close(self):
+        """Close the log file."""
+        with self._lock:
+            self._fp.close()
+
+class _TxBatcher:
+    """
+    Collects translation requests from all threads and translates them in batches.
+    
+    Requests arriving within TRANSLATION_BATCH_WINDOW of the first one are sent
+    together, so a burst of transcripts (or of sentences streamed from one
+    response) costs one translation request instead of one each.
+    """
+    
+    def __init__(self, translate_batch, window: float = TRANSLATION_BATCH_WINDOW):
+        """
+        Args:
+            translate_batch: Called with a list of texts; returns one translation result per text
+            window (float): Seconds to wait for more requests after the first one
+        """
+        self._translate_batch = translate_batch
+        self._window = window
+        self._requests: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="TranslationBatcher", daemon=True)
+        self._thread.start()
+    
+    def submit(self, text: str) -> Future:
+        """Queue a text for translation; the future resolves to its translation result."""
+        future: Future = Future()
+        self._requests.put((text, future))
+        return future
+    
+    def stop(self):
+        """Translate what is already queued, then stop the batching thread."""
+        self._requests.put(None)
+        self._thread.join()
+    
+    def _run(self):
+        """Collect requests into batches until the stop marker (None) arrives."""
+        while True:
+            request = self._requests.get()
+            if request is None:
+                return
+            
+            batch = [request]
+            deadline = time.monotonic() + self._window
+            stopping = False
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._requests.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+            
+            self._flush(batch)
+            if stopping:
+                return
+    
+    def _flush(self, batch: List[Tuple[str, Future]]):
+        """Translate one batch and resolve its futures."""
+        # Texts that differ only in whitespace are translated once
+        unique: Dict[str, int] = {}
+        order: List[str] = []
+        slots = []
+        for text, _ in batch:
+            key = " ".join(text.split())
+            if key not in unique:
+                unique[key] = len(order)
+                order.append(text)
+            slots.append(unique[key])
+        
+        try:
+            results = self._translate_batch(order)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), slot in zip(batch, slots):
+            future.set_result(results[slot])
+
 class TranscriptMonitor(FileSystemEventHandler):
     """
     File system event handler for monitoring transcript files.
@@ -65,11 +250,49 @@ class TranscriptMonitor(FileSystemEventHandler):
         """Initialize the transcript monitor."""
         super().__init__()
         self.processed_files: Set[str] = self._load_processed_files()
+        self._processed_lock = threading.Lock()
+        self._processed_fp = open(PROCESSED_FILES_APPEND_LOG, 'a', encoding='utf-8')
+        self._log_entries = 0
+        # (inode, mtime_ns) of recently dispatched files -> when, to drop duplicate events
+        self._inflight: Dict[Tuple[int, int], float] = {}
+        self._inflight_lock = threading.Lock()
         self.orchestrator = None
         self.tts_processor = None
+        # Failed TTS initializations so far, and when the next attempt is allowed
+        self._tts_init_failures = 0
+        self._tts_retry_at = 0.0
+        self._responses_log = _JsonlLog(RESPONSES_LOG)
+        self._metadata_log = _JsonlLog(AUDIO_METADATA_LOG)
         self._initialize_orchestrator()
         self._initialize_tts_processor()
         
+        # Transcripts flow through three stages on their own threads (orchestrator,
+        # translation + TTS, file output), so one transcript's audio is generated
+        # while the next one is with the orchestrator
+        self._queued: Set[str] = set()
+        self._queued_lock = threading.Lock()
+        # Intake is unbounded: submit() runs on the watchdog thread, which must
+        # never wait on the orchestrator stage
+        self._answer_q: queue.Queue = queue.Queue()
+        self._audio_q: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        self._output_q: queue.Queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        self._stages = [
+            threading.Thread(target=self._run_stage, args=(self._answer_q, self._audio_q, self._answer_transcript),
+                             name="TranscriptAnswer", daemon=True),
+            threading.Thread(target=self._run_stage, args=(self._audio_q, self._output_q, self._synthesize_answer),
+                             name="TranscriptAudio", daemon=True),
+            threading.Thread(target=self._run_stage, args=(self._output_q, None, self._store_answer),
+                             name="TranscriptOutput", daemon=True),
+        ]
+        for stage in self._stages:
+            stage.start()
+        # Sentences of a response are translated while the orchestrator is still
+        # generating the rest of it; translations requested close together share
+        # one request
+        self._tx_batcher = _TxBatcher(self._translate_batch_to_hindi)
+        # Playback copies are housekeeping; they do not hold up marking a transcript done
+        self._io_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix="PlaybackCopy")
+        
         logger.info("🎯 Transcript Monitor initialized")
         logger.info(f"📁 Monitoring directory: {TRANSCRIPTS_DIR}")
         logger.info(f"📱 Default phone number: {DEFAULT_PHONE}")
@@ -86,101 +309,327 @@ class TranscriptMonitor(FileSystemEventHandler):
             self.orchestrator = None
     
     def _initialize_tts_processor(self):
-        """Initialize the TTS processor with Google Cloud Translation API priority."""
+        """
+        Initialize the TTS processor with Google Cloud Translation API priority.
+        
+        After a failure, further attempts are skipped until an exponentially
+        growing delay (capped at TTS_INIT_MAX_BACKOFF seconds) has passed.
+        """
+        now = time.monotonic()
+        if now < self._tts_retry_at:
+            logger.warning(f"⏳ Next TTS Processor initialization attempt in {self._tts_retry_at - now:.0f}s")
+            return
         try:
             logger.info("🔊 Initializing TTS Processor with Google Cloud Translation API...")
-            self.tts_processor = RecordingProcessorGoogle()
+            self.tts_processor = _tts_proc()
+            self._tts_init_failures = 0
             logger.info("✅ TTS Processor initialized successfully")
             logger.info("🌍 Google Cloud Translation API will be prioritized for text translation")
         except Exception as e:
             logger.error(f"❌ Failed to initialize TTS Processor: {e}")
             self.tts_processor = None
+            self._tts_retry_at = now + min(TTS_INIT_MAX_BACKOFF, 2 ** self._tts_init_failures)
+            self._tts_init_failures += 1
     
     def _load_processed_files(self) -> Set[str]:
-        """Load the list of already processed files."""
+        """Load the already processed files from the JSON snapshot plus the append log."""
+        processed_files = set()
         try:
             if os.path.exists(PROCESSED_FILES_LOG):
-                with open(PROCESSED_FILES_LOG, 'r') as f:
-                    data = json.load(f)
-                    return set(data.get('processed_files', []))
+                data = self._read_json(PROCESSED_FILES_LOG)
+                processed_files.update(data.get('processed_files', []))
         except Exception as e:
             logger.warning(f"⚠️ Could not load processed files log: {e}")
         
-        return set()
+        try:
+            if os.path.exists(PROCESSED_FILES_APPEND_LOG):
+                with open(PROCESSED_FILES_APPEND_LOG, 'r', encoding='utf-8') as f:
+                    processed_files.update(line.rstrip('\n') for line in f if line.strip())
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load processed files append log: {e}")
+        
+        return processed_files
+    
+    def _mark_processed(self, filename: str):
+        """
+        Record a processed transcript by appending one line to the append log.
+        
+        Args:
+            filename (str): Transcript filename
+        """
+        with self._processed_lock:
+            self.processed_files.add(filename)
+            try:
+                self._processed_fp.write(f"{filename}\n")
+                self._processed_fp.flush()
+            except Exception as e:
+                logger.error(f"❌ Could not append to processed files log: {e}")
+            self._log_entries += 1
+            compact = self._log_entries >= PROCESSED_FILES_COMPACT_INTERVAL
+        if compact:
+            self._save_processed_files()
     
     def _save_processed_files(self):
-        """Save the list of processed files."""
+        """Compact the processed files into the JSON snapshot and truncate the append log."""
         try:
-            data = {
-                'processed_files': list(self.processed_files),
-                'last_updated': datetime.now().isoformat()
-            }
-            with open(PROCESSED_FILES_LOG, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._processed_lock:
+                data = {
+                    'processed_files': sorted(self.processed_files),
+                    'last_updated': datetime.now().isoformat()
+                }
+                # Replace the snapshot atomically so a crash keeps the old one plus the log
+                tmp_path = PROCESSED_FILES_LOG + '.tmp'
+                self._write_json(tmp_path, data)
+                os.replace(tmp_path, PROCESSED_FILES_LOG)
+                self._processed_fp.truncate(0)
+                self._log_entries = 0
         except Exception as e:
             logger.error(f"❌ Could not save processed files log: {e}")
     
     def on_created(self, event):
-        """Handle file creation events."""
+        """Handle file creation events (files moved in from elsewhere, or new files where closes are not reported)."""
         if not event.is_directory and event.src_path.endswith('.json'):
-            self._process_transcript_file(event.src_path)
+            # Under inotify a file still empty here is being written and is
+            # handled when its writer closes it
+            self._dispatch(event.src_path, skip_empty=INOTIFY_AVAILABLE)
     
-    def on_modified(self, event):
-        """Handle file modification events."""
+    def on_closed(self, event):
+        """Handle a writer closing a file (inotify only)."""
         if not event.is_directory and event.src_path.endswith('.json'):
-            # Only process if we haven't seen this file before
-            filename = os.path.basename(event.src_path)
-            if filename not in self.processed_files:
-                self._process_transcript_file(event.src_path)
+            self._dispatch(event.src_path, complete=True)
+    
+    def on_moved(self, event):
+        """Handle a complete file renamed into place (the atomic publish pattern)."""
+        if not event.is_directory and event.dest_path.endswith('.json'):
+            self._dispatch(event.dest_path, complete=True)
     
-    def _process_transcript_file(self, file_path: str):
+    def _dispatch(self, file_path: str, window: float = 2.0, complete: bool = False, skip_empty: bool = False):
         """
-        Process a new transcript file.
+        Process a transcript unless the same file version was dispatched recently.
         
         Args:
             file_path (str): Path to the transcript JSON file
+            window (float): Seconds during which repeat events for a file are ignored
+            complete (bool): The event shows the file has been fully written
+            skip_empty (bool): Ignore the event if the file is still empty
+        """
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return
+        if skip_empty and st.st_size == 0:
+            return
+        key = (st.st_ino, st.st_mtime_ns)
+        now = time.monotonic()
+        with self._inflight_lock:
+            if now - self._inflight.get(key, float('-inf')) < window:
+                return
+            self._inflight = {k: t for k, t in self._inflight.items() if now - t < window}
+            self._inflight[key] = now
+        self.submit(file_path, complete)
+    
+    def submit(self, file_path: str, complete: bool = False):
+        """
+        Queue a new transcript file for processing without blocking.
+        
+        Args:
+            file_path (str): Path to the transcript JSON file
+            complete (bool): The file is known to be fully written, so reading it
+                need not wait for its size to settle
         """
         filename = os.path.basename(file_path)
         
-        # Skip if already processed
+        # Skip if already processed or on its way through the pipeline
         if filename in self.processed_files:
             logger.debug(f"📄 File {filename} already processed, skipping")
             return
+        with self._queued_lock:
+            if filename in self._queued:
+                return
+            self._queued.add(filename)
         
-        logger.info(f"📄 Processing new transcript file: {filename}")
+        self._answer_q.put_nowait({"file_path": file_path, "filename": filename, "complete": complete})
+    
+    def stop(self):
+        """Let queued transcripts finish, then stop the pipeline threads."""
+        self._answer_q.put(None)
+        for stage in self._stages:
+            stage.join()
+        self._tx_batcher.stop()
+        self._io_exec.shutdown()
+        self._responses_log.close()
+        self._metadata_log.close()
+    
+    def _run_stage(self, inbox: queue.Queue, outbox: Optional[queue.Queue], handler):
+        """
+        Run one pipeline stage until the stop marker (None) arrives.
         
-        try:
-            # Wait a moment for file to be fully written
-            time.sleep(1)
-            
-            # Read and parse the transcript file
-            transcript_data = self._read_transcript_file(file_path)
-            if not transcript_data:
-                return
-            
-            # Extract translated text
-            translated_text = self._extract_translated_text(transcript_data)
-            if not translated_text:
-                logger.warning(f"⚠️ No translated text found in {filename}")
+        Args:
+            inbox (queue.Queue): Jobs for this stage
+            outbox (Optional[queue.Queue]): Next stage's queue, None for the last stage
+            handler: Called with each job; returns the job for the next stage, or
+                None when the transcript needs no further processing
+        """
+        while True:
+            job = inbox.get()
+            if job is None:
+                if outbox is not None:
+                    outbox.put(None)
                 return
             
-            # Process through orchestrator
-            response = self._process_with_orchestrator(translated_text, filename)
+            filename = job["filename"]
+            try:
+                job = handler(job)
+            except Exception as e:
+                logger.error(f"❌ Error processing {filename}: {e}")
+                job = None
             
-            # Generate audio response if orchestrator succeeded
-            if response and not self._is_error_response(response):
-                self._generate_audio_response(response, translated_text, filename)
+            if job is not None and outbox is not None:
+                outbox.put(job)
             else:
-                logger.warning("⚠️ Skipping audio generation due to orchestrator error or empty response")
+                self._release(filename)
+    
+    def _release(self, filename: str):
+        """Allow a transcript to be queued again."""
+        with self._queued_lock:
+            self._queued.discard(filename)
+    
+    def _answer_transcript(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Pipeline stage 1: read a transcript and get the orchestrator's response.
+        
+        Args:
+            job (Dict[str, Any]): Holds the transcript's file_path and filename, and whether
+                it is known to be complete
             
-            # Mark as processed
-            self.processed_files.add(filename)
-            self._save_processed_files()
+        Returns:
+            Optional[Dict[str, Any]]: The job with translated_text and response added,
+                or None if the transcript has no usable text
+        """
+        file_path, filename = job["file_path"], job["filename"]
+        logger.info(f"📄 Processing new transcript file: {filename}")
+        
+        # Wait for the file to be fully written
+        if not job["complete"] and not self._wait_for_stable_size(file_path, STABLE_SIZE_INTERVAL,
+                                                                  timeout=STABLE_SIZE_TIMEOUT):
+            logger.warning(f"⚠️ {filename} is still changing size, reading it anyway")
+        
+        # Read and parse the transcript file
+        transcript_data = self._read_transcript_file(file_path)
+        if not transcript_data:
+            return None
+        
+        # Extract translated text
+        translated_text = self._extract_translated_text(transcript_data)
+        if not translated_text:
+            logger.warning(f"⚠️ No translated text found in {filename}")
+            return None
+        
+        # Process through orchestrator, translating each sentence of the response
+        # to Hindi as soon as it has been generated
+        streamed: List[Tuple[str, Future]] = []
+        
+        def on_sentence(sentence: str):
+            streamed.append((sentence, self._tx_batcher.submit(sentence)))
+        
+        job["translated_text"] = translated_text
+        job["response"] = self._process_with_orchestrator(translated_text, filename, on_sentence)
+        job["streamed"] = streamed
+        return job
+    
+    def _synthesize_answer(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pipeline stage 2: translate the response to Hindi and generate its audio.
+        
+        Args:
+            job (Dict[str, Any]): Job from stage 1
             
-            logger.info(f"✅ Successfully processed {filename}")
+        Returns:
+            Dict[str, Any]: The job with audio set to (result, hindi_text), or to None
+                if no audio was generated
+        """
+        response = job["response"]
+        job["audio"] = None
+        
+        # Generate audio response if orchestrator succeeded
+        if response and not self._is_error_response(response):
+            job["audio"] = self._generate_audio_response(response, job["streamed"])
+        else:
+            logger.warning("⚠️ Skipping audio generation due to orchestrator error or empty response")
+        return job
+    
+    def _store_answer(self, job: Dict[str, Any]) -> None:
+        """
+        Pipeline stage 3: save the audio metadata and playback copy, and mark the
+        transcript as processed.
+        
+        Args:
+            job (Dict[str, Any]): Job from stage 2
+        """
+        filename = job["filename"]
+        if job["audio"] is not None:
+            result, hindi_text = job["audio"]
             
-        except Exception as e:
-            logger.error(f"❌ Error processing {filename}: {e}")
+            # Save additional metadata about the audio response
+            self._save_audio_metadata(result, job["response"], hindi_text, job["translated_text"], filename)
+            
+            # Copy to a more accessible location for playback
+            self._io_exec.submit(self._copy_audio_for_playback, result['audio_file'], filename)
+        
+        # Mark as processed
+        self._mark_processed(filename)
+        
+        logger.info(f"✅ Successfully processed {filename}")
+    
+    @staticmethod
+    def _wait_for_stable_size(file_path: str, interval: float = 0.05, stable_rounds: int = 2,
+                              timeout: float = 5.0) -> bool:
+        """
+        Wait until a file's size stops changing.
+        
+        Args:
+            file_path (str): Path to the file
+            interval (float): Seconds between size checks
+            stable_rounds (int): Consecutive unchanged checks required
+            timeout (float): Maximum seconds to wait
+            
+        Returns:
+            bool: True if the size was stable, False on timeout or if the file vanished
+        """
+        deadline = time.monotonic() + timeout
+        last_size = -1
+        stable = 0
+        while True:
+            try:
+                size = os.stat(file_path).st_size
+            except FileNotFoundError:
+                return False
+            stable = stable + 1 if size == last_size else 0
+            if stable >= stable_rounds:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            last_size = size
+            time.sleep(interval)
+    
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        """Parse a UTF-8 JSON file, with orjson when it is installed."""
+        if ORJSON_AVAILABLE:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    @staticmethod
+    def _write_json(path: str, data: Dict[str, Any]):
+        """Write data as indented UTF-8 JSON, encoded with orjson when it is installed."""
+        if ORJSON_AVAILABLE:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
     
     def _is_error_response(self, response: str) -> bool:
         """
@@ -195,32 +644,22 @@ class TranscriptMonitor(FileSystemEventHandler):
         if not isinstance(response, str):
             return True
         
-        response_lower = response.lower().strip()
-        error_indicators = [
-            "error:",
-            "failed",
-            "exception",
-            "unauthorized",
-            "not found",
-            "invalid",
-            "timeout"
-        ]
+        response = response.strip()
         
         # Check if response is too short (likely an error)
-        if len(response_lower) < 20:
+        if len(response) < 20:
             return True
         
-        # Check for error indicators
-        for indicator in error_indicators:
-            if indicator in response_lower:
-                return True
-        
-        return False
+        # Check for error indicators in a single pass
+        return _ERROR_INDICATOR_RE.search(response) is not None
     
     def _read_transcript_file(self, file_path: str) -> Dict[str, Any]:
         """
         Read and parse a transcript JSON file.
         
+        Only the fields _extract_translated_text uses are kept, so the rest of a
+        large transcript (e.g. word timings) is freed as soon as it is parsed.
+        
         Args:
             file_path (str): Path to the transcript file
             
@@ -228,8 +667,17 @@ class TranscriptMonitor(FileSystemEventHandler):
             Dict[str, Any]: Parsed transcript data or None if error
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            parsed = self._read_json(file_path)
+            translation = parsed.get('translation') or {}
+            transcription = parsed.get('transcription') or {}
+            data = {
+                'success': parsed.get('success', False),
+                'translation': {
+                    'success': translation.get('success', False),
+                    'translated_text': translation.get('translated_text', '')
+                },
+                'transcription': {'transcript': transcription.get('transcript', '')}
+            }
             
             logger.debug(f"📖 Successfully read transcript file: {os.path.basename(file_path)}")
             return data
@@ -282,13 +730,15 @@ class TranscriptMonitor(FileSystemEventHandler):
             logger.error(f"❌ Error extracting translated text: {e}")
             return None
     
-    def _process_with_orchestrator(self, translated_text: str, filename: str) -> str:
+    def _process_with_orchestrator(self, translated_text: str, filename: str, on_sentence=None) -> str:
         """
         Process the translated text through the orchestrator agent.
         
         Args:
             translated_text (str): The translated farmer input
             filename (str): Original filename for reference
+            on_sentence (optional): Called with each sentence of the response as it
+                is generated
             
         Returns:
             str: The orchestrator response or None if failed
@@ -308,7 +758,8 @@ class TranscriptMonitor(FileSystemEventHandler):
             # Call the orchestrator agent
             response = self.orchestrator.process_farmer_request(
                 raw_farmer_input=translated_text,
-                farmer_phone=DEFAULT_PHONE
+                farmer_phone=DEFAULT_PHONE,
+                on_sentence=on_sentence
             )
             
             # Check if the response is an error message
@@ -338,7 +789,7 @@ class TranscriptMonitor(FileSystemEventHandler):
     
     def _save_response(self, input_text: str, response: str, filename: str):
         """
-        Save the orchestrator response to a file.
+        Append the orchestrator response to the responses log.
         
         Args:
             input_text (str): Original farmer input
@@ -346,15 +797,6 @@ class TranscriptMonitor(FileSystemEventHandler):
             filename (str): Original transcript filename
         """
         try:
-            # Create responses directory if it doesn't exist
-            responses_dir = "/Users/apple/Desktop/asterisk/recordings/responses"
-            os.makedirs(responses_dir, exist_ok=True)
-            
-            # Create response filename
-            base_name = filename.replace('_transcript.json', '')
-            response_filename = f"{base_name}_response.json"
-            response_path = os.path.join(responses_dir, response_filename)
-            
             # Prepare response data
             response_data = {
                 "timestamp": datetime.now().isoformat(),
@@ -369,79 +811,123 @@ class TranscriptMonitor(FileSystemEventHandler):
             }
             
             # Save response
-            with open(response_path, 'w', encoding='utf-8') as f:
-                json.dump(response_data, f, indent=2, ensure_ascii=False)
+            self._responses_log.append(response_data)
             
-            logger.info(f"💾 Response saved to: {response_filename}")
+            logger.info(f"💾 Response for {filename} saved to: {os.path.basename(RESPONSES_LOG)}")
             
         except Exception as e:
             logger.error(f"❌ Error saving response: {e}")
     
-    def _generate_audio_response(self, response_text: str, original_input: str, filename: str):
+    def _translate_batch_to_hindi(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Translate English texts to Hindi using Google Cloud Translation API."""
+        return self.tts_processor.translate_texts(
+            texts,
+            source_lang="en",  # Orchestrator responses are in English
+            target_lang="hi"   # Translate to Hindi for the farmer
+        )
+    
+    @staticmethod
+    def _join_streamed_translations(response_text: str,
+                                    streamed: List[Tuple[str, Future]]) -> Optional[Dict[str, Any]]:
+        """
+        Assemble the Hindi response from translations of its streamed sentences.
+        
+        Args:
+            response_text (str): The orchestrator's full response
+            streamed (List[Tuple[str, Future]]): Each sentence and its translation
+            
+        Returns:
+            Optional[Dict[str, Any]]: A translation result, or None if the sentences do not
+                make up the response or any of them failed to translate
+        """
+        if not streamed or "".join(sentence for sentence, _ in streamed).strip() != response_text.strip():
+            return None
+        
+        pieces = []
+        for sentence, future in streamed:
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.warning(f"⚠️ Sentence translation failed: {e}")
+                return None
+            if not result.get('success', False):
+                return None
+            # Keep the sentence's trailing whitespace (line breaks between points)
+            pieces.append(result['translated_text'].strip() + sentence[len(sentence.rstrip()):])
+        return {
+            "translated_text": "".join(pieces).strip(),
+            "success": True,
+            "service": "streamed sentences"
+        }
+    
+    def _generate_audio_response(self, response_text: str,
+                                 streamed: List[Tuple[str, Future]] = None) -> Optional[Tuple[Dict[str, Any], str]]:
         """
         Generate audio response using TTS after translating the orchestrator's response to Hindi.
         
         Args:
             response_text (str): The orchestrator's text response (in English)
-            original_input (str): The original farmer input for context
-            filename (str): Original transcript filename for reference
+            streamed (List[Tuple[str, Future]], optional): Sentences of the response that
+                were sent for translation while it was being generated
+            
+        Returns:
+            Optional[Tuple[Dict[str, Any], str]]: The TTS result and the Hindi text
+                spoken, or None if no audio was generated
         """
         if not self.tts_processor:
             logger.error("❌ TTS Processor not available, attempting to reinitialize...")
             self._initialize_tts_processor()
             if not self.tts_processor:
                 logger.error("❌ Could not initialize TTS processor, skipping audio generation")
-                return
+                return None
         
         try:
             logger.info("🔊 Generating audio response...")
             logger.info(f"📝 English response: '{response_text[:100]}...'")
             
-            # Translate the English response to Hindi using Google Cloud Translation API
-            logger.info("🌍 Translating response to Hindi using Google Cloud Translation API...")
-            translation_result = self.tts_processor.translate_text(
-                text=response_text,
-                source_lang="en",  # Orchestrator response is in English
-                target_lang="hi"   # Translate to Hindi for the farmer
-            )
+            # Use the sentence translations made during generation when they cover the
+            # whole response; otherwise translate the response in one request
+            translation_result = self._join_streamed_translations(response_text, streamed)
+            if translation_result is None:
+                logger.info("🌍 Translating response to Hindi using Google Cloud Translation API...")
+                translation_result = self._tx_batcher.submit(response_text).result()
             
             if translation_result.get('success', False):
                 hindi_text = translation_result['translated_text']
+                text_language = "hi"
                 logger.info(f"✅ Translation successful using {translation_result.get('service', 'unknown')}")
                 logger.info(f"📝 Hindi text: '{hindi_text[:100]}...'")
             else:
                 logger.warning(f"⚠️ Translation failed: {translation_result.get('error', 'Unknown error')}")
                 logger.info("🔄 Using original English text for audio generation")
                 hindi_text = response_text
+                text_language = "en"
             
             # Generate audio in Hindi
             result = self.tts_processor.generate_multilingual_audio(
                 english_text=hindi_text,  # Now contains Hindi text (or English as fallback)
-                target_language="hi"      # Generate Hindi audio
+                target_language="hi",     # Generate Hindi audio
+                source_language=text_language  # Hindi text is spoken as is
             )
             
             if result['success']:
                 logger.info("✅ Audio response generated successfully!")
                 logger.info(f"🎵 Audio file: {result['audio_file']}")
                 logger.info(f"🌍 Language: {result['target_language']}")
-                
-                # Save additional metadata about the audio response
-                self._save_audio_metadata(result, response_text, hindi_text, original_input, filename)
-                
-                # Copy to a more accessible location for playback
-                self._copy_audio_for_playback(result['audio_file'], filename)
-                
-            else:
-                logger.error(f"❌ Failed to generate audio: {result.get('error', 'Unknown error')}")
+                return result, hindi_text
+            
+            logger.error(f"❌ Failed to generate audio: {result.get('error', 'Unknown error')}")
+            return None
                 
         except Exception as e:
             logger.error(f"❌ Error generating audio response: {e}")
             logger.exception("Full error traceback:")
+            return None
     
     def _save_audio_metadata(self, audio_result: Dict[str, Any], english_response: str, 
                            hindi_response: str, original_input: str, filename: str):
         """
-        Save metadata about the generated audio response.
+        Append metadata about the generated audio response to the audio metadata log.
         
         Args:
             audio_result (Dict[str, Any]): Result from TTS generation
@@ -451,15 +937,6 @@ class TranscriptMonitor(FileSystemEventHandler):
             filename (str): Original transcript filename
         """
         try:
-            # Create audio metadata directory
-            metadata_dir = "/Users/apple/Desktop/asterisk/recordings/audio_metadata"
-            os.makedirs(metadata_dir, exist_ok=True)
-            
-            # Create metadata filename
-            base_name = filename.replace('_transcript.json', '')
-            metadata_filename = f"{base_name}_audio_metadata.json"
-            metadata_path = os.path.join(metadata_dir, metadata_filename)
-            
             # Prepare metadata
             metadata = {
                 "timestamp": datetime.now().isoformat(),
@@ -491,10 +968,9 @@ class TranscriptMonitor(FileSystemEventHandler):
             }
             
             # Save metadata
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            self._metadata_log.append(metadata)
             
-            logger.info(f"💾 Audio metadata saved to: {metadata_filename}")
+            logger.info(f"💾 Audio metadata for {filename} saved to: {os.path.basename(AUDIO_METADATA_LOG)}")
             
         except Exception as e:
             logger.error(f"❌ Error saving audio metadata: {e}")
@@ -512,15 +988,24 @@ class TranscriptMonitor(FileSystemEventHandler):
             
             # Create playback directory
             playback_dir = "/Users/apple/Desktop/asterisk/recordings/generated_audio"
-            os.makedirs(playback_dir, exist_ok=True)
+            _ensure_dir(playback_dir)
             
             # Create playback filename
             base_name = original_filename.replace('_transcript.json', '')
             playback_filename = f"{base_name}_response.wav"
             playback_path = os.path.join(playback_dir, playback_filename)
             
-            # Copy the file
-            shutil.copy2(audio_file_path, playback_path)
+            # Hard-link the file when both directories are on the same filesystem
+            # (no bytes copied), replacing any earlier playback file of the same name
+            try:
+                os.unlink(playback_path)
+            except FileNotFoundError:
+                pass
+            try:
+                os.link(audio_file_path, playback_path)
+            except OSError:
+                # Different filesystems, or links are not supported
+                shutil.copy2(audio_file_path, playback_path)
             
             logger.info(f"🎵 Audio copied for playback: {playback_filename}")
             logger.info(f"📁 Playback location: {playback_dir}")
@@ -544,14 +1029,16 @@ def monitor_transcripts():
     logger.info("🔍 Checking for existing files...")
     monitor = TranscriptMonitor()
     
-    existing_files = [f for f in os.listdir(TRANSCRIPTS_DIR) if f.endswith('.json')]
-    logger.info(f"📄 Found {len(existing_files)} existing files")
-    
-    for filename in existing_files:
-        if filename not in monitor.processed_files:
-            file_path = os.path.join(TRANSCRIPTS_DIR, filename)
-            logger.info(f"📄 Processing existing file: {filename}")
-            monitor._process_transcript_file(file_path)
+    # Stream the directory; processed names are skipped without a stat
+    pending = 0
+    with os.scandir(TRANSCRIPTS_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json') or entry.name in monitor.processed_files:
+                continue
+            logger.info(f"📄 Processing existing file: {entry.name}")
+            monitor.submit(entry.path)
+            pending += 1
+    logger.info(f"📄 Found {pending} unprocessed existing files")
     
     # Start watching for new files
     logger.info("👀 Starting file system monitoring...")
@@ -560,20 +1047,23 @@ def monitor_transcripts():
     observer.schedule(monitor, TRANSCRIPTS_DIR, recursive=False)
     observer.start()
     
-    try:
-        logger.info("✅ Transcript Monitor is running")
-        logger.info(f"📁 Watching: {TRANSCRIPTS_DIR}")
-        logger.info("🔄 Waiting for new transcript files...")
-        logger.info("Press Ctrl+C to stop")
-        
-        while True:
-            time.sleep(1)
-            
-    except KeyboardInterrupt:
-        logger.info("🛑 Stopping Transcript Monitor...")
-        observer.stop()
+    # Sleep until Ctrl+C or SIGTERM instead of waking every second
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+    
+    logger.info("✅ Transcript Monitor is running")
+    logger.info(f"📁 Watching: {TRANSCRIPTS_DIR}")
+    logger.info("🔄 Waiting for new transcript files...")
+    logger.info("Press Ctrl+C to stop")
+    
+    stop_event.wait()
     
+    logger.info("🛑 Stopping Transcript Monitor...")
+    observer.stop()
     observer.join()
+    monitor.stop()
+    monitor._save_processed_files()
     logger.info("✅ Transcript Monitor stopped")
 
 if __name__ == "__main__":